@@ -54,12 +54,16 @@ import glob
 import signal
 import json
 import csv
-from collections import deque
+import itertools
+import bisect
+import functools
+import weakref
+from collections import deque, OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple, Union
+from typing import Optional, Dict, Any, List, Tuple, Union, Callable
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, asdict
 from abc import ABC, abstractmethod
 import queue
 
@@ -121,6 +125,99 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# 랜덤 데이터 생성
+# ============================================================================
+# 랜덤 바이트(0~255)를 영문자/숫자로 매핑하는 변환 테이블
+# 256이 62의 배수가 아니어서 일부 문자가 약간 더 자주 나오지만 부하 테스트 데이터로는 무방
+_RANDOM_ALPHABET = (string.ascii_letters + string.digits).encode('ascii')
+_RANDOM_TRANSLATE_TABLE = bytes(_RANDOM_ALPHABET[i % len(_RANDOM_ALPHABET)] for i in range(256))
+
+
+def random_ascii(length: int = 500) -> str:
+    """영문자와 숫자로 구성된 랜덤 문자열 생성
+
+    random.choices()처럼 문자마다 Python 수준 난수를 뽑지 않고,
+    os.urandom()으로 한 번에 읽은 바이트를 bytes.translate()(C 루프)로 변환합니다.
+
+    Args:
+        length: 생성할 문자열 길이
+
+    Returns:
+        영문자와 숫자로 구성된 랜덤 문자열
+    """
+    return os.urandom(length).translate(_RANDOM_TRANSLATE_TABLE).decode('ascii')
+
+
+# 스레드별로 미리 채워두는 64비트 난수 버퍼 크기 (소진 시 os.urandom 1회로 재충전)
+RANDOM_ID_BUFFER_SIZE = 4096
+_random_id_local = threading.local()
+
+
+def random_record_id(max_id: int) -> int:
+    """1 ~ max_id 범위의 랜덤 레코드 ID 반환
+
+    random.randint()는 호출마다 randrange/_randbelow를 거치는 Python 함수 호출이 여러 번 발생하므로,
+    스레드별 버퍼에 64비트 난수를 한 번에 채워 두고 하나씩 꺼내 max_id 범위로 축소합니다.
+    버퍼에는 범위와 무관한 원시 난수를 저장하므로 max_id가 바뀌어도 재생성할 필요가 없습니다.
+
+    Args:
+        max_id: 최대 ID (1 이상)
+
+    Returns:
+        1 이상 max_id 이하의 정수
+    """
+    try:
+        values = _random_id_local.values
+    except AttributeError:
+        values = _refill_random_ids()
+    # 2^64에 비해 max_id가 충분히 작으므로 나머지 연산의 편향은 무시 가능
+    for value in values:
+        return value % max_id + 1
+    return next(_refill_random_ids()) % max_id + 1
+
+
+def _refill_random_ids():
+    """현재 스레드의 난수 버퍼를 새로 채우고 그 반복자를 반환"""
+    values = iter(memoryview(os.urandom(8 * RANDOM_ID_BUFFER_SIZE)).cast('Q'))
+    _random_id_local.values = values
+    return values
+
+
+# ============================================================================
+# JDBC 바인딩용 Java 문자열 캐시
+# ============================================================================
+# 워커마다 고정인 thread_id/value_col 값과 최근 UPDATE 값을 java.lang.String으로 한 번만 변환해 재사용
+# (바인딩할 때마다 Python str → Java String 변환 및 객체 할당이 반복되는 것을 방지)
+UPDATED_VALUE_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def thread_jstrings(thread_id: str) -> Tuple[Any, Any]:
+    """워커의 thread_id와 'TEST_{thread_id}' 값을 Java String으로 변환 (워커당 1회)
+
+    Args:
+        thread_id: 워커 스레드 식별자
+
+    Returns:
+        (thread_id, value_col) java.lang.String 튜플
+    """
+    return jpype.JString(thread_id), jpype.JString(f'TEST_{thread_id}')
+
+
+@functools.lru_cache(maxsize=UPDATED_VALUE_CACHE_SIZE)
+def updated_value_jstring(record_id: int) -> Any:
+    """'UPDATED_{record_id}' 값을 Java String으로 변환 (최근 값 LRU 캐시)
+
+    Args:
+        record_id: UPDATE 대상 레코드 ID
+
+    Returns:
+        java.lang.String 값
+    """
+    return jpype.JString(f'UPDATED_{record_id}')
+
+
 # ============================================================================
 # 작업 모드 정의
 # ============================================================================
@@ -252,12 +349,28 @@ class PerformanceCounter:
         """워밍업 설정 여부 확인"""
         return self.warmup_end_time is not None
 
-    def record_transaction(self, latency_ms: float = 0):
-        """트랜잭션 완료 기록"""
+    def record_transaction(self, latency_ms: float = 0, inserts: int = 0, selects: int = 0,
+                           updates: int = 0, deletes: int = 0):
+        """트랜잭션 완료 기록
+
+        작업별 카운터도 함께 넘기면 increment_*를 따로 호출하지 않고
+        트랜잭션 카운터와 같은 락 구간에서 한 번에 갱신합니다.
+
+        Args:
+            latency_ms: 트랜잭션 레이턴시 (밀리초, 0이면 레이턴시 통계에서 제외)
+            inserts: 함께 반영할 INSERT 건수
+            selects: 함께 반영할 SELECT 건수
+            updates: 함께 반영할 UPDATE 건수
+            deletes: 함께 반영할 DELETE 건수
+        """
         current_time = time.time()
 
         with self.lock:
             self.total_transactions += 1
+            self.total_inserts += inserts
+            self.total_selects += selects
+            self.total_updates += updates
+            self.total_deletes += deletes
 
             # 워밍업 이후 통계
             if self.warmup_end_time and current_time >= self.warmup_end_time:
@@ -662,7 +775,10 @@ JDBC_DRIVERS = {
     'sqlserver': JDBCDriverInfo(
         driver_class='com.microsoft.sqlserver.jdbc.SQLServerDriver',
         jar_pattern='mssql-jdbc-*.jar',
-        url_template='jdbc:sqlserver://{host}:{port};databaseName={database}'
+        # useBulkCopyForBatchInsert: 완전히 파라미터화된 INSERT 배치를 Bulk Copy API로 전송
+        # sendStringParametersAsUnicode=false: 문자열을 VARCHAR로 바인딩 (NVARCHAR 암시적 변환 방지)
+        url_template=('jdbc:sqlserver://{host}:{port};databaseName={database};'
+                      'useBulkCopyForBatchInsert=true;sendStringParametersAsUnicode=false')
     ),
     'db2': JDBCDriverInfo(
         driver_class='com.ibm.db2.jcc.DB2Driver',
@@ -754,72 +870,221 @@ def find_jdbc_jar(db_type: str, jre_dir: str = './jre') -> Optional[str]:
     return jar_file
 
 
+# JDBC URL에 추가할 드라이버 성능 옵션
+# MySQL: 배치를 multi-row INSERT 하나로 재작성하고 서버측 PreparedStatement를 캐시
+MYSQL_URL_PARAMS = {
+    'rewriteBatchedStatements': 'true',
+    'useServerPrepStmts': 'true',
+    'cachePrepStmts': 'true',
+    'prepStmtCacheSize': '256',
+    'prepStmtCacheSqlLimit': '2048',
+}
+# PostgreSQL: 배치 INSERT를 multi-values로 재작성하고 첫 실행부터 서버측 prepare 사용
+POSTGRESQL_URL_PARAMS = {
+    'reWriteBatchedInserts': 'true',
+    'prepareThreshold': '1',
+}
+# SingleStore: MySQL과 동일하게 INSERT 배치를 multi-row INSERT 하나로 재작성
+SINGLESTORE_URL_PARAMS = {
+    'rewriteBatchedStatements': 'true',
+}
+
+
+def append_jdbc_url_params(jdbc_url: str, params: Dict[str, str]) -> str:
+    """JDBC URL에 쿼리 파라미터 추가
+
+    URL에 이미 '?'가 있으면 '&'로 이어 붙이고, 없으면 '?'로 시작합니다.
+    URL에 이미 지정된 파라미터는 사용자 설정을 우선하여 덮어쓰지 않습니다.
+
+    Args:
+        jdbc_url: 기본 JDBC URL
+        params: 추가할 파라미터 딕셔너리
+
+    Returns:
+        파라미터가 추가된 JDBC URL
+    """
+    base, _, query = jdbc_url.partition('?')
+    existing = {item.split('=', 1)[0] for item in query.split('&') if item}
+    extra = [f"{key}={value}" for key, value in params.items() if key not in existing]
+    if not extra:
+        return jdbc_url
+    separator = '&' if query else '?'
+    return jdbc_url + separator + '&'.join(extra)
+
+
+@functools.lru_cache(maxsize=32)
+def build_jdbc_url(db_type: str, host: str, port: int, database: str = '', sid: str = '') -> str:
+    """JDBC_DRIVERS의 URL 템플릿으로 접속 URL 생성 (같은 접속 정보는 캐시된 결과 재사용)
+
+    Args:
+        db_type: 데이터베이스 타입 (JDBC_DRIVERS 키)
+        host: 호스트
+        port: 포트
+        database: 데이터베이스 이름 (템플릿에 {database}가 있는 경우)
+        sid: SID (템플릿에 {sid}가 있는 경우)
+
+    Returns:
+        JDBC URL
+    """
+    return JDBC_DRIVERS[db_type].url_template.format(host=host, port=port, database=database, sid=sid)
+
+
 # ============================================================================
 # 커넥션 풀 (Connection Pool) - Enhanced with Monitoring, Leak Detection, Health Check
 # ============================================================================
-@dataclass
+# 나노초 → 초 변환 상수 (monotonic_ns 기반 시간 계산용)
+NS_PER_SECOND = 1_000_000_000
+# 나노초 → 밀리초 변환 상수 (perf_counter_ns 기반 레이턴시 계산용)
+NS_PER_MS = 1_000_000
+
+# 스레드 로컬 커넥션 캐시 크기 (스레드당)
+# 같은 스레드에서 acquire → release가 반복되는 패턴에서 공유 큐를 거치지 않도록 함
+POOL_TLS_CACHE_SIZE = 2
+
+# 유휴 커넥션 스택 최대 샤드 수 (실제 샤드 수는 min(CPU 수, max_size, 이 값))
+# 스레드마다 홈 샤드를 정해 주로 그 샤드에서 꺼내고/반환하며, 비어 있으면 다른 샤드에서 가져옴
+# Free-threaded 빌드에서는 deque마다 내부 락이 있으므로 경합이 샤드 수만큼 분산됨
+POOL_IDLE_SHARDS_MAX = 16
+
+# 활성 커넥션 추적 테이블 샤드 수 (2의 거듭제곱)
+# acquire/release와 Leak 감지가 하나의 락을 두고 경합하지 않도록 분할
+ACTIVE_CONNECTION_SHARDS = 16
+
+# Health Check 시 커넥션 병렬 검증 최대 스레드 수
+# isValid()는 네트워크 장애 시 validation_timeout까지 블록되므로 검사 시간을 합이 아닌 최대값으로 제한
+POOL_VALIDATE_MAX_WORKERS = 16
+
+# 커넥션 병렬 생성 최대 스레드 수 (Warm-up 및 min_size 보충 시)
+# 연결 수립(TCP+인증) 지연을 합이 아닌 최대값으로 줄이되, DB listener 과부하를 막기 위해 상한 적용
+POOL_CREATE_MAX_WORKERS = 16
+
+
+@dataclass(slots=True, eq=False)
 class PooledConnection:
-    """풀링된 커넥션 래퍼 - 생성 시간 및 획득 시간 추적"""
+    """풀링된 커넥션 래퍼 - 생성 시간 및 획득 시간 추적
+
+    시간 값은 time.monotonic_ns() 기준 정수(ns)로 저장합니다.
+    벽시계(wall-clock) 변경에 영향을 받지 않으며, Health Check 시
+    한 번 읽은 now_ns를 전달하여 커넥션마다 시계를 다시 읽지 않도록 합니다.
+    slots=True로 인스턴스 __dict__를 제거하여 메모리와 속성 접근 비용을 줄입니다.
+    eq=False로 객체 동일성 기반 hash를 유지하여 dict/set 키로 사용할 수 있습니다.
+    """
     connection: Any
-    created_at: float = field(default_factory=time.time)
-    acquired_at: Optional[float] = None
+    created_at_ns: int = 0
+    acquired_at_ns: Optional[int] = None
     acquired_by: Optional[str] = None
-    last_used_at: float = field(default_factory=time.time)
+    last_used_at_ns: int = 0
+
+    def __post_init__(self):
+        # 생성 시각 초기화: 시계를 한 번만 읽어 생성/마지막 사용 시각에 공용
+        if not self.created_at_ns:
+            self.created_at_ns = time.monotonic_ns()
+        if not self.last_used_at_ns:
+            self.last_used_at_ns = self.created_at_ns
 
-    def mark_acquired(self, thread_name: Optional[str] = None):
+    def mark_acquired(self, thread_name: Optional[str] = None, now_ns: Optional[int] = None):
         """커넥션 획득 시 호출
 
         Leak 감지를 위해 획득 시간 및 스레드 정보를 기록합니다.
 
         Args:
             thread_name: 커넥션을 획득한 스레드 이름 (옵션)
+            now_ns: 현재 시각 (monotonic ns, 생략 시 새로 읽음)
         """
-        self.acquired_at = time.time()
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        self.acquired_at_ns = now_ns
         self.acquired_by = thread_name or threading.current_thread().name
-        self.last_used_at = self.acquired_at
+        self.last_used_at_ns = now_ns
 
-    def mark_released(self):
+    def mark_released(self, now_ns: Optional[int] = None):
         """커넥션 반환 시 호출
 
         획득 정보를 초기화하고 마지막 사용 시간을 갱신합니다.
+
+        Args:
+            now_ns: 현재 시각 (monotonic ns, 생략 시 새로 읽음)
         """
-        self.acquired_at = None
+        self.acquired_at_ns = None
         self.acquired_by = None
-        self.last_used_at = time.time()
+        self.last_used_at_ns = time.monotonic_ns() if now_ns is None else now_ns
 
-    def get_age_seconds(self) -> float:
+    def get_age_seconds(self, now_ns: Optional[int] = None) -> float:
         """커넥션 생성 후 경과 시간 (초)
 
         Max Lifetime 검사에 사용됩니다.
 
+        Args:
+            now_ns: 현재 시각 (monotonic ns, 생략 시 새로 읽음)
+
         Returns:
             커넥션 생성 후 경과한 초
         """
-        return time.time() - self.created_at
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return (now_ns - self.created_at_ns) / NS_PER_SECOND
 
-    def get_acquired_duration_seconds(self) -> Optional[float]:
+    def get_acquired_duration_seconds(self, now_ns: Optional[int] = None) -> Optional[float]:
         """커넥션 획득 후 경과 시간 (초)
 
         Leak 감지에 사용됩니다. 임계값을 초과하면 경고를 발생시킵니다.
 
+        Args:
+            now_ns: 현재 시각 (monotonic ns, 생략 시 새로 읽음)
+
         Returns:
             획득 후 경과한 초, 미획득 상태면 None
         """
-        if self.acquired_at is None:
+        if self.acquired_at_ns is None:
             return None
-        return time.time() - self.acquired_at
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return (now_ns - self.acquired_at_ns) / NS_PER_SECOND
 
-    def get_idle_seconds(self) -> Optional[float]:
+    def get_idle_seconds(self, now_ns: Optional[int] = None) -> Optional[float]:
         """커넥션 유휴 시간 (초)
 
         유휴 커넥션 Health Check에 사용됩니다.
 
+        Args:
+            now_ns: 현재 시각 (monotonic ns, 생략 시 새로 읽음)
+
         Returns:
             유휴 시간 (초), 사용 중이면 None
         """
-        if self.acquired_at is not None:
+        if self.acquired_at_ns is not None:
             return None
-        return time.time() - self.last_used_at
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return (now_ns - self.last_used_at_ns) / NS_PER_SECOND
+
+
+class ConnectionWaiter:
+    """커넥션 대기자 - release에서 커넥션을 직접 전달받는 일회성 슬롯
+
+    풀이 가득 찬 상태에서 acquire가 등록하며, release가 큐를 거치지 않고
+    pooled_conn에 커넥션을 기록한 뒤 event를 set합니다.
+    pooled_conn이 None인 채로 깨어나면 '풀 상태가 바뀌었으니 재시도' 신호입니다.
+    """
+    __slots__ = ('event', 'pooled_conn')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.pooled_conn: Optional[PooledConnection] = None
+
+
+class PoolStatistics:
+    """커넥션 풀 누적 통계 (콜드 카운터)
+
+    acquire/release 경로에서 매번 갱신되는 _state와 분리된 별도 객체로 두어,
+    드물게 갱신되는 누적 통계가 풀 락과 경합하지 않도록 자체 락을 사용합니다.
+    """
+    __slots__ = ('lock', 'created', 'leak_warnings')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.created = 0
+        self.leak_warnings = 0
 
 
 class JDBCConnectionPool:
@@ -868,7 +1133,12 @@ class JDBCConnectionPool:
         self.leak_detection_threshold_seconds = leak_detection_threshold_seconds
         self.idle_check_interval_seconds = idle_check_interval_seconds
         self.idle_timeout_seconds = idle_timeout_seconds
-        
+
+        # 시간 임계값을 ns 정수로 미리 변환 (Health Check에서 정수 비교만 수행)
+        self._max_lifetime_ns = max_lifetime_seconds * NS_PER_SECOND
+        self._idle_timeout_ns = idle_timeout_seconds * NS_PER_SECOND
+        self._leak_threshold_ns = leak_detection_threshold_seconds * NS_PER_SECOND
+
         # 연결 속성 설정 (user/password 포함)
         self.connection_properties = connection_properties.copy() if connection_properties else {}
         self.connection_properties['user'] = user
@@ -879,25 +1149,74 @@ class JDBCConnectionPool:
             self.keepalive_time_seconds = 0
         else:
             self.keepalive_time_seconds = keepalive_time_seconds
-
-        self.pool = queue.Queue(maxsize=max_size)
-        self.current_size = 0
-        self.active_count = 0
+        self._keepalive_time_ns = self.keepalive_time_seconds * NS_PER_SECOND
+
+        # LIFO: 가장 최근 반환된(드라이버 버퍼가 따뜻하고 서버 idle timeout 위험이 낮은)
+        # 커넥션을 먼저 재사용하고, 오래된 커넥션은 바닥에 남아 idle timeout으로 정리됨
+        # deque의 append()/pop()/remove()는 GIL 하에서 원자적이므로 별도 락 없이 사용
+        # (유휴 스택 자체는 큐 뮤텍스를 잡지 않지만, 사용 중 커넥션 추적과 _state 갱신을 위해
+        #  acquire/release마다 active 샤드 락과 self.lock은 여전히 획득함)
+        # 스레드별 홈 샤드로 분할하여 여러 워커가 같은 스택 끝을 두고 경합하지 않도록 함
+        shard_count = max(1, min(os.cpu_count() or 1, max_size, POOL_IDLE_SHARDS_MAX))
+        self._idle_shards: List[deque] = [deque() for _ in range(shard_count)]
+        self._next_home_shard = itertools.count()
         self.lock = threading.Lock()
 
-        # Leak 감지용: 현재 사용 중인 커넥션 추적 (conn_id -> PooledConnection)
-        self.active_connections: Dict[int, PooledConnection] = {}
-        self.active_connections_lock = threading.Lock()
-
-        # 통계
-        self.total_created = 0
-        self.total_recycled = 0  # max_lifetime 초과로 재생성된 커넥션 수
-        self.total_leaked_warnings = 0
+        # 풀 상태 카운터: (current_size, active_count, in_flight, total_recycled)
+        # 하나의 불변 튜플로 묶어 self.lock 하에서 통째로 교체하므로,
+        # 락 없이 읽는 쪽도 속성 1회 로드로 네 값이 서로 일관된 스냅샷을 얻음
+        # (in_flight: current_size에 예약되어 있으나 아직 연결 수립 중인 커넥션 수)
+        self._state: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+        # Leak 감지용: 현재 사용 중인 커넥션 추적 (커넥션 객체 -> PooledConnection)
+        # 커넥션 객체 자체(identity 해시)를 키로 사용하여 id() 재사용 문제를 피하고,
+        # 해시 기준으로 샤드를 나누어 샤드별 락만 획득
+        self._active_shards: List[Tuple[Dict[Any, PooledConnection], threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(ACTIVE_CONNECTION_SHARDS)
+        ]
+
+        # Leak 경고를 이미 출력한 커넥션 객체 (반환/폐기 시 제거)
+        self._warned_conns: set = set()
+
+        # 직접 전달(hand-off)용 대기자 목록 (FIFO)
+        # 풀이 가득 차 대기 중인 acquire에게 release가 큐를 거치지 않고 커넥션을 넘겨줌
+        self._waiters: deque = deque()
+        self._waiters_lock = threading.Lock()
+
+        # 스레드 로컬 캐시: 같은 스레드가 반환한 커넥션을 공유 큐를 거치지 않고 재사용
+        # _tls_parked는 TLS 캐시에 보관 중인 커넥션의 소유권 표식이며,
+        # dict.pop()이 GIL 하에서 원자적이므로 소유 스레드, 대기 중인 다른 스레드,
+        # Health Check 중 먼저 pop한 쪽만 커넥션을 가져갑니다.
+        self._tls = threading.local()
+        self._tls_parked: Dict[PooledConnection, bool] = {}
+
+        # JDBC 드라이버 기능 지원 여부 캐시 (첫 커넥션에서 한 번만 확인)
+        # JPype 프록시에 대한 hasattr은 리플렉션을 거치므로 매 검증/생성마다 호출하지 않음
+        self._has_isvalid: Optional[bool] = None
+        self._has_setnettimeout: Optional[bool] = None
+
+        # 미리 생성한 java.util.Properties 및 Driver 인스턴스 (첫 커넥션 생성 후 준비)
+        # 이후 커넥션은 매번 dict → Properties 변환 없이 Driver.connect()를 직접 호출
+        # (_jdriver: None=미준비, False=사용 불가)
+        # 타입 변환기는 jaydebeapi 모듈 전역이 아닌 첫 커넥션 객체에서 가져와 재사용
+        self._jprops = None
+        self._jdriver = None
+        self._converters = None
+
+        # 네트워크 타임아웃 (ms): Oracle ReadTimeout 설정이 있으면 사용, 없으면 기본 5초
+        self._network_timeout_ms = int(self.connection_properties.get('oracle.jdbc.ReadTimeout', 5000))
+
+        # 누적 통계: 핫 경로 카운터(_state)와 분리된 별도 객체에 보관
+        # (total_recycled는 acquire/release에서 함께 갱신되므로 _state에 포함)
+        self._stats = PoolStatistics()
 
         # Health Check 스레드 관리
         self._health_check_thread: Optional[threading.Thread] = None
         self._health_check_running = False
 
+        # close_all() 호출 여부 (닫힌 풀은 재사용하지 않음)
+        self.closed = False
+
 
 
         logger.info(f"Initializing JDBC connection pool (min={min_size}, max={max_size})")
@@ -919,19 +1238,48 @@ class JDBCConnectionPool:
         """
         logger.info(f"[Pool Warm-up] Creating {self.min_size} initial connections...")
         created = 0
-        for i in range(self.min_size):
+        for pooled_conn in self._create_connections_parallel(self.min_size):
             try:
-                pooled_conn = self._create_connection_internal()
-                if pooled_conn:
-                    self.pool.put(pooled_conn)
-                    created += 1
-            except Exception as e:
-                logger.warning(f"[Pool Warm-up] Failed to create connection {i+1}: {e}")
+                self._push_idle(pooled_conn)
+                created += 1
+            except queue.Full:
+                self._close_pooled_connection(pooled_conn)
         logger.info(f"[Pool Warm-up] Completed. Created {created}/{self.min_size} connections")
 
         # Health Check 스레드 시작 (유휴 커넥션 검사 및 Leak 감지)
         self._start_health_check_thread()
 
+    def _create_connections_parallel(self, count: int) -> List[PooledConnection]:
+        """커넥션 여러 개를 병렬로 생성
+
+        연결 수립은 네트워크 왕복이 대부분이므로 동시에 수행하여
+        전체 소요 시간을 개별 생성 시간의 합이 아닌 최대값 수준으로 줄입니다.
+
+        Args:
+            count: 생성할 커넥션 수
+
+        Returns:
+            생성에 성공한 PooledConnection 리스트 (실패분은 제외)
+        """
+        if count <= 0:
+            return []
+
+        def create_one(index: int) -> Optional[PooledConnection]:
+            try:
+                return self._create_connection_internal()
+            except Exception as e:
+                logger.warning(f"[Pool] Failed to create connection {index + 1}: {e}")
+                return None
+
+        if count == 1:
+            results = [create_one(0)]
+        else:
+            max_workers = min(count, POOL_CREATE_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers,
+                                    thread_name_prefix="PoolCreate") as executor:
+                results = list(executor.map(create_one, range(count)))
+        return [pooled_conn for pooled_conn in results if pooled_conn]
+
     def _create_connection_internal(self) -> Optional[PooledConnection]:
         """
         내부용 커넥션 생성 (재시도 로직 포함)
@@ -951,41 +1299,41 @@ class JDBCConnectionPool:
         for attempt in range(max_creation_retries):
             # 커넥션 풀 용량 체크 (최대 크기 초과 시 생성 불가)
             with self.lock:
-                if self.current_size >= self.max_size:
+                size, active, in_flight, recycled = self._state
+                if size >= self.max_size:
                     return None
-                self.current_size += 1  # 생성 시도 전에 카운트 증가
+                # 생성 시도 전에 카운트 증가 (연결 수립 중으로 예약)
+                self._state = (size + 1, active, in_flight + 1, recycled)
 
             try:
                 # 커넥션 생성 (Properties에 타임아웃 등 설정 포함)
-                conn = jaydebeapi.connect(
-                    self.driver_class,
-                    self.jdbc_url,
-                    self.connection_properties,
-                    self.jar_file
-                )
+                conn = self._connect()
                 conn.jconn.setAutoCommit(False)
 
                 # 네트워크 타임아웃 명시적 설정 (JDBC 4.1+ 지원 시)
                 try:
-                    timeout_ms = 5000  # 기본 5초 타임아웃
-                    if 'oracle.jdbc.ReadTimeout' in self.connection_properties:
-                         timeout_ms = int(self.connection_properties['oracle.jdbc.ReadTimeout'])
-
-                    if hasattr(conn.jconn, 'setNetworkTimeout'):
-                         conn.jconn.setNetworkTimeout(None, timeout_ms)
+                    if self._has_setnettimeout is None:
+                        self._has_setnettimeout = hasattr(conn.jconn, 'setNetworkTimeout')
+                    if self._has_setnettimeout:
+                        conn.jconn.setNetworkTimeout(None, self._network_timeout_ms)
                 except Exception:
                     pass
 
                 # 커넥션 생성 성공: 카운터 증가 및 PooledConnection 래핑 반환
-                with self.lock:
-                    self.total_created += 1
+                self._update_state(d_in_flight=-1)
+                stats = self._stats
+                with stats.lock:
+                    stats.created += 1
+                # 동시 생성 상한으로 대기 중인 acquire가 있으면 재확인하도록 깨움
+                if self._waiters:
+                    self._handoff_to_waiter(None)
 
                 return PooledConnection(connection=conn)
 
             except Exception as e:
-                # 생성 실패: 카운터 감소
-                with self.lock:
-                    self.current_size -= 1
+                # 생성 실패: 예약 해제 및 대기자가 생성을 재시도하도록 깨움
+                self._update_state(d_size=-1, d_in_flight=-1)
+                self._handoff_to_waiter(None)
 
                 # 마지막 시도가 아닌 경우: 재시도 수행
                 if attempt < max_creation_retries - 1:
@@ -1001,10 +1349,53 @@ class JDBCConnectionPool:
                     logger.error(
                         f"[Connection Creation] Failed after {max_creation_retries} attempts (URL: {self.jdbc_url}): {e}"
                     )
-                return None
+                    return None
 
         return None
 
+    def _connect(self):
+        """JDBC 커넥션 수립
+
+        첫 커넥션은 jaydebeapi.connect()로 생성하여 드라이버 로딩과 타입 변환기를
+        초기화하고, 그때 java.util.Properties와 Driver 인스턴스를 한 번만 만들어 둡니다.
+        타입 변환기는 첫 커넥션 객체가 가진 것을 그대로 재사용합니다.
+        이후 커넥션은 미리 만든 Properties로 Driver.connect()를 직접 호출하여
+        연결마다 반복되던 dict → Properties 변환(JNI 호출)을 생략합니다.
+
+        Returns:
+            jaydebeapi Connection 객체
+        """
+        converters = self._converters
+        if not self._jdriver or converters is None:
+            conn = jaydebeapi.connect(
+                self.driver_class,
+                self.jdbc_url,
+                self.connection_properties,
+                self.jar_file
+            )
+            if self._jdriver is None:
+                try:
+                    # 첫 커넥션이 초기화한 변환기 테이블 (없으면 이후에도 jaydebeapi.connect() 사용)
+                    converters = getattr(conn, '_converters', None)
+                    if converters is None:
+                        raise AttributeError("jaydebeapi Connection has no _converters")
+                    jprops = jpype.java.util.Properties()
+                    for key, value in self.connection_properties.items():
+                        jprops.setProperty(key, value)
+                    self._jprops = jprops
+                    self._converters = converters
+                    self._jdriver = jpype.JClass(self.driver_class)()
+                except Exception as e:
+                    # 준비 실패 시 이후에도 jaydebeapi.connect() 경로 사용
+                    logger.debug("[Pool] Prebuilt JDBC properties unavailable: %s", e)
+                    self._jdriver = False
+            return conn
+
+        jconn = self._jdriver.connect(self.jdbc_url, self._jprops)
+        if jconn is None:
+            raise RuntimeError(f"JDBC driver {self.driver_class} rejected URL: {self.jdbc_url}")
+        return jaydebeapi.Connection(jconn, converters)
+
     def _create_connection(self):
         """새 커넥션 생성 (하위 호환성 유지)
 
@@ -1015,10 +1406,331 @@ class JDBCConnectionPool:
         """
         pooled_conn = self._create_connection_internal()
         if pooled_conn:
-            self.pool.put(pooled_conn)
+            self._push_idle(pooled_conn)
             return pooled_conn.connection
         return None
 
+    def _handoff_to_waiter(self, pooled_conn: Optional[PooledConnection]) -> bool:
+        """대기 중인 acquire에게 커넥션 직접 전달
+
+        가장 오래 기다린 대기자를 꺼내 커넥션을 기록하고 깨웁니다.
+        pooled_conn이 None이면 재시도 신호만 전달합니다.
+
+        Args:
+            pooled_conn: 전달할 PooledConnection (None이면 재시도 신호)
+
+        Returns:
+            대기자에게 전달했으면 True, 대기자가 없으면 False
+        """
+        if not self._waiters:
+            return False
+        with self._waiters_lock:
+            if not self._waiters:
+                return False
+            waiter = self._waiters.popleft()
+            waiter.pooled_conn = pooled_conn
+        waiter.event.set()
+        return True
+
+    def _home_shard_index(self) -> int:
+        """현재 스레드의 홈 유휴 샤드 번호
+
+        스레드가 처음 풀을 사용할 때 라운드로빈으로 배정하여 스레드 로컬에 보관합니다.
+        (스레드 ident는 정렬된 주소값이라 나머지 연산으로 분배하면 한 샤드에 몰림)
+
+        Returns:
+            홈 샤드 인덱스
+        """
+        home = getattr(self._tls, 'home_shard', None)
+        if home is None:
+            home = self._tls.home_shard = next(self._next_home_shard) % len(self._idle_shards)
+        return home
+
+    def _idle_count(self) -> int:
+        """전체 유휴 샤드에 있는 커넥션 수"""
+        return sum(len(shard) for shard in self._idle_shards)
+
+    def _idle_snapshot(self) -> List[PooledConnection]:
+        """전체 유휴 커넥션 스냅샷 (샤드별 바닥 = 가장 오래된 커넥션부터)"""
+        snapshot = []
+        for shard in self._idle_shards:
+            snapshot.extend(shard)
+        return snapshot
+
+    def _push_idle(self, pooled_conn: PooledConnection):
+        """홈 유휴 샤드 맨 위에 커넥션 적재 (락 없음)
+
+        길이 검사와 append 사이에 경합이 있을 수 있으나, 전체 커넥션 수는
+        current_size 예약으로 max_size 이내로 제한되므로 안전망 역할만 합니다.
+
+        Args:
+            pooled_conn: 적재할 PooledConnection
+
+        Raises:
+            queue.Full: 유휴 커넥션이 max_size에 도달한 경우 (호출자가 커넥션을 닫아야 함)
+        """
+        if self._idle_count() >= self.max_size:
+            raise queue.Full
+        self._idle_shards[self._home_shard_index()].append(pooled_conn)
+
+    def _return_to_pool(self, pooled_conn: PooledConnection):
+        """유휴 커넥션 반환 - 대기자가 있으면 직접 전달, 없으면 큐에 적재
+
+        Args:
+            pooled_conn: 반환할 PooledConnection
+
+        Raises:
+            queue.Full: 큐가 가득 찬 경우 (호출자가 커넥션을 닫아야 함)
+        """
+        if self._handoff_to_waiter(pooled_conn):
+            return
+        self._push_idle(pooled_conn)
+        # 큐 적재 직전에 등록된 대기자가 큐를 다시 확인하도록 깨움 (wakeup 유실 방지)
+        if self._waiters:
+            self._handoff_to_waiter(None)
+
+    @property
+    def current_size(self) -> int:
+        """현재 풀 크기 (연결 수립 중인 예약분 포함)"""
+        return self._state[0]
+
+    @property
+    def active_count(self) -> int:
+        """사용 중인 커넥션 수"""
+        return self._state[1]
+
+    @property
+    def total_recycled(self) -> int:
+        """max_lifetime 초과로 재생성된 커넥션 수"""
+        return self._state[3]
+
+    @property
+    def total_created(self) -> int:
+        """생성된 커넥션 누적 수"""
+        return self._stats.created
+
+    @property
+    def total_leaked_warnings(self) -> int:
+        """Leak 경고 누적 수"""
+        return self._stats.leak_warnings
+
+    def _update_state(self, d_size: int = 0, d_active: int = 0,
+                      d_in_flight: int = 0, d_recycled: int = 0):
+        """풀 상태 카운터 갱신
+
+        네 카운터를 새 튜플로 만들어 한 번에 교체하므로 락 없이 읽는 쪽이
+        중간 상태(예: 크기만 줄고 활성 수는 그대로인 상태)를 보지 않습니다.
+
+        Args:
+            d_size: current_size 증감량 (음수 방지)
+            d_active: active_count 증감량 (음수 방지)
+            d_in_flight: 연결 수립 중인 커넥션 수 증감량
+            d_recycled: total_recycled 증감량
+        """
+        with self.lock:
+            size, active, in_flight, recycled = self._state
+            self._state = (max(0, size + d_size), max(0, active + d_active),
+                           in_flight + d_in_flight, recycled + d_recycled)
+
+    def _can_start_creation(self) -> bool:
+        """큐가 비었을 때 새 커넥션 생성을 시작할지 여부
+
+        current_size에는 연결 수립 중인 예약분이 포함되므로, 동시 생성 수가
+        상한(POOL_CREATE_MAX_WORKERS)에 도달하면 추가 생성 대신 대기합니다.
+        DB 재기동 직후 등 다수의 acquire가 동시에 연결을 시도하는 폭주를 막습니다.
+
+        Returns:
+            새 커넥션 생성을 시작해도 되면 True
+        """
+        size, _, in_flight, _ = self._state
+        return size < self.max_size and in_flight < POOL_CREATE_MAX_WORKERS
+
+    def _try_get_idle(self) -> Optional[PooledConnection]:
+        """유휴 샤드 맨 위(가장 최근 반환)의 커넥션을 논블로킹으로 꺼내기
+
+        홈 샤드를 먼저 확인하고, 비어 있으면 다음 샤드부터 차례로 가져옵니다(work-stealing).
+        스레드마다 홈 샤드가 달라 탐색 시작 위치도 스레드별로 분산됩니다.
+        deque.pop()이 GIL 하에서 원자적이므로 락 없이 꺼내며,
+        비어 있는 샤드는 대부분 예외 없이 길이 검사로 걸러집니다.
+
+        Returns:
+            유휴 PooledConnection, 모든 샤드가 비어있으면 None
+        """
+        shards = self._idle_shards
+        home = self._home_shard_index()
+        count = len(shards)
+        for offset in range(count):
+            shard = shards[(home + offset) % count]
+            if shard:
+                try:
+                    return shard.pop()
+                except IndexError:
+                    # 검사 직후 다른 스레드가 마지막 커넥션을 가져간 경우
+                    continue
+        return None
+
+    def _wait_for_connection(self, timeout: float) -> Optional[PooledConnection]:
+        """유휴 커넥션 획득 또는 release로부터의 직접 전달 대기
+
+        큐가 비어있고 새 커넥션을 만들 수 없으면 대기자로 등록한 뒤
+        Event 하나로 잠듭니다 (주기적 폴링 없음). release/discard/커넥션 생성 완료 시에만 깨어납니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            획득한 PooledConnection.
+            새 커넥션을 생성할 수 있는 상태가 되었거나 timeout이 지나면 None
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            pooled_conn = self._try_get_idle()
+            if pooled_conn is not None:
+                return pooled_conn
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._can_start_creation():
+                return None
+
+            waiter = ConnectionWaiter()
+            with self._waiters_lock:
+                self._waiters.append(waiter)
+
+            # 등록 직후 큐 및 스레드 로컬 캐시 재확인: 등록 전에 반환된 커넥션을 놓치지 않도록
+            pooled_conn = self._try_get_idle() or self._steal_parked_connection()
+            if pooled_conn is None:
+                waiter.event.wait(remaining)
+
+            with self._waiters_lock:
+                try:
+                    self._waiters.remove(waiter)
+                    handed = None
+                except ValueError:
+                    # release가 이미 대기자를 꺼내 커넥션을 기록함
+                    handed = waiter.pooled_conn
+
+            if pooled_conn is not None:
+                if handed is not None:
+                    # 큐에서 먼저 획득한 경우 전달받은 커넥션은 다시 반환
+                    try:
+                        self._return_to_pool(handed)
+                    except queue.Full:
+                        self._close_pooled_connection(handed)
+                return pooled_conn
+            if handed is not None:
+                return handed
+            # 재시도 신호 또는 타임아웃: 루프 처음에서 큐/용량/남은 시간 재확인
+
+    def _park_in_thread_cache(self, pooled_conn: PooledConnection) -> bool:
+        """반환된 커넥션을 현재 스레드의 로컬 캐시에 보관
+
+        Args:
+            pooled_conn: 보관할 PooledConnection
+
+        Returns:
+            보관했으면 True, 캐시가 가득 찼으면 False
+        """
+        cache = getattr(self._tls, 'cache', None)
+        if cache is None:
+            cache = self._tls.cache = []
+        elif cache:
+            # 다른 스레드나 Health Check가 가져간 항목 정리
+            parked = self._tls_parked
+            cache[:] = [c for c in cache if c in parked]
+        if len(cache) >= POOL_TLS_CACHE_SIZE:
+            return False
+        self._tls_parked[pooled_conn] = True
+        cache.append(pooled_conn)
+        # 보관 직전에 등록된 대기자가 있으면 보관을 취소하고 직접 전달 (wakeup 유실 방지)
+        if self._waiters and self._tls_parked.pop(pooled_conn, False):
+            cache.pop()
+            return False
+        return True
+
+    def _take_from_thread_cache(self) -> Optional[PooledConnection]:
+        """현재 스레드의 로컬 캐시에서 커넥션 꺼내기 (LIFO)
+
+        Returns:
+            소유권을 획득한 PooledConnection, 없으면 None
+        """
+        cache = getattr(self._tls, 'cache', None)
+        while cache:
+            pooled_conn = cache.pop()
+            # 다른 스레드나 Health Check가 먼저 가져간 경우 건너뜀
+            if self._tls_parked.pop(pooled_conn, False):
+                return pooled_conn
+        return None
+
+    def _steal_parked_connection(self) -> Optional[PooledConnection]:
+        """다른 스레드의 로컬 캐시에 보관된 커넥션 가져오기
+
+        공유 큐가 비어 대기해야 하는 경우, 다른 스레드가 보관만 하고 있는
+        유휴 커넥션을 가져와 기아(starvation)를 방지합니다.
+
+        Returns:
+            소유권을 획득한 PooledConnection, 없으면 None
+        """
+        for pooled_conn in list(self._tls_parked):
+            if self._tls_parked.pop(pooled_conn, False):
+                return pooled_conn
+        return None
+
+    def _reclaim_parked_connections(self, now_ns: int):
+        """오래 사용되지 않은 스레드 로컬 캐시 커넥션을 공유 풀로 회수
+
+        종료된 워커 스레드의 캐시에 남은 커넥션이 풀에서 사라지지 않도록
+        Health Check 주기 동안 사용되지 않은 커넥션을 공유 큐로 돌려보냅니다.
+
+        Args:
+            now_ns: 현재 시각 (monotonic ns)
+        """
+        stale_ns = self.idle_check_interval_seconds * NS_PER_SECOND
+        for pooled_conn in list(self._tls_parked):
+            if now_ns - pooled_conn.last_used_at_ns <= stale_ns:
+                continue
+            if not self._tls_parked.pop(pooled_conn, False):
+                continue
+            try:
+                self._return_to_pool(pooled_conn)
+            except queue.Full:
+                self._close_pooled_connection(pooled_conn)
+
+    def _active_shard(self, conn) -> Tuple[Dict[Any, PooledConnection], threading.Lock]:
+        """커넥션이 속한 활성 커넥션 샤드 반환
+
+        기본 identity 해시는 정렬로 항상 0인 주소 하위 비트를 이미 회전해 두었으므로
+        하위 비트를 그대로 샤드 번호로 사용합니다.
+
+        Args:
+            conn: 커넥션 객체
+
+        Returns:
+            (샤드 딕셔너리, 샤드 락) 튜플
+        """
+        return self._active_shards[hash(conn) & (ACTIVE_CONNECTION_SHARDS - 1)]
+
+    def _register_acquired(self, pooled_conn: PooledConnection, thread_name: str,
+                           now_ns: Optional[int] = None):
+        """획득한 커넥션을 사용 중 상태로 기록
+
+        Leak 감지용 추적 목록 등록 및 활성 커넥션 카운트를 증가시킵니다.
+
+        Args:
+            pooled_conn: 획득한 PooledConnection
+            thread_name: 획득한 스레드 이름
+            now_ns: 획득 시각 (monotonic ns, 생략 시 새로 읽음)
+        """
+        pooled_conn.mark_acquired(thread_name, now_ns)
+
+        # Leak 감지용 추적: 현재 사용 중인 커넥션 등록
+        conn = pooled_conn.connection
+        shard, shard_lock = self._active_shard(conn)
+        with shard_lock:
+            shard[conn] = pooled_conn
+
+        # 활성 커넥션 카운트 증가
+        self._update_state(d_active=1)
+
     def _validate_connection(self, conn) -> bool:
         """커넥션 유효성 검증
 
@@ -1038,22 +1750,28 @@ class JDBCConnectionPool:
             jconn = actual_conn.jconn
             if jconn.isClosed():
                 return False
-            if hasattr(jconn, 'isValid'):
+            if self._has_isvalid is None:
+                self._has_isvalid = hasattr(jconn, 'isValid')
+            if self._has_isvalid:
                 return jconn.isValid(self.validation_timeout)
             return True
         except Exception:
             return False
 
-    def _is_connection_expired(self, pooled_conn: PooledConnection) -> bool:
+    def _is_connection_expired(self, pooled_conn: PooledConnection,
+                               now_ns: Optional[int] = None) -> bool:
         """커넥션이 max_lifetime을 초과했는지 확인
 
         Args:
             pooled_conn: 검사할 PooledConnection
+            now_ns: 현재 시각 (monotonic ns, 생략 시 새로 읽음)
 
         Returns:
             만료되었으면 True, 그렇지 않으면 False
         """
-        return pooled_conn.get_age_seconds() > self.max_lifetime_seconds
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return now_ns - pooled_conn.created_at_ns > self._max_lifetime_ns
 
     def _start_health_check_thread(self):
         """Health Check 스레드 시작
@@ -1084,119 +1802,134 @@ class JDBCConnectionPool:
                 if not self._health_check_running:
                     break
 
-                self._check_idle_connections()
+                # Leak 감지는 I/O가 없으므로 먼저 수행 (검증 지연에 밀리지 않도록)
                 self._detect_connection_leaks()
+                self._check_idle_connections()
             except Exception as e:
                 logger.error(f"[Health Check] Error: {e}")
 
+    def _claim_idle_connection(self, pooled_conn: PooledConnection) -> bool:
+        """유휴 스택에 있는 특정 커넥션 하나만 꺼내기 (동일성 기준)
+
+        PooledConnection은 동일성 비교(eq=False)만 하므로 deque.remove()가
+        Python 코드를 실행하지 않아 GIL 하에서 원자적으로 제거됩니다.
+
+        Args:
+            pooled_conn: 꺼낼 PooledConnection
+
+        Returns:
+            꺼냈으면 True, 이미 다른 스레드가 가져갔으면 False
+        """
+        for shard in self._idle_shards:
+            try:
+                shard.remove(pooled_conn)
+                return True
+            except ValueError:
+                continue
+        return False
+
     def _check_idle_connections(self):
         """유휴 커넥션 Health Check 및 정리
 
         풀의 모든 유휴 커넥션을 검사하여:
         1. Max Lifetime 초과 커넥션 재생성
         2. Idle Timeout 초과 커넥션 제거 (min_size 유지)
-        3. Keepalive 시간 초과 커넥션 유효성 검사
+        3. Keepalive 시간 초과 커넥션 유효성 검사 (최근 사용된 커넥션은 검사 생략)
         4. 무효한 커넥션 제거 및 min_size 유지를 위한 새 커넥션 생성
+
+        큐 전체를 비우지 않고 스냅샷만 떠서 락 밖에서 검사하며,
+        제거 대상 커넥션만 개별적으로 큐에서 꺼냅니다.
+        검사 도중에도 acquire/release는 큐를 그대로 사용할 수 있습니다.
         """
         # 검사 통계 카운터 초기화
         checked = 0   # 검사한 커넥션 수
         removed = 0   # 제거된 커넥션 수
         recycled = 0  # 재생성된 커넥션 수
 
-        # 유효한 커넥션을 임시 저장할 리스트
-        valid_connections = []
+        # 검사 기준 시각: 스윕 1회당 한 번만 읽음
+        now_ns = time.monotonic_ns()
 
-        try:
-            # 풀에서 모든 커넥션을 꺼내서 검사
-            while True:
-                try:
-                    # 큐에서 커넥션을 논블로킹으로 꺼냄
-                    pooled_conn = self.pool.get_nowait()
-                except queue.Empty:
-                    # 큐가 비었으면 검사 루프 종료
-                    break
+        # 스레드 로컬 캐시에 방치된 커넥션을 공유 풀로 회수하여 함께 검사
+        self._reclaim_parked_connections(now_ns)
 
-                checked += 1
+        # 유휴 스택 스냅샷 (커넥션을 꺼내지 않음): 바닥(가장 오래된 커넥션)부터 순서대로
+        snapshot = self._idle_snapshot()
 
-                # [검사 1] Max Lifetime 초과 여부 확인
-                if self._is_connection_expired(pooled_conn):
-                    # 만료된 커넥션은 닫고 새로 생성
-                    self._close_pooled_connection(pooled_conn)
-                    recycled += 1
-                    with self.lock:
-                        self.total_recycled += 1
-                    # 새 커넥션 생성하여 유효 목록에 추가
-                    new_conn = self._create_connection_internal()
-                    if new_conn:
-                        valid_connections.append(new_conn)
-                    continue
+        replacements = 0        # 새로 생성해야 할 커넥션 수 (만료/무효로 제거된 수)
+        to_validate = []        # 유효성 검사 대상
 
-                # 유휴 시간 계산
-                idle_seconds = pooled_conn.get_idle_seconds()
-
-                # [검사 2] Idle Timeout 초과 여부 확인
-                if idle_seconds is not None and self.idle_timeout_seconds > 0:
-                    with self.lock:
-                        # min_size 이상일 때만 제거 가능
-                        can_drop = self.current_size > self.min_size
-                    if can_drop and idle_seconds > self.idle_timeout_seconds:
-                        # 오래 유휴 상태인 커넥션 제거 (풀 축소)
-                        self._close_pooled_connection(pooled_conn)
-                        removed += 1
-                        continue
+        # 1단계: 만료/Idle Timeout 판정 (네트워크 I/O 없음)
+        for pooled_conn in snapshot:
+            checked += 1
 
-                # [검사 3] Keepalive 시간 초과 시 유효성 검사
-                keepalive_checked = False
-                if idle_seconds is not None and self.keepalive_time_seconds > 0:
-                    if idle_seconds > self.keepalive_time_seconds:
-                        # keepalive 시간 초과 - 유효성 검사 수행
-                        keepalive_checked = True
-                        if not self._validate_connection(pooled_conn):
-                            # 유효하지 않은 커넥션은 닫고 새로 생성
-                            self._close_pooled_connection(pooled_conn)
-                            removed += 1
-                            new_conn = self._create_connection_internal()
-                            if new_conn:
-                                valid_connections.append(new_conn)
-                            continue
-                        # 유효성 검사 통과 시 마지막 사용 시간 갱신
-                        pooled_conn.last_used_at = time.time()
+            # [검사 1] Max Lifetime 초과 여부 확인
+            if self._is_connection_expired(pooled_conn, now_ns):
+                # 이미 다른 스레드가 가져갔다면 해당 스레드의 acquire/release가 처리
+                if not self._claim_idle_connection(pooled_conn):
+                    continue
+                # 만료된 커넥션은 닫고 새로 생성
+                self._close_pooled_connection(pooled_conn)
+                recycled += 1
+                replacements += 1
+                self._update_state(d_recycled=1)
+                continue
 
-                # [검사 4] 최종 유효성 판정
-                if keepalive_checked or self._validate_connection(pooled_conn):
-                    # 유효한 커넥션은 보존
-                    valid_connections.append(pooled_conn)
-                else:
-                    # 무효한 커넥션은 제거
+            # [검사 2] Idle Timeout 초과 여부 확인
+            idle_ns = now_ns - pooled_conn.last_used_at_ns
+            if self.idle_timeout_seconds > 0 and idle_ns > self._idle_timeout_ns:
+                # min_size 이상일 때만 제거 가능
+                can_drop = self.current_size > self.min_size
+                if can_drop and self._claim_idle_connection(pooled_conn):
+                    # 오래 유휴 상태인 커넥션 제거 (풀 축소)
                     self._close_pooled_connection(pooled_conn)
                     removed += 1
+                    continue
 
-        finally:
-            # 유효한 커넥션들을 다시 풀에 반환
-            for conn in valid_connections:
-                try:
-                    self.pool.put_nowait(conn)
-                except queue.Full:
-                    # 풀이 가득 차면 커넥션 닫기
-                    self._close_pooled_connection(conn)
+            # [검사 3] Keepalive 시간 이내에 사용된 커넥션은 유효하다고 간주
+            # isValid()는 DB 왕복이므로 오래 유휴 상태인 커넥션만 검사
+            if idle_ns > self._keepalive_time_ns:
+                to_validate.append(pooled_conn)
+
+        # 2단계: [검사 3/4] 유효성 검사를 병렬로 수행 (큐에 둔 채로 - JDBC 커넥션은 스레드 안전)
+        # 소요 시간이 커넥션 수 × timeout이 아닌 ⌈N/workers⌉ × timeout으로 제한됨
+        if len(to_validate) > 1:
+            max_workers = min(len(to_validate), POOL_VALIDATE_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers,
+                                    thread_name_prefix="PoolValidate") as executor:
+                results = list(executor.map(self._validate_connection, to_validate))
+        else:
+            results = [self._validate_connection(c) for c in to_validate]
 
-        # min_size 유지: 부족한 커넥션 보충
-        while True:
-            with self.lock:
-                if self.current_size >= self.min_size:
-                    # 최소 크기 충족 시 종료
-                    break
-            # 새 커넥션 생성
-            new_conn = self._create_connection_internal()
-            if not new_conn:
-                # 생성 실패 시 종료
-                break
+        for pooled_conn, is_valid in zip(to_validate, results):
+            if not is_valid:
+                if not self._claim_idle_connection(pooled_conn):
+                    # 이미 획득된 커넥션은 사용하는 스레드가 오류를 감지하여 폐기
+                    continue
+                # 유효하지 않은 커넥션은 닫고 새로 생성
+                self._close_pooled_connection(pooled_conn)
+                removed += 1
+                replacements += 1
+                continue
+
+            # 검증 통과 시 마지막 사용 시간 갱신 (다음 Keepalive 주기까지 검사 생략)
+            if self.keepalive_time_seconds > 0:
+                pooled_conn.last_used_at_ns = now_ns
+
+        # 제거된 커넥션 대체분을 병렬로 생성
+        for new_conn in self._create_connections_parallel(replacements):
             try:
-                self.pool.put_nowait(new_conn)
+                self._return_to_pool(new_conn)
             except queue.Full:
-                # 풀이 가득 차면 커넥션 닫고 종료
                 self._close_pooled_connection(new_conn)
-                break
+
+        # min_size 유지: 부족한 커넥션을 한 번에 병렬로 보충
+        missing = self.min_size - self.current_size
+        for new_conn in self._create_connections_parallel(missing):
+            try:
+                self._return_to_pool(new_conn)
+            except queue.Full:
+                # 풀이 가득 차면 커넥션 닫기
+                self._close_pooled_connection(new_conn)
 
         # 변경사항이 있을 경우 로그 출력
         if removed > 0 or recycled > 0:
@@ -1207,30 +1940,38 @@ class JDBCConnectionPool:
 
         획득된 상태로 임계 시간을 초과한 커넥션을 탐지하여 경고 로그를 출력합니다.
         Leak된 커넥션은 자동으로 회수되지 않으며, 경고만 발생시킵니다.
+        같은 커넥션은 반환되기 전까지 한 번만 경고합니다 (매 주기 반복 경고 방지).
         """
-        # Leak 의심 커넥션 목록
+        # Leak 의심 커넥션 목록: (커넥션, 경과 초, 스레드 이름)
         leaked_connections = []
+        warned = self._warned_conns
+
+        # 검사 기준 시각: 스윕 1회당 한 번만 읽음
+        now_ns = time.monotonic_ns()
+
+        # 활성 커넥션들을 샤드별로 순회하며 Leak 여부 확인
+        # 샤드 간 일관성은 보장하지 않지만 경고 목적이므로 충분함
+        for shard, shard_lock in self._active_shards:
+            with shard_lock:
+                for conn, pooled_conn in shard.items():
+                    acquired_at_ns = pooled_conn.acquired_at_ns
+                    # 임계 시간 초과 시 Leak으로 판정 (정수 비교)
+                    if (acquired_at_ns is not None
+                            and now_ns - acquired_at_ns > self._leak_threshold_ns
+                            and conn not in warned):
+                        leaked_connections.append(
+                            (conn, (now_ns - acquired_at_ns) / NS_PER_SECOND, pooled_conn.acquired_by)
+                        )
 
-        # 활성 커넥션들을 순회하며 Leak 여부 확인
-        with self.active_connections_lock:
-            for conn_id, pooled_conn in self.active_connections.items():
-                # 커넥션이 획득된 후 경과 시간 계산
-                duration = pooled_conn.get_acquired_duration_seconds()
-                # 임계 시간 초과 시 Leak으로 판정
-                if duration and duration > self.leak_detection_threshold_seconds:
-                    leaked_connections.append({
-                        'conn_id': conn_id,
-                        'duration': duration,
-                        'thread': pooled_conn.acquired_by
-                    })
-
-        # Leak 감지된 커넥션들에 대해 경고 로그 출력
-        for leak in leaked_connections:
-            self.total_leaked_warnings += 1
+        # Leak 감지된 커넥션들에 대해 경고 로그 출력 (처음 감지된 커넥션만)
+        for conn, duration, thread_name in leaked_connections:
+            warned.add(conn)
+            # Health Check 스레드만 갱신하므로 통계 락 불필요
+            self._stats.leak_warnings += 1
             logger.warning(
-                f"[Leak Detection] Potential connection leak detected! "
-                f"Connection held for {leak['duration']:.1f}s by thread '{leak['thread']}' "
-                f"(threshold: {self.leak_detection_threshold_seconds}s)"
+                "[Leak Detection] Potential connection leak detected! "
+                "Connection held for %.1fs by thread '%s' (threshold: %ss)",
+                duration, thread_name, self.leak_detection_threshold_seconds
             )
 
     def _close_pooled_connection(self, pooled_conn: PooledConnection):
@@ -1247,43 +1988,31 @@ class JDBCConnectionPool:
             # 닫기 실패 시 무시 (이미 닫혔거나 오류 상태)
             pass
         # 풀 크기 감소 (음수 방지)
-        with self.lock:
-            self.current_size = max(0, self.current_size - 1)
+        self._update_state(d_size=-1)
+        # 풀에 여유가 생겼으므로 대기자가 새 커넥션을 생성하도록 깨움
+        self._handoff_to_waiter(None)
 
     def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        """풀 상태 조회 (Non-blocking)
+        """풀 상태 조회 (Lock-free)
 
-        모니터링 스레드가 락 대기로 멈추지 않도록 타임아웃을 적용합니다.
+        모니터링 스레드가 acquire/release와 락을 경합하지 않도록 락 없이 읽습니다.
+        크기/활성/생성 중/재생성 카운터는 _state 튜플 1회 로드로 같은 시점의 값을
+        얻으며, 나머지 누적 통계는 최종 일관성(eventually consistent)만 보장됩니다.
 
         Returns:
             pool_total, pool_active, pool_idle 등을 포함한 딕셔너리
         """
-        # 락 획득 시도 (0.1초 타임아웃) - 모니터링 스레드가 멈추지 않도록 함
-        if not self.lock.acquire(timeout=0.1):
-            # 락 획득 실패 시 현재 값을 그대로 반환 (락 없이 접근은 안전하지 않지만 멈추는 것보다 나음)
-            return {
-                'pool_total': self.current_size,
-                'pool_active': self.active_count,
-                'pool_idle': max(0, self.current_size - self.active_count),
-                'pool_total_created': self.total_created,
-                'pool_recycled': self.total_recycled,
-                'pool_leak_warnings': self.total_leaked_warnings,
-                'status': 'locked'  # 락 획득 실패 상태 표시
-            }
-
-        try:
-            # 락 획득 성공 시 정확한 풀 상태 반환
-            return {
-                'pool_total': self.current_size,
-                'pool_active': self.active_count,
-                'pool_idle': self.current_size - self.active_count,
-                'pool_total_created': self.total_created,
-                'pool_recycled': self.total_recycled,
-                'pool_leak_warnings': self.total_leaked_warnings
-            }
-        finally:
-            # 락 해제 (반드시 실행)
-            self.lock.release()
+        # 상태 스냅샷을 한 번만 읽어 필드 간 일관성 유지
+        current_size, active_count, in_flight, total_recycled = self._state
+        return {
+            'pool_total': current_size,
+            'pool_active': active_count,
+            'pool_idle': max(0, current_size - in_flight - active_count),
+            'pool_pending': in_flight,
+            'pool_total_created': self._stats.created,
+            'pool_recycled': total_recycled,
+            'pool_leak_warnings': self._stats.leak_warnings
+        }
 
     def acquire(self, timeout: int = 30):
         """
@@ -1302,109 +2031,145 @@ class JDBCConnectionPool:
         Returns:
             연결된 커넥션 객체 (성공), None (실패)
         """
-        retry_count = 0
-        max_retries = 3  # 최대 재시도 횟수
-        backoff_ms = 100  # 초기 백오프 시간 (밀리초)
         thread_name = threading.current_thread().name
 
-        while retry_count < max_retries:
-            try:
-                # 큐 대기 시간 결정:
-                # - 큐가 비어있고 풀에 여유가 있으면: 빠르게 생성 시도 (0.1초)
-                # - 그 외: 전체 타임아웃까지 대기
-                wait_time = timeout
-                if self.current_size < self.max_size and self.pool.empty():
-                     wait_time = 0.1  # 빠른 실패로 'except Empty' 분기에서 새 커넥션 생성
-
-                # 큐에서 커넥션 획득 시도
-                pooled_conn = self.pool.get(timeout=wait_time)
-
-                # 최대 수명 초과 시 재생성 (오래된 커넥션 자동 교체)
-                if self._is_connection_expired(pooled_conn):
-                    self._close_pooled_connection(pooled_conn)
-                    with self.lock:
-                        self.total_recycled += 1
-                    pooled_conn = self._create_connection_internal()
+        # 일반적인 경우(유휴 커넥션이 있고 유효함)는 짧은 fast path에서 처리
+        conn = self._acquire_fast(thread_name)
+        if conn is not None:
+            return conn
+        return self._acquire_slow(thread_name, timeout)
 
-                    if pooled_conn is None:
-                        # 새 커넥션 생성 실패: 재시도 카운트 증가 및 백오프 적용
-                        retry_count += 1
-                        time.sleep(backoff_ms / 1000.0)
-                        backoff_ms = min(backoff_ms * 2, 5000)  # 지수적 백오프
-                        continue
+    def _acquire_fast(self, thread_name: str):
+        """커넥션 획득 fast path
+
+        스레드 로컬 캐시와 공유 큐 맨 위에서 유효한 커넥션을 바로 꺼낼 수 있는
+        경우만 처리합니다. 재시도/백오프/대기 등 드문 분기는 _acquire_slow에 두어
+        자주 실행되는 경로의 바이트코드를 작게 유지합니다.
+
+        Args:
+            thread_name: 획득하는 스레드 이름
+
+        Returns:
+            연결된 커넥션 객체, 바로 획득할 수 없으면 None
+        """
+        # 스레드 로컬 캐시 우선 확인 (공유 큐 동기화 없이 재사용)
+        while True:
+            pooled_conn = self._take_from_thread_cache()
+            if pooled_conn is None:
+                break
+            now_ns = time.monotonic_ns()
+            if self._is_connection_expired(pooled_conn, now_ns):
+                # 만료된 커넥션은 폐기하고 재생성 횟수에 반영 (공유 큐 경로와 동일)
+                self._close_pooled_connection(pooled_conn)
+                self._update_state(d_recycled=1)
+                continue
+            if self._validate_connection(pooled_conn):
+                self._register_acquired(pooled_conn, thread_name, now_ns)
+                return pooled_conn.connection
+            # 무효한 커넥션은 폐기 후 다음 후보 확인
+            self._close_pooled_connection(pooled_conn)
 
-                # 커넥션 유효성 검사 (Closed 검증)
-                if self._validate_connection(pooled_conn):
-                    pooled_conn.mark_acquired(thread_name)
+        # 공유 큐 맨 위 커넥션 확인
+        pooled_conn = self._try_get_idle()
+        if pooled_conn is None:
+            return None
+        now_ns = time.monotonic_ns()
+        if self._is_connection_expired(pooled_conn, now_ns):
+            # 만료된 커넥션은 폐기하고 재생성은 slow path에 맡김
+            self._close_pooled_connection(pooled_conn)
+            self._update_state(d_recycled=1)
+            return None
+        if not self._validate_connection(pooled_conn):
+            self._close_pooled_connection(pooled_conn)
+            return None
+        self._register_acquired(pooled_conn, thread_name, now_ns)
+        return pooled_conn.connection
 
-                    # Leak 감지용 추적: 현재 사용 중인 커넥션 등록
-                    conn_id = id(pooled_conn.connection)
-                    with self.active_connections_lock:
-                        self.active_connections[conn_id] = pooled_conn
+    def _acquire_slow(self, thread_name: str, timeout: int):
+        """커넥션 획득 slow path (재시도, 생성, 대기, 백오프)
 
-                    # 활성 커넥션 카운트 증가
-                    with self.lock:
-                        self.active_count += 1
+        Args:
+            thread_name: 획득하는 스레드 이름
+            timeout: 커넥션 획득 최대 대기 시간 (초)
 
-                    return pooled_conn.connection
-                else:
-                    # 유효하지 않은 커넥션: 폐기
-                    self._close_pooled_connection(pooled_conn)
-                    # 유효성 검사 실패 시 루프에서 재시도하도록 함
-                    pass
+        Returns:
+            연결된 커넥션 객체 (성공), None (실패)
+        """
+        retry_count = 0
+        max_retries = 3  # 최대 재시도 횟수
+        backoff_ms = 100  # 초기 백오프 시간 (밀리초)
 
-            except queue.Empty:
-                # 큐가 비어있음: 새 커넥션 생성 시도
-                can_create = False
-                with self.lock:
-                    can_create = self.current_size < self.max_size
+        while retry_count < max_retries:
+            # 유휴 커넥션 확보 순서:
+            # 1) 공유 큐 맨 위  2) 다른 스레드 로컬 캐시  3) 새 커넥션 생성  4) 직접 전달 대기
+            pooled_conn = self._try_get_idle() or self._steal_parked_connection()
 
-                if can_create:
+            if pooled_conn is None:
+                if self._can_start_creation():
                     # 새 커넥션 생성 시도 (내부에서 재시도 로직 실행됨)
                     pooled_conn = self._create_connection_internal()
                     if pooled_conn:
                         # 커넥션 생성 성공: 반환
-                        pooled_conn.mark_acquired(thread_name)
-                        conn_id = id(pooled_conn.connection)
-                        with self.active_connections_lock:
-                            self.active_connections[conn_id] = pooled_conn
-                        with self.lock:
-                            self.active_count += 1
+                        self._register_acquired(pooled_conn, thread_name)
                         return pooled_conn.connection
                     # 커넥션 생성 실패: 로그 기록
                     logger.warning(
                         f"[acquire] Connection creation failed "
                         f"(attempt {retry_count + 1}/{max_retries})"
                     )
+                else:
+                    # 풀이 가득 참: release의 직접 전달(hand-off) 대기
+                    pooled_conn = self._wait_for_connection(timeout)
+
+                if pooled_conn is None:
+                    # 백오프 후 재시도 (DB 리스너 과부하 방지)
+                    if retry_count < max_retries - 1:
+                        time.sleep(backoff_ms / 1000.0)
+                        backoff_ms = min(backoff_ms * 2, 5000)  # 지수적 백오프
+                    retry_count += 1
+                    continue
+
+            # 획득 시각: 만료 검사와 획득 기록에 공용으로 사용
+            now_ns = time.monotonic_ns()
 
-                # 백오프 후 재시도 (DB 리스너 과부하 방지)
-                if retry_count < max_retries - 1:
+            # 최대 수명 초과 시 재생성 (오래된 커넥션 자동 교체)
+            if self._is_connection_expired(pooled_conn, now_ns):
+                self._close_pooled_connection(pooled_conn)
+                self._update_state(d_recycled=1)
+                pooled_conn = self._create_connection_internal()
+
+                if pooled_conn is None:
+                    # 새 커넥션 생성 실패: 재시도 카운트 증가 및 백오프 적용
+                    retry_count += 1
                     time.sleep(backoff_ms / 1000.0)
                     backoff_ms = min(backoff_ms * 2, 5000)  # 지수적 백오프
-                retry_count += 1
+                    continue
 
-        # 최대 재시도 후에도 실패: 최종 시도
-        try:
-            # 풀에서 커넥션 획득 시도 (timeout 시간 동안 대기)
-            pooled_conn = self.pool.get(timeout=timeout)
-            if pooled_conn:
-                # 커넥션 획득 성공: 획득 상태로 표시
-                pooled_conn.mark_acquired(thread_name)
-                conn_id = id(pooled_conn.connection)
-                # 활성 커넥션 목록에 추가
-                with self.active_connections_lock:
-                    self.active_connections[conn_id] = pooled_conn
-                # 활성 커넥션 수 증가
-                with self.lock:
-                    self.active_count += 1
+            # 커넥션 유효성 검사 (Closed 검증)
+            if self._validate_connection(pooled_conn):
+                self._register_acquired(pooled_conn, thread_name, now_ns)
                 return pooled_conn.connection
-        except queue.Empty:
-            # 풀이 비어있어 커넥션 획득 실패
-            logger.error(
-                f"[acquire] Failed to acquire connection after {max_retries} retries "
-                f"(queue empty)"
-            )
 
+            # 유효하지 않은 커넥션: 폐기 후 루프에서 재시도
+            self._close_pooled_connection(pooled_conn)
+
+        # 최대 재시도 후에도 실패: 최종 시도
+        # 풀에서 커넥션 획득 시도 (timeout 시간 동안 대기, 직접 전달 포함)
+        pooled_conn = self._wait_for_connection(timeout)
+        if pooled_conn is None:
+            # 대기 중 풀에 여유가 생긴 경우 마지막으로 새 커넥션 생성 시도
+            pooled_conn = self._create_connection_internal()
+
+        if pooled_conn:
+            # 커넥션 획득 성공: 획득 상태로 표시 및 활성 목록 등록
+            self._register_acquired(pooled_conn, thread_name)
+            return pooled_conn.connection
+
+        # 풀이 비어있어 커넥션 획득 실패
+        logger.error(
+            f"[acquire] Failed to acquire connection after {max_retries} retries "
+            f"(queue empty)"
+        )
         return None
 
     def release(self, conn):
@@ -1419,44 +2184,47 @@ class JDBCConnectionPool:
         if conn is None:
             return
 
-        conn_id = id(conn)
-
         # Leak 감지 추적에서 제거 및 PooledConnection 복구
-        pooled_conn = None
-        with self.active_connections_lock:
-            pooled_conn = self.active_connections.pop(conn_id, None)
+        shard, shard_lock = self._active_shard(conn)
+        with shard_lock:
+            pooled_conn = shard.pop(conn, None)
+        self._warned_conns.discard(conn)
 
-        with self.lock:
-            self.active_count = max(0, self.active_count - 1)
+        self._update_state(d_active=-1)
 
         if pooled_conn is None:
             # PooledConnection을 찾지 못한 경우 (하위 호환성 처리)
             pooled_conn = PooledConnection(connection=conn)
 
-        pooled_conn.mark_released()
+        # 반환 시각: 반환 기록과 만료 검사에 공용으로 사용
+        now_ns = time.monotonic_ns()
+        pooled_conn.mark_released(now_ns)
 
         try:
             # 최대 수명 초과 검사
-            if self._is_connection_expired(pooled_conn):
+            if self._is_connection_expired(pooled_conn, now_ns):
                 # 수명 초과된 커넥션 종료
                 self._close_pooled_connection(pooled_conn)
                 # 재활용 카운트 증가
-                with self.lock:
-                    self.total_recycled += 1
+                self._update_state(d_recycled=1)
                 # 새 커넥션 생성하여 풀에 추가
                 new_conn = self._create_connection_internal()
                 if new_conn:
-                    # 새 커넥션 생성 성공 시 풀에 즉시 추가
-                    self.pool.put_nowait(new_conn)
+                    # 새 커넥션 생성 성공 시 대기자에게 전달하거나 풀에 즉시 추가
+                    try:
+                        self._return_to_pool(new_conn)
+                    except queue.Full:
+                        self._close_pooled_connection(new_conn)
                 return
 
             # 커넥션 유효성 검사
             if self._validate_connection(pooled_conn):
-                # 풀 크기가 최대 크기 미만인 경우에만 반환
-                if self.pool.qsize() < self.max_size:
-                    # 유효한 커넥션을 풀에 반환
-                    self.pool.put_nowait(pooled_conn)
+                # 대기자가 없으면 현재 스레드의 로컬 캐시에 우선 보관
+                if not self._waiters and self._park_in_thread_cache(pooled_conn):
                     return
+                # 유효한 커넥션을 대기자에게 직접 전달하거나 풀에 반환 (가득 차면 queue.Full)
+                self._return_to_pool(pooled_conn)
+                return
 
             # 유효성 검사 실패 시 커넥션 종료
             self._close_pooled_connection(pooled_conn)
@@ -1476,22 +2244,21 @@ class JDBCConnectionPool:
         if conn is None:
             return
 
-        conn_id = id(conn)
-
         # Leak 감지 추적에서 제거
-        with self.active_connections_lock:
-            self.active_connections.pop(conn_id, None)
-
-        with self.lock:
-            self.active_count = max(0, self.active_count - 1)
+        shard, shard_lock = self._active_shard(conn)
+        with shard_lock:
+            shard.pop(conn, None)
+        self._warned_conns.discard(conn)
 
         try:
             conn.close()
         except:
             pass
 
-        with self.lock:
-            self.current_size = max(0, self.current_size - 1)
+        # 활성 카운트와 풀 크기를 한 번에 감소
+        self._update_state(d_size=-1, d_active=-1)
+        # 풀에 여유가 생겼으므로 대기자가 새 커넥션을 생성하도록 깨움
+        self._handoff_to_waiter(None)
 
     def close_all(self):
         """모든 커넥션 종료 및 풀 정리
@@ -1500,28 +2267,35 @@ class JDBCConnectionPool:
         풀과 활성 커넥션을 모두 정리합니다.
         """
         logger.info("Closing all connections in pool...")
+        self.closed = True
 
         # Health Check 스레드 중지 신호
         self._health_check_running = False
         if self._health_check_thread and self._health_check_thread.is_alive():
             self._health_check_thread.join(timeout=5)
 
-        # 풀의 모든 커넥션 종료
-        while not self.pool.empty():
-            try:
-                pooled_conn = self.pool.get_nowait()
+        # 스레드 로컬 캐시에 보관된 커넥션 종료
+        for pooled_conn in list(self._tls_parked):
+            if self._tls_parked.pop(pooled_conn, False):
                 self._close_pooled_connection(pooled_conn)
-            except:
-                pass
+
+        # 풀의 모든 커넥션 종료
+        while True:
+            pooled_conn = self._try_get_idle()
+            if pooled_conn is None:
+                break
+            self._close_pooled_connection(pooled_conn)
 
         # 활성 커넥션 정리
-        with self.active_connections_lock:
-            for conn_id, pooled_conn in list(self.active_connections.items()):
-                try:
-                    pooled_conn.connection.close()
-                except:
-                    pass
-            self.active_connections.clear()
+        for shard, shard_lock in self._active_shards:
+            with shard_lock:
+                for pooled_conn in list(shard.values()):
+                    try:
+                        pooled_conn.connection.close()
+                    except:
+                        pass
+                shard.clear()
+        self._warned_conns.clear()
 
         logger.info("All connections closed")
 
@@ -1529,6 +2303,69 @@ class JDBCConnectionPool:
 # ============================================================================
 # 데이터베이스 어댑터 인터페이스
 # ============================================================================
+# 배치 INSERT 시 executeBatch() 1회당 전송할 최대 행 수
+# 너무 크면 드라이버/서버 메모리 사용량이 커지고, 너무 작으면 왕복 횟수가 늘어남
+JDBC_BATCH_FLUSH_ROWS = 1000
+
+# java.sql.Types.BIGINT 값 (OUT 파라미터 등록용, JClass 조회 없이 사용)
+JDBC_TYPE_BIGINT = -5
+
+# java.sql.Statement.RETURN_GENERATED_KEYS 값 (자동 생성 키 반환 요청용)
+JDBC_RETURN_GENERATED_KEYS = 1
+
+# 커넥션당 캐시할 최대 PreparedStatement 수
+# 초과 시 가장 오래 사용되지 않은 Statement를 닫아 서버 측 커서/메모리가 계속 늘어나지 않도록 함
+MAX_PREPARED_STATEMENTS = 64
+
+# 최대 ID 캐시 유효 시간 (초)
+# 생성 ID를 돌려받지 않는 배치 INSERT나 DELETE로 실제 최대 ID가 바뀌어도
+# 이 주기마다 한 스레드가 MAX(ID)를 다시 조회하여 캐시를 따라가게 함
+MAX_ID_CACHE_TTL_SECONDS = 2
+
+# 커넥션 정리(롤백 등) 중 발생할 수 있는 예외 (JDBC/JPype 예외만 처리, 그 외는 전파)
+JDBC_CLEANUP_ERRORS = (jaydebeapi.Error, jpype.JException, RuntimeError, AttributeError)
+
+# 다중 행 VALUES INSERT 1문장당 최대 바인드 파라미터 수 (다중 행 INSERT를 사용하는 DB만)
+# PostgreSQL 프로토콜 한도는 32767
+# SingleStore는 문장 1개(약 1MB)가 한 번에 파싱/적재되도록 2000행(6000개)으로 제한
+# DB2는 행마다 NEXT VALUE FOR 식이 들어가 문장이 길어지므로 500행(1500개)으로 제한
+MULTI_ROW_INSERT_MAX_PARAMS = {
+    'postgresql': 32000,
+    'singlestore': 6000,
+    'db2': 1500,
+}
+
+
+class BatchInsertError(RuntimeError):
+    """commit_every 단위로 나눈 배치 INSERT가 중간에 실패한 경우의 예외
+
+    실패 이전 단위는 이미 커밋되어 롤백되지 않으므로, 그 행 수를 함께 전달하여
+    호출부가 INSERT 건수에 반영할 수 있도록 합니다. 메시지는 원인 예외와 같습니다.
+
+    Attributes:
+        committed: 실패 전까지 커밋된 레코드 수
+    """
+
+    def __init__(self, cause: Exception, committed: int):
+        super().__init__(cause)
+        self.committed = committed
+
+
+@functools.lru_cache(maxsize=64)
+def build_multi_row_insert_sql(head: str, row: str, row_count: int) -> str:
+    """다중 행 VALUES INSERT 문 생성 (행 수별로 캐시)
+
+    Args:
+        head: VALUES 앞부분 (예: "INSERT INTO t (a, b) VALUES ")
+        row: 한 행의 VALUES 절 (예: "(?, ?)")
+        row_count: 행 수
+
+    Returns:
+        head + "row, row, ..." 형태의 SQL
+    """
+    return head + ", ".join([row] * row_count)
+
+
 class DatabaseAdapter(ABC):
     """데이터베이스 공통 인터페이스
 
@@ -1536,1301 +2373,683 @@ class DatabaseAdapter(ABC):
     Oracle, PostgreSQL, MySQL, SQL Server, Tibero, DB2 등을 지원합니다.
     """
 
+    # 인스턴스 속성을 슬롯으로 고정 (__slots__를 선언하지 않은 하위 클래스는 __dict__도 함께 가짐)
+    __slots__ = ('validation_timeout', '_ps_cache', '_ps_cache_lock', '_max_id', '_max_id_lock',
+                 '_max_id_refreshed_ns', '_max_id_refresh_lock', '_pool_lock', 'relaxed_commit',
+                 'pool', '_acquire', '_release', '_discard')
+
+    # 단건 조회(PK 조회, MAX(ID)) PreparedStatement의 fetchSize (0이면 드라이버 기본값 사용)
+    # 결과가 최대 1행인 조회에서 드라이버가 여러 행 분량의 버퍼를 미리 할당하지 않도록 DB별로 지정
+    SINGLE_ROW_FETCH_SIZE = 0
+
     def __init__(self):
         """DatabaseAdapter 기본 초기화"""
         self.validation_timeout = 2
+        # 풀 메서드를 미리 바인딩해 둔 참조 (_create_pool_once에서 설정)
+        # 핫 경로에서 self.pool.acquire처럼 속성 조회를 두 번 하지 않도록 함
+        self._acquire = None
+        self._release = None
+        self._discard = None
+        # 커넥션별 PreparedStatement 캐시 (커넥션 -> OrderedDict{SQL: PreparedStatement}, LRU 순서)
+        # 같은 SQL을 매번 다시 prepare(파싱/계획)하지 않도록 커넥션 단위로 재사용하며,
+        # 커넥션 객체가 GC되면 WeakKeyDictionary에서 항목이 자동으로 제거됨
+        self._ps_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._ps_cache_lock = threading.Lock()
+        # 최대 ID 캐시 (high-water mark): INSERT로 생성된 ID로 단조 증가 갱신
+        # 0이면 미확인 상태로 보고 get_max_id가 SQL로 조회
+        self._max_id = 0
+        self._max_id_lock = threading.Lock()
+        # 마지막 MAX(ID) 조회 시각 (단조 시계 ns, 0이면 조회 필요)
+        # MAX_ID_CACHE_TTL_SECONDS가 지나면 한 스레드만 다시 조회 (나머지는 기존 값 사용)
+        self._max_id_refreshed_ns = 0
+        self._max_id_refresh_lock = threading.Lock()
+        # 커넥션 풀 생성 락 (어댑터별): 동시에 생성 요청이 와도 풀은 하나만 생성
+        self._pool_lock = threading.Lock()
+        # 완화된 커밋 사용 여부 (지원하는 DB만: Oracle COMMIT WRITE BATCH NOWAIT)
+        self.relaxed_commit = False
+
+    def _remember_max_id(self, new_id: int) -> int:
+        """생성/조회된 ID로 최대 ID 캐시 갱신 (더 큰 값일 때만)
+
+        대부분의 호출은 락 없는 비교에서 끝나고, 실제로 값이 커질 때만 락을 잡습니다.
 
-    @abstractmethod
-    def create_connection_pool(self, config: 'DatabaseConfig'):
-        """커넥션 풀 생성"""
-        pass
+        Args:
+            new_id: 새로 생성되었거나 조회된 ID
 
-    @abstractmethod
-    def get_connection(self):
-        """풀에서 커넥션 획득"""
-        pass
+        Returns:
+            전달받은 new_id (호출부에서 그대로 반환할 수 있도록)
+        """
+        if new_id > self._max_id:
+            with self._max_id_lock:
+                if new_id > self._max_id:
+                    self._max_id = new_id
+        return new_id
 
-    @abstractmethod
-    def release_connection(self, connection, is_error: bool = False):
-        """커넥션 반환 (에러 시 롤백 후 반환)"""
-        pass
+    def _max_id_is_fresh(self) -> bool:
+        """최대 ID 캐시가 채워져 있고 MAX_ID_CACHE_TTL_SECONDS 이내에 조회되었는지 여부"""
+        return (self._max_id > 0 and
+                time.monotonic_ns() - self._max_id_refreshed_ns < MAX_ID_CACHE_TTL_SECONDS * NS_PER_SECOND)
 
-    @abstractmethod
-    def discard_connection(self, connection):
-        """손상된 커넥션 폐기"""
-        pass
+    def _cached_max_id(self, cursor, sql: str) -> int:
+        """캐시된 최대 ID 반환, 캐시가 비어 있거나 만료되었으면 SQL로 다시 조회
 
-    @abstractmethod
-    def close_pool(self):
-        """커넥션 풀 종료"""
-        pass
+        만료된 경우 한 스레드만 조회하고 동시에 들어온 스레드는 기존 값을 그대로 사용합니다.
+        조회 결과로 캐시를 덮어쓰므로 DELETE로 줄어든 최대 ID와
+        생성 ID를 반환하지 않는 배치 INSERT로 늘어난 최대 ID를 모두 따라갑니다.
 
-    @abstractmethod
-    def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        """커넥션 풀 상태 조회"""
-        pass
+        Args:
+            cursor: 데이터베이스 커서
+            sql: 최대 ID를 조회하는 SQL (MAX(ID) 등)
 
-    @abstractmethod
-    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        """단일 INSERT 실행 및 생성된 ID 반환"""
-        pass
+        Returns:
+            최대 ID 값, 레코드가 없으면 0
+        """
+        if self._max_id_is_fresh():
+            return self._max_id
+        max_id = self._max_id
+        if max_id > 0:
+            # 다른 스레드가 이미 갱신 중이면 기존 값 사용
+            if not self._max_id_refresh_lock.acquire(blocking=False):
+                return max_id
+        else:
+            self._max_id_refresh_lock.acquire()
+        try:
+            # 락 대기 중 다른 스레드가 갱신했으면 다시 조회하지 않음
+            if self._max_id_is_fresh():
+                return self._max_id
+            max_id = self._query_scalar_long(cursor, sql)
+            with self._max_id_lock:
+                self._max_id = max_id
+                self._max_id_refreshed_ns = time.monotonic_ns()
+            return max_id
+        finally:
+            self._max_id_refresh_lock.release()
 
-    @abstractmethod
-    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
-        """배치 INSERT 실행 및 삽입 건수 반환"""
-        pass
+    def peek_max_id(self) -> int:
+        """DB 조회 없이 캐시된 최대 ID 반환 (만료된 캐시는 0으로 취급)
 
-    @abstractmethod
-    def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
-        """ID로 레코드 조회"""
-        pass
+        모든 워커가 같은 어댑터를 공유하므로 한 워커가 채운 캐시를 다른 워커도 그대로 사용합니다.
 
-    @abstractmethod
-    def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
-        """랜덤 레코드 조회"""
-        pass
+        Returns:
+            유효한 캐시의 최대 ID, 캐시가 비어 있거나 MAX_ID_CACHE_TTL_SECONDS가 지났으면 0
+        """
+        return self._max_id if self._max_id_is_fresh() else 0
 
-    @abstractmethod
-    def execute_update(self, cursor, record_id: int) -> bool:
-        """레코드 UPDATE 실행"""
-        pass
+    def _reset_max_id(self):
+        """최대 ID 캐시 초기화 (TRUNCATE 등으로 데이터가 삭제된 경우)"""
+        with self._max_id_lock:
+            self._max_id = 0
+            self._max_id_refreshed_ns = 0
 
-    @abstractmethod
-    def execute_delete(self, cursor, record_id: int) -> bool:
-        """레코드 DELETE 실행"""
-        pass
+    def _prepare(self, cursor, sql: str, call: bool = False, generated_keys: bool = False,
+                 fetch_size: int = 0):
+        """커서의 커넥션에 캐시된 PreparedStatement 반환 (없으면 생성)
 
-    @abstractmethod
-    def get_max_id(self, cursor) -> int:
-        """테이블의 최대 ID 조회"""
-        pass
+        커넥션은 한 번에 한 스레드만 사용하므로 커넥션별 딕셔너리 조회/추가에는
+        락이 필요 없고, 커넥션 항목을 처음 만들 때만 락을 잡습니다.
+        커넥션당 MAX_PREPARED_STATEMENTS개를 넘으면 가장 오래 사용되지 않은 Statement를 닫습니다.
 
-    @abstractmethod
-    def get_random_id(self, cursor, max_id: int) -> int:
-        """랜덤 ID 생성"""
-        pass
+        Args:
+            cursor: 데이터베이스 커서
+            sql: 파라미터 바인딩(?)을 사용하는 SQL
+            call: True면 CallableStatement(prepareCall)로 준비
+            generated_keys: True면 자동 생성 키(getGeneratedKeys)를 반환하도록 준비
+                (같은 SQL의 일반 PreparedStatement와는 별도 항목으로 캐시)
+            fetch_size: 0보다 크면 Statement 생성 시 한 번만 setFetchSize() 적용
 
-    @abstractmethod
-    def commit(self, connection):
-        """트랜잭션 커밋"""
-        pass
+        Returns:
+            java.sql.PreparedStatement (call=True면 CallableStatement)
+        """
+        conn = cursor._connection
+        statements = self._ps_cache.get(conn)
+        if statements is None:
+            with self._ps_cache_lock:
+                statements = self._ps_cache.get(conn)
+                if statements is None:
+                    statements = self._ps_cache[conn] = OrderedDict()
+        key = (sql, JDBC_RETURN_GENERATED_KEYS) if generated_keys else sql
+        ps = statements.get(key)
+        if ps is not None:
+            statements.move_to_end(key)
+        else:
+            jconn = conn.jconn
+            if call:
+                ps = jconn.prepareCall(sql)
+            elif generated_keys:
+                ps = jconn.prepareStatement(sql, JDBC_RETURN_GENERATED_KEYS)
+            else:
+                ps = jconn.prepareStatement(sql)
+            if fetch_size > 0:
+                ps.setFetchSize(fetch_size)
+            statements[key] = ps
+            if len(statements) > MAX_PREPARED_STATEMENTS:
+                _, evicted = statements.popitem(last=False)
+                try:
+                    evicted.close()
+                except JDBC_CLEANUP_ERRORS as e:
+                    logger.debug("Failed to close evicted statement: %s", e)
+        return ps
 
-    @abstractmethod
-    def rollback(self, connection):
-        """트랜잭션 롤백"""
-        pass
+    def _evict_statements(self, connection):
+        """커넥션의 캐시된 PreparedStatement 제거 및 닫기 (커넥션 폐기 시)
 
-    @abstractmethod
-    def get_ddl(self) -> str:
-        """테이블 생성 DDL 반환"""
-        pass
+        Args:
+            connection: 폐기할 커넥션
+        """
+        with self._ps_cache_lock:
+            statements = self._ps_cache.pop(connection, None)
+        if not statements:
+            return
+        for ps in statements.values():
+            try:
+                ps.close()
+            except Exception:
+                # 이미 닫힌 커넥션의 Statement는 닫기 실패 가능
+                pass
 
-    @abstractmethod
-    def setup_schema(self, connection):
-        """테스트 스키마 생성"""
-        pass
+    @staticmethod
+    def _bind_params(ps, params: List[Any], start: int = 1) -> int:
+        """PreparedStatement에 타입별 전용 setter로 파라미터 바인딩
 
-    @abstractmethod
-    def truncate_table(self, connection):
-        """테이블 데이터 삭제 (TRUNCATE)"""
-        pass
+        setObject()는 값마다 Python→Java 타입 추론을 거치고 int는 BigDecimal 경로로
+        변환되므로, str은 setString(), int는 setLong()으로 직접 바인딩합니다.
 
+        Args:
+            ps: java.sql.PreparedStatement
+            params: 바인딩할 파라미터 목록
+            start: 첫 파라미터 인덱스 (1부터 시작)
 
-# ============================================================================
-# Oracle JDBC 어댑터
-# ============================================================================
-class OracleJDBCAdapter(DatabaseAdapter):
-    """Oracle JDBC 어댑터
+        Returns:
+            다음에 바인딩할 파라미터 인덱스
+        """
+        index = start
+        for value in params:
+            value_type = type(value)
+            if value_type is str:
+                ps.setString(index, value)
+            elif value_type is int:
+                ps.setLong(index, value)
+            else:
+                # 이미 변환된 Java 객체(java.lang.String 등)는 변환 없이 그대로 전달됨
+                ps.setObject(index, value)
+            index += 1
+        return index
 
-    Oracle 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
-    SID 또는 Service Name 연결 방식을 모두 지원합니다.
-    """
+    def _create_pool_once(self, jdbc_url: str, factory: Callable[[], 'JDBCConnectionPool']) -> 'JDBCConnectionPool':
+        """같은 URL의 열린 풀이 있으면 재사용하고, 없으면 factory로 생성
 
-    def __init__(self, jre_dir: str = './jre'):
-        """OracleJDBCAdapter 초기화
+        어댑터별 락 안에서 생성하므로 같은 어댑터에 대한 동시 생성 요청은 하나의 풀을 공유하고,
+        서로 다른 어댑터(DB)의 풀 생성은 서로를 기다리지 않습니다.
 
         Args:
-            jre_dir: JDBC 드라이버 JAR 파일이 있는 디렉터리
+            jdbc_url: 생성할 풀의 JDBC URL
+            factory: JDBCConnectionPool을 생성하는 호출 가능 객체
 
-        Raises:
-            RuntimeError: Oracle JDBC 드라이버를 찾을 수 없는 경우
+        Returns:
+            어댑터의 커넥션 풀
         """
-        self.pool: Optional[JDBCConnectionPool] = None
-        jar_file = find_jdbc_jar('oracle', jre_dir)
-        if not jar_file:
-            raise RuntimeError("Oracle JDBC driver not found")
-        self.jar_file: str = jar_file
+        with self._pool_lock:
+            pool = self.pool
+            if pool is not None and not pool.closed and pool.jdbc_url == jdbc_url:
+                logger.info("Reusing existing connection pool")
+                return pool
+            pool = self.pool = factory()
+            self._acquire = pool.acquire
+            self._release = pool.release
+            self._discard = pool.discard
+            return pool
 
-    def create_connection_pool(self, config: 'DatabaseConfig'):
-        if config.service_name:
-            jdbc_url = (
-                f"jdbc:oracle:thin:@//{config.host}:{config.port or 1521}/{config.service_name}"
-            )
-        else:
-            sid = config.sid or config.database
-            if not sid:
-                raise RuntimeError('Oracle SID or service name is required')
-            jdbc_url = JDBC_DRIVERS['oracle'].url_template.format(
-                host=config.host,
-                port=config.port or 1521,
-                sid=sid
-            )
-
-        # Oracle 커넥션 속성 설정
-        connection_props = {}
-        if config.connection_timeout_seconds > 0:
-            timeout_ms = str(config.connection_timeout_seconds * 1000)
-            connection_props['oracle.net.CONNECT_TIMEOUT'] = timeout_ms
-            connection_props['oracle.jdbc.ReadTimeout'] = timeout_ms
-            logger.info(f"Setting Oracle connection timeouts to {config.connection_timeout_seconds}s")
-
-        self.pool = JDBCConnectionPool(
-            jdbc_url=jdbc_url,
-            driver_class=JDBC_DRIVERS['oracle'].driver_class,
-            jar_file=self.jar_file,
-            user=config.user,
-            password=config.password,
-            min_size=config.min_pool_size,
-            max_size=config.max_pool_size,
-            validation_timeout=config.connection_timeout_seconds, # 유효성 검사에도 타임아웃 적용
-            max_lifetime_seconds=config.max_lifetime_seconds,
-            leak_detection_threshold_seconds=config.leak_detection_threshold_seconds,
-            idle_check_interval_seconds=config.idle_check_interval_seconds,
-            idle_timeout_seconds=config.idle_timeout_seconds,
-            keepalive_time_seconds=config.keepalive_time_seconds,
-            connection_properties=connection_props
-        )
-        self.validation_timeout = config.connection_timeout_seconds
-        return self.pool
-
-    def get_connection(self):
-        # 풀이 비었거나 DB가 다운된 경우 빠르게 실패하도록 짧은 타임아웃 사용
-        # 시도당 최대 validation_timeout(3초) 대기, 최대 3회 시도 = 9초
-        if not self.pool:
-            raise RuntimeError("Connection pool not initialized")
-        conn = self.pool.acquire(timeout=self.validation_timeout if self.validation_timeout > 0 else 5)
-        if conn is None:
-             logger.debug("OracleJDBCAdapter: Failed to acquire connection from pool (Timeout/Empty)")
-        return conn
-
-    def release_connection(self, connection, is_error: bool = False):
-        if connection and self.pool:
-            try:
-                if is_error:
-                    connection.rollback()
-                self.pool.release(connection)
-            except:
-                pass
-
-    def discard_connection(self, connection):
-        if connection and self.pool:
-            self.pool.discard(connection)
-
-    def close_pool(self):
-        if self.pool:
-            self.pool.close_all()
-
-    def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        return self.pool.get_pool_stats() if self.pool else {}
-
-    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        cursor.execute("""
-            INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT)
-            VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP)
-        """, [thread_id, f'TEST_{thread_id}', random_data])
-
-        cursor.execute("SELECT LOAD_TEST_SEQ.CURRVAL FROM DUAL")
-        result = cursor.fetchone()
-        return int(result[0])
-
-    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
-        """배치 INSERT 실행"""
-        random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=500))
-
-        for _ in range(batch_size):
-            cursor.execute("""
-                INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT)
-                VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP)
-            """, [thread_id, f'TEST_{thread_id}', random_data])
-
-        return batch_size
-
-    def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
-        cursor.execute("SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?", [record_id])
-        return cursor.fetchone()
-
-    def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
-        if max_id <= 0:
-            return None
-        random_id = random.randint(1, max_id)
-        cursor.execute("SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?", [random_id])
-        return cursor.fetchone()
-
-    def execute_update(self, cursor, record_id: int) -> bool:
-        cursor.execute("""
-            UPDATE LOAD_TEST SET VALUE_COL = ?, UPDATED_AT = SYSTIMESTAMP WHERE ID = ?
-        """, [f'UPDATED_{record_id}', record_id])
-        return cursor.rowcount > 0
-
-    def execute_delete(self, cursor, record_id: int) -> bool:
-        cursor.execute("DELETE FROM LOAD_TEST WHERE ID = ?", [record_id])
-        return cursor.rowcount > 0
-
-    def get_max_id(self, cursor) -> int:
-        cursor.execute("SELECT NVL(MAX(ID), 0) FROM LOAD_TEST")
-        result = cursor.fetchone()
-        return int(result[0]) if result else 0
-
-    def get_random_id(self, cursor, max_id: int) -> int:
-        if max_id <= 0:
-            return 0
-        return random.randint(1, max_id)
-
-    def commit(self, connection):
-        connection.commit()
-
-    def rollback(self, connection):
-        try:
-            connection.rollback()
-        except:
-            pass
-
-    def get_ddl(self) -> str:
-        return """
--- Oracle DDL
-CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER;
-CREATE TABLE LOAD_TEST (
-    ID           NUMBER(19)      NOT NULL,
-    THREAD_ID    VARCHAR2(50)    NOT NULL,
-    VALUE_COL    VARCHAR2(200),
-    RANDOM_DATA  VARCHAR2(1000),
-    STATUS       VARCHAR2(20)    DEFAULT 'ACTIVE',
-    CREATED_AT   TIMESTAMP       DEFAULT SYSTIMESTAMP,
-    UPDATED_AT   TIMESTAMP       DEFAULT SYSTIMESTAMP
-)
-PARTITION BY HASH (ID) PARTITIONS 16
-TABLESPACE USERS
-ENABLE ROW MOVEMENT;
-ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID);
-CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT) LOCAL;
-"""
-
-    def setup_schema(self, connection):
-        cursor = connection.cursor()
-        try:
-            table_exists = False
-            seq_exists = False
-
-            cursor.execute("SELECT COUNT(*) FROM USER_TABLES WHERE TABLE_NAME = 'LOAD_TEST'")
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                table_exists = True
-
-            cursor.execute("SELECT COUNT(*) FROM USER_SEQUENCES WHERE SEQUENCE_NAME = 'LOAD_TEST_SEQ'")
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                seq_exists = True
-
-            if table_exists and seq_exists:
-                logger.info("Oracle schema already exists - reusing existing schema")
-                logger.info("  (DROP objects manually to recreate, or use --truncate to clear data only)")
-                return
-
-            if seq_exists:
-                try:
-                    cursor.execute("DROP SEQUENCE LOAD_TEST_SEQ")
-                except:
-                    pass
-            if table_exists:
-                try:
-                    cursor.execute("DROP TABLE LOAD_TEST PURGE")
-                except:
-                    pass
-
-            cursor.execute("CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER")
-            cursor.execute("""
-                CREATE TABLE LOAD_TEST (
-                    ID NUMBER(19) NOT NULL, THREAD_ID VARCHAR2(50) NOT NULL,
-                    VALUE_COL VARCHAR2(200), RANDOM_DATA VARCHAR2(1000),
-                    STATUS VARCHAR2(20) DEFAULT 'ACTIVE',
-                    CREATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP,
-                    UPDATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP
-                ) PARTITION BY HASH (ID) PARTITIONS 16 TABLESPACE USERS ENABLE ROW MOVEMENT
-            """)
-            cursor.execute("ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID)")
-            cursor.execute("CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT) LOCAL")
-            connection.commit()
-            logger.info("Oracle schema created successfully")
-        except Exception as e:
-            logger.error(f"Failed to setup Oracle schema: {e}")
-            raise
-        finally:
-            cursor.close()
-
-    def truncate_table(self, connection):
-        """테이블 데이터 삭제 및 시퀀스 초기화
-
-        LOAD_TEST 테이블의 모든 데이터를 삭제하고
-        LOAD_TEST_SEQ 시퀀스를 1부터 다시 시작합니다.
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        cursor = connection.cursor()
-        try:
-            cursor.execute("TRUNCATE TABLE LOAD_TEST")
-            cursor.execute("DROP SEQUENCE LOAD_TEST_SEQ")
-            cursor.execute("CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER")
-            connection.commit()
-            logger.info("Table LOAD_TEST truncated and sequence LOAD_TEST_SEQ reset to 1")
-        except Exception as e:
-            logger.error(f"Failed to truncate Oracle table: {e}")
-            raise
-        finally:
-            cursor.close()
-
-
-# ============================================================================
-# PostgreSQL JDBC 어댑터
-# ============================================================================
-class PostgreSQLJDBCAdapter(DatabaseAdapter):
-    """PostgreSQL JDBC 어댑터
-
-    PostgreSQL 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
-    BIGSERIAL 컬럼과 RETURNING 절을 사용하여 자동 증가 ID를 관리합니다.
-    """
-
-    def __init__(self, jre_dir: str = './jre'):
-        self.pool: Optional[JDBCConnectionPool] = None
-        jar_file = find_jdbc_jar('postgresql', jre_dir)
-        if not jar_file:
-            raise RuntimeError("PostgreSQL JDBC driver not found")
-        self.jar_file: str = jar_file
-
-    def create_connection_pool(self, config: 'DatabaseConfig'):
-        jdbc_url = JDBC_DRIVERS['postgresql'].url_template.format(
-            host=config.host, port=config.port or 5432, database=config.database
-        )
-        self.pool = JDBCConnectionPool(
-            jdbc_url=jdbc_url, driver_class=JDBC_DRIVERS['postgresql'].driver_class,
-            jar_file=self.jar_file, user=config.user, password=config.password,
-            min_size=config.min_pool_size, max_size=config.max_pool_size,
-            max_lifetime_seconds=config.max_lifetime_seconds,
-            leak_detection_threshold_seconds=config.leak_detection_threshold_seconds,
-            idle_check_interval_seconds=config.idle_check_interval_seconds,
-            idle_timeout_seconds=config.idle_timeout_seconds,
-            keepalive_time_seconds=config.keepalive_time_seconds
-        )
-        return self.pool
-
-    def get_connection(self):
-        if not self.pool:
-            raise RuntimeError("Connection pool not initialized")
-        return self.pool.acquire()
-
-    def release_connection(self, connection, is_error: bool = False):
-        if connection and self.pool:
-            try:
-                if is_error:
-                    connection.rollback()
-                self.pool.release(connection)
-            except:
-                pass
-
-    def discard_connection(self, connection):
-        if connection and self.pool:
-            self.pool.discard(connection)
-
-    def close_pool(self):
-        if self.pool:
-            self.pool.close_all()
-
-    def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        return self.pool.get_pool_stats() if self.pool else {}
-
-    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        cursor.execute("""
-            INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP) RETURNING id
-        """, [thread_id, f'TEST_{thread_id}', random_data])
-        result = cursor.fetchone()
-        return int(result[0])
-
-    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
-        """배치 INSERT 실행
-
-        지정된 크기만큼 INSERT 문을 반복 실행하여 대량 삽입을 수행합니다.
-
-        Args:
-            cursor: 데이터베이스 커서
-            thread_id: 워커 스레드 식별자
-            batch_size: 배치 크기 (삽입할 레코드 수)
-
-        Returns:
-            삽입된 레코드 수 (batch_size)
-        """
-        random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=500))
-        for _ in range(batch_size):
-            cursor.execute("""
-                INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """, [thread_id, f'TEST_{thread_id}', random_data])
-        return batch_size
-
-    def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
-        """단일 레코드 조회
-
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 조회할 레코드 ID
-
-        Returns:
-            조회된 레코드 튜플, 없으면 None
-        """
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [record_id])
-        return cursor.fetchone()
-
-    def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
-        """랜덤 레코드 조회
-
-        Args:
-            cursor: 데이터베이스 커서
-            max_id: 조회 가능한 최대 ID
-
-        Returns:
-            조회된 레코드 튜플, 없으면 None
-        """
-        if max_id <= 0:
-            return None
-        random_id = random.randint(1, max_id)
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [random_id])
-        return cursor.fetchone()
-
-    def execute_update(self, cursor, record_id: int) -> bool:
-        """레코드 UPDATE 실행
-
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 업데이트할 레코드 ID
-
-        Returns:
-            업데이트 성공 시 True, 실패 시 False
-        """
-        cursor.execute("UPDATE load_test SET value_col = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
-                       [f'UPDATED_{record_id}', record_id])
-        return cursor.rowcount > 0
-
-    def execute_delete(self, cursor, record_id: int) -> bool:
-        """레코드 DELETE 실행
-
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 삭제할 레코드 ID
-
-        Returns:
-            삭제 성공 시 True, 실패 시 False
-        """
-        cursor.execute("DELETE FROM load_test WHERE id = ?", [record_id])
-        return cursor.rowcount > 0
-
-    def get_max_id(self, cursor) -> int:
-        """테이블의 최대 ID 조회
-
-        Args:
-            cursor: 데이터베이스 커서
-
-        Returns:
-            최대 ID 값, 레코드가 없으면 0
-        """
-        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM load_test")
-        result = cursor.fetchone()
-        return int(result[0]) if result else 0
-
-    def get_random_id(self, cursor, max_id: int) -> int:
-        """랜덤 ID 생성
-
-        Args:
-            cursor: 데이터베이스 커서 (미사용)
-            max_id: 최대 ID 범위
-
-        Returns:
-            1과 max_id 사이의 랜덤 정수
-        """
-        return random.randint(1, max_id) if max_id > 0 else 0
-
-    def commit(self, connection):
-        """트랜잭션 커밋
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        connection.commit()
-
-    def rollback(self, connection):
-        """트랜잭션 롤백
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        try:
-            connection.rollback()
-        except:
-            pass
-
-    def get_ddl(self) -> str:
-        return """
--- PostgreSQL DDL
-CREATE TABLE load_test (
-    id BIGSERIAL PRIMARY KEY, thread_id VARCHAR(50) NOT NULL,
-    value_col VARCHAR(200), random_data VARCHAR(1000),
-    status VARCHAR(20) DEFAULT 'ACTIVE',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-) PARTITION BY HASH (id);
-"""
-
-    def setup_schema(self, connection):
-        cursor = connection.cursor()
-        try:
-            cursor.execute(
-                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = 'load_test'"
-            )
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                logger.info("PostgreSQL schema already exists - reusing existing schema")
-                logger.info("  (DROP TABLE load_test CASCADE to recreate, or use --truncate to clear data only)")
-                return
-
-            cursor.execute("""
-                CREATE TABLE load_test (
-                    id BIGSERIAL PRIMARY KEY, thread_id VARCHAR(50) NOT NULL,
-                    value_col VARCHAR(200), random_data VARCHAR(1000),
-                    status VARCHAR(20) DEFAULT 'ACTIVE',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                ) PARTITION BY HASH (id)
-            """)
-            for i in range(16):
-                cursor.execute(
-                    f"CREATE TABLE load_test_p{i:02d} PARTITION OF load_test "
-                    f"FOR VALUES WITH (MODULUS 16, REMAINDER {i})"
-                )
-            cursor.execute("CREATE INDEX idx_load_test_thread ON load_test(thread_id, created_at)")
-            connection.commit()
-            logger.info("PostgreSQL schema created successfully")
-        except Exception as e:
-            logger.error(f"Failed to setup PostgreSQL schema: {e}")
-            raise
-        finally:
-            cursor.close()
-
-    def truncate_table(self, connection):
-        """테이블 데이터 삭제 및 시퀀스 초기화
-
-        load_test 테이블의 모든 데이터를 삭제하고
-        IDENTITY 시퀀스를 1부터 다시 시작합니다.
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        cursor = connection.cursor()
-        try:
-            cursor.execute("TRUNCATE TABLE load_test RESTART IDENTITY")
-            connection.commit()
-            logger.info("Table load_test truncated and sequence reset to 1")
-        except Exception as e:
-            logger.error(f"Failed to truncate PostgreSQL table: {e}")
-            raise
-        finally:
-            cursor.close()
-
-
-# ============================================================================
-# MySQL JDBC 어댑터
-# ============================================================================
-# MySQL 커넥션 풀 크기 제한 상수
-# 이 제한은 MySQL Connector/J의 기본 설정 및 MySQL 서버의 max_connections 설정과 관련됩니다.
-# MySQL 서버의 기본 max_connections는 151이지만, 단일 애플리케이션에서 너무 많은
-# 커넥션을 사용하면 다른 클라이언트의 연결이 거부될 수 있습니다.
-# 또한 MySQL Connector/J의 경우 많은 수의 동시 커넥션에서 성능 저하가 발생할 수 있습니다.
-# 필요시 이 값을 조정할 수 있지만, MySQL 서버의 max_connections 설정도 함께 조정해야 합니다.
-# MySQL 커넥션 풀 최대 크기 제한 상수
-MYSQL_MAX_POOL_SIZE = 32
-
-
-class MySQLJDBCAdapter(DatabaseAdapter):
-    """MySQL JDBC 어댑터
-
-    Note:
-        MySQL의 커넥션 풀 크기는 MYSQL_MAX_POOL_SIZE(기본 32)로 제한됩니다.
-        이는 다음과 같은 이유로 설정되었습니다:
-        1. MySQL 서버의 기본 max_connections (151)와의 균형
-        2. MySQL Connector/J의 대규모 동시 연결 시 성능 특성
-        3. 단일 애플리케이션이 서버 리소스를 독점하는 것을 방지
-
-        더 많은 커넥션이 필요한 경우:
-        - MySQL 서버의 max_connections 설정을 증가시키세요
-        - MYSQL_MAX_POOL_SIZE 상수를 조정하세요
-    """
-
-    def __init__(self, jre_dir: str = './jre'):
-        # 커넥션 풀 초기화 (None으로 시작)
-        self.pool: Optional[JDBCConnectionPool] = None
-        # MySQL JDBC 드라이버 JAR 파일 검색
-        jar_file = find_jdbc_jar('mysql', jre_dir)
-        if not jar_file:
-            # JDBC 드라이버를 찾지 못한 경우 예외 발생
-            raise RuntimeError("MySQL JDBC driver not found")
-        self.jar_file: str = jar_file
-
-    def create_connection_pool(self, config: 'DatabaseConfig'):
-        # MySQL JDBC 연결 URL 생성 (기본 포트: 3306)
-        jdbc_url = JDBC_DRIVERS['mysql'].url_template.format(
-            host=config.host, port=config.port or 3306, database=config.database
-        )
-
-        # MySQL 커넥션 풀 크기 제한 적용 (최대 크기 초과 방지)
-        effective_min = min(config.min_pool_size, MYSQL_MAX_POOL_SIZE)
-        effective_max = min(config.max_pool_size, MYSQL_MAX_POOL_SIZE)
-
-        # 요청된 풀 크기가 제한을 초과하는 경우 경고 로그 출력
-        if config.min_pool_size > MYSQL_MAX_POOL_SIZE or config.max_pool_size > MYSQL_MAX_POOL_SIZE:
-            logger.warning(
-                f"[MySQL] Pool size limited to {MYSQL_MAX_POOL_SIZE} "
-                f"(requested: min={config.min_pool_size}, max={config.max_pool_size}). "
-                f"See MYSQL_MAX_POOL_SIZE constant for details."
-            )
-
-        # JDBC 커넥션 풀 생성 및 설정 적용
-        self.pool = JDBCConnectionPool(
-            jdbc_url=jdbc_url, driver_class=JDBC_DRIVERS['mysql'].driver_class,
-            jar_file=self.jar_file, user=config.user, password=config.password,
-            min_size=effective_min, max_size=effective_max,
-            max_lifetime_seconds=config.max_lifetime_seconds,
-            leak_detection_threshold_seconds=config.leak_detection_threshold_seconds,
-            idle_check_interval_seconds=config.idle_check_interval_seconds,
-            idle_timeout_seconds=config.idle_timeout_seconds,
-            keepalive_time_seconds=config.keepalive_time_seconds
-        )
-        return self.pool
-
-    def get_connection(self):
-        # 풀이 초기화되지 않은 경우 예외 발생
-        if not self.pool:
-            raise RuntimeError("Connection pool not initialized")
-        # 풀에서 커넥션 획득
-        return self.pool.acquire()
-
-    def release_connection(self, connection, is_error: bool = False):
-        # 커넥션과 풀이 유효한 경우에만 처리
-        if connection and self.pool:
-            try:
-                if is_error:
-                    # 에러 발생 시 트랜잭션 롤백
-                    connection.rollback()
-                # 커넥션을 풀에 반환
-                self.pool.release(connection)
-            except:
-                # 반환 중 예외 발생 시 무시
-                pass
-
-    def discard_connection(self, connection):
-        # 커넥션과 풀이 유효한 경우 커넥션 폐기
-        if connection and self.pool:
-            self.pool.discard(connection)
-
-    def close_pool(self):
-        # 풀이 존재하는 경우 모든 커넥션 종료
-        if self.pool:
-            self.pool.close_all()
-
-    def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        # 풀이 존재하면 통계 반환, 없으면 빈 딕셔너리 반환
-        return self.pool.get_pool_stats() if self.pool else {}
-
-    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        # INSERT 쿼리 실행 (NOW()로 현재 시간 삽입)
-        cursor.execute("""
-            INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-            VALUES (?, ?, ?, NOW())
-        """, [thread_id, f'TEST_{thread_id}', random_data])
-        # 방금 삽입된 행의 AUTO_INCREMENT 값 조회
-        cursor.execute("SELECT LAST_INSERT_ID()")
-        result = cursor.fetchone()
-        # 삽입된 ID 값 반환
-        return int(result[0])
-
-    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
-        """배치 INSERT 실행
+    def _rollback_quietly(self, connection) -> bool:
+        """커넥션 롤백 (이미 닫힌 커넥션은 롤백 시도 없이 실패 처리)
 
-        지정된 크기만큼 INSERT 문을 반복 실행하여 대량 삽입을 수행합니다.
+        손상된 커넥션에 rollback()을 호출하면 드라이버 예외가 생성/전파되므로
+        isClosed()로 먼저 확인하고, 실패 시에도 JDBC 관련 예외만 처리합니다.
 
         Args:
-            cursor: 데이터베이스 커서
-            thread_id: 워커 스레드 식별자
-            batch_size: 배치 크기 (삽입할 레코드 수)
+            connection: 데이터베이스 커넥션
 
         Returns:
-            삽입된 레코드 수 (batch_size)
+            롤백 성공 시 True, 커넥션이 닫혔거나 롤백 실패 시 False
         """
-        random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=500))
-        for _ in range(batch_size):
-            cursor.execute("""
-                INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-                VALUES (?, ?, ?, NOW())
-            """, [thread_id, f'TEST_{thread_id}', random_data])
-        return batch_size
+        try:
+            if connection.jconn.isClosed():
+                return False
+            connection.rollback()
+            return True
+        except JDBC_CLEANUP_ERRORS as e:
+            logger.debug("Rollback failed: %s", e)
+            return False
 
-    def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
-        """단일 레코드 조회
+    def _release_to_pool(self, connection, is_error: bool):
+        """커넥션을 풀에 반환 (에러 후 롤백에 실패한 커넥션은 반환하지 않고 폐기)
 
         Args:
-            cursor: 데이터베이스 커서
-            record_id: 조회할 레코드 ID
-
-        Returns:
-            조회된 레코드 튜플, 없으면 None
+            connection: 반환할 커넥션
+            is_error: 에러 발생 여부 (True면 롤백 후 반환)
         """
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [record_id])
-        return cursor.fetchone()
+        if is_error and not self._rollback_quietly(connection):
+            # 손상된 커넥션을 풀에 돌려보내면 다음 사용자가 같은 에러를 겪으므로 폐기
+            self.discard_connection(connection)
+            return
+        self._release(connection)
 
-    def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
-        """랜덤 레코드 조회
+    def _execute_prepared_update(self, cursor, sql: str, params: List[Any]) -> int:
+        """캐시된 PreparedStatement로 UPDATE/DELETE 실행
 
         Args:
             cursor: 데이터베이스 커서
-            max_id: 조회 가능한 최대 ID
+            sql: 파라미터 바인딩(?)을 사용하는 DML
+            params: 바인딩할 파라미터 목록
 
         Returns:
-            조회된 레코드 튜플, 없으면 None
+            영향받은 행 수
         """
-        if max_id <= 0:
-            return None
-        random_id = random.randint(1, max_id)
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [random_id])
-        return cursor.fetchone()
+        ps = self._prepare(cursor, sql)
+        self._bind_params(ps, params)
+        return ps.executeUpdate()
 
-    def execute_update(self, cursor, record_id: int) -> bool:
-        """레코드 UPDATE 실행
+    def _query_record(self, cursor, sql: str, params: List[Any]) -> Optional[tuple]:
+        """캐시된 PreparedStatement로 (id, thread_id, value_col) 한 행 조회
 
         Args:
             cursor: 데이터베이스 커서
-            record_id: 업데이트할 레코드 ID
+            sql: id, thread_id, value_col 순서로 조회하는 SELECT
+            params: 바인딩할 파라미터 목록
 
         Returns:
-            업데이트 성공 시 True, 실패 시 False
+            (id, thread_id, value_col) 튜플, 없으면 None
         """
-        cursor.execute("UPDATE load_test SET value_col = ? WHERE id = ?", [f'UPDATED_{record_id}', record_id])
-        return cursor.rowcount > 0
+        ps = self._prepare(cursor, sql, fetch_size=self.SINGLE_ROW_FETCH_SIZE)
+        self._bind_params(ps, params)
+        rs = ps.executeQuery()
+        try:
+            if not rs.next():
+                return None
+            thread_id = rs.getString(2)
+            value_col = rs.getString(3)
+            return (int(rs.getLong(1)),
+                    None if thread_id is None else str(thread_id),
+                    None if value_col is None else str(value_col))
+        finally:
+            rs.close()
 
-    def execute_delete(self, cursor, record_id: int) -> bool:
-        """레코드 DELETE 실행
+    def _query_scalar_long(self, cursor, sql: str, params: Optional[List[Any]] = None) -> int:
+        """캐시된 PreparedStatement로 첫 행의 첫 컬럼(BIGINT) 값 조회
+
+        cursor.fetchone()[0]처럼 행 튜플을 만들고 Java 값을 변환하는 대신
+        ResultSet.getLong(1)로 값을 바로 읽습니다.
 
         Args:
             cursor: 데이터베이스 커서
-            record_id: 삭제할 레코드 ID
+            sql: 정수 값 하나를 조회하는 SELECT (MAX(ID) 등)
+            params: 바인딩할 파라미터 목록
 
         Returns:
-            삭제 성공 시 True, 실패 시 False
+            조회된 값, 행이 없거나 NULL이면 0
         """
-        cursor.execute("DELETE FROM load_test WHERE id = ?", [record_id])
-        return cursor.rowcount > 0
+        ps = self._prepare(cursor, sql, fetch_size=self.SINGLE_ROW_FETCH_SIZE)
+        if params:
+            self._bind_params(ps, params)
+        rs = ps.executeQuery()
+        try:
+            # getLong()은 NULL을 0으로 반환하므로 wasNull() 확인 불필요
+            return int(rs.getLong(1)) if rs.next() else 0
+        finally:
+            rs.close()
 
-    def get_max_id(self, cursor) -> int:
-        """테이블의 최대 ID 조회
+    def _execute_jdbc_batch(self, cursor, sql: str, params: List[Any], row_count: int) -> int:
+        """JDBC PreparedStatement 배치로 동일한 INSERT를 row_count건 실행
+
+        행마다 cursor.execute()로 왕복하는 대신 문장을 한 번만 준비하고
+        addBatch()로 모아 JDBC_BATCH_FLUSH_ROWS건마다 executeBatch()를 호출합니다.
+        JDBC 파라미터 값은 addBatch() 후에도 유지되므로 모든 행이 같은 값이면
+        바인딩은 한 번만 수행하고 루프에서는 addBatch()만 호출합니다.
 
         Args:
             cursor: 데이터베이스 커서
+            sql: 파라미터 바인딩(?)을 사용하는 INSERT 문
+            params: 행마다 바인딩할 파라미터 목록
+            row_count: 삽입할 행 수
 
         Returns:
-            최대 ID 값, 레코드가 없으면 0
+            삽입한 행 수 (row_count)
         """
-        cursor.execute("SELECT IFNULL(MAX(id), 0) FROM load_test")
-        result = cursor.fetchone()
-        return int(result[0]) if result else 0
-
-    def get_random_id(self, cursor, max_id: int) -> int:
-        """랜덤 ID 생성
-
-        Args:
-            cursor: 데이터베이스 커서 (미사용)
-            max_id: 최대 ID 범위
+        ps = self._prepare(cursor, sql)
+        try:
+            # 파라미터는 루프 밖에서 한 번만 바인딩 (행마다 Python→Java 변환 없음)
+            self._bind_params(ps, params)
+            add_batch = ps.addBatch
+            remaining = row_count
+            while remaining > 0:
+                chunk = min(remaining, JDBC_BATCH_FLUSH_ROWS)
+                for _ in range(chunk):
+                    add_batch()
+                ps.executeBatch()
+                remaining -= chunk
+        except Exception:
+            # 캐시된 Statement에 미전송 배치가 남아 다음 호출에 섞이지 않도록 비움
+            try:
+                ps.clearBatch()
+            except Exception:
+                pass
+            raise
+        return row_count
 
-        Returns:
-            1과 max_id 사이의 랜덤 정수
-        """
-        return random.randint(1, max_id) if max_id > 0 else 0
+    def _execute_multi_row_insert(self, cursor, head: str, row: str, params: List[Any],
+                                  row_count: int, max_params: int) -> int:
+        """다중 행 VALUES(...), (...) INSERT로 row_count건 삽입
 
-    def commit(self, connection):
-        """트랜잭션 커밋
+        행마다 왕복하거나 드라이버 배치 재작성에 의존하는 대신 한 문장에 여러 행을 담아
+        파싱/실행 계획/왕복 비용을 문장 1회로 줄입니다. 문장당 바인드 파라미터 수가
+        max_params를 넘지 않도록 행을 나누며, 행 수별 SQL과 Statement는 캐시됩니다.
 
         Args:
-            connection: 데이터베이스 커넥션
-        """
-        connection.commit()
+            cursor: 데이터베이스 커서
+            head: VALUES 앞부분 SQL
+            row: 한 행의 VALUES 절 (params 개수만큼 ? 포함)
+            params: 행마다 바인딩할 파라미터 목록
+            row_count: 삽입할 행 수
+            max_params: 문장당 최대 바인드 파라미터 수
 
-    def rollback(self, connection):
-        """트랜잭션 롤백
+        Returns:
+            삽입한 행 수 (row_count)
+        """
+        per_row = len(params)
+        chunk_rows = max(1, min(row_count, max_params // per_row))
+        remaining = row_count
+        while remaining > 0:
+            rows = min(remaining, chunk_rows)
+            ps = self._prepare(cursor, build_multi_row_insert_sql(head, row, rows))
+            bind_params = self._bind_params
+            index = 1
+            for _ in range(rows):
+                index = bind_params(ps, params, index)
+            ps.executeUpdate()
+            remaining -= rows
+        return row_count
+
+    def _table_exists(self, connection, table_name: str) -> bool:
+        """DatabaseMetaData.getTables()로 현재 카탈로그/스키마의 테이블 존재 여부 확인
+
+        information_schema를 COUNT(*)로 조회하는 대신 드라이버의 메타데이터 API를 사용하고,
+        현재 데이터베이스/스키마로 범위를 한정하여 다른 스키마의 동명 테이블과 혼동하지 않습니다.
 
         Args:
             connection: 데이터베이스 커넥션
-        """
-        try:
-            connection.rollback()
-        except:
-            pass
-
-    def get_ddl(self) -> str:
-        """테이블 생성 DDL 반환
+            table_name: 테이블 이름 (DB의 저장 대소문자 그대로)
 
         Returns:
-            MySQL용 테이블 생성 SQL 문자열
-        """
-        return """
--- MySQL DDL
-CREATE TABLE load_test (
-    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
-    value_col VARCHAR(200), random_data VARCHAR(1000),
-    status VARCHAR(20) DEFAULT 'ACTIVE',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    PRIMARY KEY (id)
-) ENGINE=InnoDB PARTITION BY HASH(id) PARTITIONS 16;
-"""
-
-    def setup_schema(self, connection):
-        cursor = connection.cursor()
+            테이블이 있으면 True
+        """
+        jconn = connection.jconn
+        meta = jconn.getMetaData()
+        # 이름 패턴에서 '_'는 와일드카드이므로 이스케이프
+        escape = meta.getSearchStringEscape()
+        pattern = table_name.replace('_', f'{escape}_') if escape else table_name
+        # 테이블 유형은 지정하지 않음 (PostgreSQL 파티션 테이블은 'PARTITIONED TABLE'로 분류됨)
+        rs = meta.getTables(jconn.getCatalog(), jconn.getSchema(), pattern, None)
         try:
-            cursor.execute(
-                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = 'load_test'"
-            )
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                logger.info("MySQL schema already exists - reusing existing schema")
-                logger.info("  (DROP TABLE load_test to recreate, or use --truncate to clear data only)")
-                return
-
-            cursor.execute("""
-                CREATE TABLE load_test (
-                    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
-                    value_col VARCHAR(200), random_data VARCHAR(1000),
-                    status VARCHAR(20) DEFAULT 'ACTIVE',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    PRIMARY KEY (id)
-                ) ENGINE=InnoDB PARTITION BY HASH(id) PARTITIONS 16
-            """)
-            cursor.execute("CREATE INDEX idx_load_test_thread ON load_test(thread_id, created_at)")
-            connection.commit()
-            logger.info("MySQL schema created successfully")
-        except Exception as e:
-            logger.error(f"Failed to setup MySQL schema: {e}")
-            raise
+            return bool(rs.next())
         finally:
-            cursor.close()
+            rs.close()
 
-    def truncate_table(self, connection):
-        """테이블 데이터 삭제 및 AUTO_INCREMENT 초기화
+    def _execute_ddl_script(self, connection, statements: List[str]):
+        """여러 DDL 문장을 하나의 스크립트로 묶어 Statement.execute() 1회로 실행
 
-        load_test 테이블의 모든 데이터를 삭제하고
-        AUTO_INCREMENT를 1부터 다시 시작합니다.
+        문장마다 왕복하는 대신 드라이버가 다중 문장을 한 번에 전송하도록 합니다.
+        세미콜론으로 구분된 다중 문장을 지원하는 드라이버(PostgreSQL 등)에서만 사용합니다.
 
         Args:
             connection: 데이터베이스 커넥션
+            statements: 실행할 DDL 문장 목록 (끝에 세미콜론 없이)
         """
-        cursor = connection.cursor()
+        stmt = connection.jconn.createStatement()
         try:
-            cursor.execute("TRUNCATE TABLE load_test")
-            connection.commit()
-            logger.info("Table load_test truncated and AUTO_INCREMENT reset to 1")
-        except Exception as e:
-            logger.error(f"Failed to truncate MySQL table: {e}")
-            raise
+            stmt.execute(";\n".join(statements))
         finally:
-            cursor.close()
+            stmt.close()
 
+    def execute_batch_insert_committed(self, cursor, connection, thread_id: str,
+                                       batch_size: int, commit_every: int = 0) -> int:
+        """배치 INSERT를 commit_every건 단위로 나누어 실행하고 단위마다 커밋
 
-# ============================================================================
-# SQL Server JDBC 어댑터
-# ============================================================================
-class SQLServerJDBCAdapter(DatabaseAdapter):
-    """SQL Server JDBC 어댑터
+        커밋마다 발생하는 redo/WAL flush(fsync)를 여러 행에 분산시킵니다.
+        commit_every가 0 이하이거나 batch_size 이상이면 전체 배치 후 한 번만 커밋합니다.
 
-    Microsoft SQL Server 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
-    IDENTITY 컬럼과 SCOPE_IDENTITY() 함수를 사용하여 자동 증가 ID를 관리합니다.
-    """
+        Args:
+            cursor: 데이터베이스 커서
+            connection: 데이터베이스 커넥션
+            thread_id: 스레드 식별자
+            batch_size: 삽입할 전체 레코드 수
+            commit_every: 커밋 단위 행 수 (0이면 배치당 1회)
 
-    def __init__(self, jre_dir: str = './jre'):
-        # 커넥션 풀 초기화 (None으로 시작)
-        self.pool: Optional[JDBCConnectionPool] = None
-        # SQL Server JDBC 드라이버 JAR 파일 검색
-        jar_file = find_jdbc_jar('sqlserver', jre_dir)
-        if not jar_file:
-            # JDBC 드라이버를 찾지 못한 경우 예외 발생
-            raise RuntimeError("SQL Server JDBC driver not found")
-        self.jar_file: str = jar_file
+        Returns:
+            삽입 및 커밋된 레코드 수
+
+        Raises:
+            BatchInsertError: 앞선 단위가 커밋된 뒤 이후 단위에서 실패한 경우 (committed에 커밋된 행 수)
+        """
+        if commit_every <= 0 or commit_every >= batch_size:
+            count = self.execute_batch_insert(cursor, thread_id, batch_size)
+            self.commit(connection)
+            return count
+        total = 0
+        remaining = batch_size
+        try:
+            while remaining > 0:
+                chunk = min(remaining, commit_every)
+                count = self.execute_batch_insert(cursor, thread_id, chunk)
+                self.commit(connection)
+                total += count
+                remaining -= chunk
+        except Exception as e:
+            if total == 0:
+                raise
+            raise BatchInsertError(e, total) from e
+        return total
 
+    @abstractmethod
     def create_connection_pool(self, config: 'DatabaseConfig'):
-        # SQL Server JDBC 연결 URL 생성 (기본 포트: 1433)
-        jdbc_url = JDBC_DRIVERS['sqlserver'].url_template.format(
-            host=config.host, port=config.port or 1433, database=config.database
-        )
-        # JDBC 커넥션 풀 생성 및 설정 적용
-        self.pool = JDBCConnectionPool(
-            jdbc_url=jdbc_url, driver_class=JDBC_DRIVERS['sqlserver'].driver_class,
-            jar_file=self.jar_file, user=config.user, password=config.password,
-            min_size=config.min_pool_size, max_size=config.max_pool_size,
-            max_lifetime_seconds=config.max_lifetime_seconds,
-            leak_detection_threshold_seconds=config.leak_detection_threshold_seconds,
-            idle_check_interval_seconds=config.idle_check_interval_seconds,
-            idle_timeout_seconds=config.idle_timeout_seconds,
-            keepalive_time_seconds=config.keepalive_time_seconds
-        )
-        return self.pool
+        """커넥션 풀 생성"""
+        pass
 
+    @abstractmethod
     def get_connection(self):
-        # 풀이 초기화되지 않은 경우 예외 발생
-        if not self.pool:
-            raise RuntimeError("Connection pool not initialized")
-        # 풀에서 커넥션 획득
-        return self.pool.acquire()
+        """풀에서 커넥션 획득"""
+        pass
 
+    @abstractmethod
     def release_connection(self, connection, is_error: bool = False):
-        # 커넥션과 풀이 유효한 경우에만 처리
-        if connection and self.pool:
-            try:
-                if is_error:
-                    # 에러 발생 시 트랜잭션 롤백
-                    connection.rollback()
-                # 커넥션을 풀에 반환
-                self.pool.release(connection)
-            except:
-                # 반환 중 예외 발생 시 무시
-                pass
+        """커넥션 반환 (에러 시 롤백 후 반환)"""
+        pass
 
+    @abstractmethod
     def discard_connection(self, connection):
-        # 커넥션과 풀이 유효한 경우 커넥션 폐기
-        if connection and self.pool:
-            self.pool.discard(connection)
+        """손상된 커넥션 폐기"""
+        pass
 
+    @abstractmethod
     def close_pool(self):
-        # 풀이 존재하는 경우 모든 커넥션 종료
-        if self.pool:
-            self.pool.close_all()
+        """커넥션 풀 종료"""
+        pass
 
+    @abstractmethod
     def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        # 풀이 존재하면 통계 반환, 없으면 빈 딕셔너리 반환
-        return self.pool.get_pool_stats() if self.pool else {}
+        """커넥션 풀 상태 조회"""
+        pass
 
+    @abstractmethod
     def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        # INSERT 쿼리 실행 (GETDATE()로 현재 시간 삽입)
-        cursor.execute("""
-            INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-            VALUES (?, ?, ?, GETDATE())
-        """, [thread_id, f'TEST_{thread_id}', random_data])
-        # 방금 삽입된 행의 IDENTITY 값 조회
-        cursor.execute("SELECT SCOPE_IDENTITY()")
-        result = cursor.fetchone()
-        # 삽입된 ID 값 반환
-        return int(result[0])
+        """단일 INSERT 실행 및 생성된 ID 반환"""
+        pass
 
+    @abstractmethod
     def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
-        """배치 INSERT 실행
-
-        지정된 크기만큼 INSERT 문을 반복 실행하여 대량 삽입을 수행합니다.
-
-        Args:
-            cursor: 데이터베이스 커서
-            thread_id: 워커 스레드 식별자
-            batch_size: 배치 크기 (삽입할 레코드 수)
-
-        Returns:
-            삽입된 레코드 수 (batch_size)
-        """
-        random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=500))
-        for _ in range(batch_size):
-            cursor.execute("""
-                INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-                VALUES (?, ?, ?, GETDATE())
-            """, [thread_id, f'TEST_{thread_id}', random_data])
-        return batch_size
+        """배치 INSERT 실행 및 삽입 건수 반환"""
+        pass
 
+    @abstractmethod
     def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
-        """단일 레코드 조회
-
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 조회할 레코드 ID
-
-        Returns:
-            조회된 레코드 튜플, 없으면 None
-        """
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [record_id])
-        return cursor.fetchone()
+        """ID로 레코드 조회"""
+        pass
 
+    @abstractmethod
     def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
-        """랜덤 레코드 조회
-
-        Args:
-            cursor: 데이터베이스 커서
-            max_id: 조회 가능한 최대 ID
-
-        Returns:
-            조회된 레코드 튜플, 없으면 None
-        """
-        if max_id <= 0:
-            return None
-        random_id = random.randint(1, max_id)
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [random_id])
-        return cursor.fetchone()
-
-    def execute_update(self, cursor, record_id: int) -> bool:
-        """레코드 UPDATE 실행
-
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 업데이트할 레코드 ID
-
-        Returns:
-            업데이트 성공 시 True, 실패 시 False
-        """
-        cursor.execute("UPDATE load_test SET value_col = ?, updated_at = GETDATE() WHERE id = ?",
-                       [f'UPDATED_{record_id}', record_id])
-        return cursor.rowcount > 0
-
-    def execute_delete(self, cursor, record_id: int) -> bool:
-        """레코드 DELETE 실행
-
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 삭제할 레코드 ID
-
-        Returns:
-            삭제 성공 시 True, 실패 시 False
-        """
-        cursor.execute("DELETE FROM load_test WHERE id = ?", [record_id])
-        return cursor.rowcount > 0
+        """랜덤 레코드 조회"""
+        pass
 
-    def get_max_id(self, cursor) -> int:
-        """테이블의 최대 ID 조회
+    @abstractmethod
+    def execute_update(self, cursor, record_id: int) -> bool:
+        """레코드 UPDATE 실행"""
+        pass
 
-        Args:
-            cursor: 데이터베이스 커서
+    @abstractmethod
+    def execute_delete(self, cursor, record_id: int) -> bool:
+        """레코드 DELETE 실행"""
+        pass
 
-        Returns:
-            최대 ID 값, 레코드가 없으면 0
-        """
-        cursor.execute("SELECT ISNULL(MAX(id), 0) FROM load_test")
-        result = cursor.fetchone()
-        return int(result[0]) if result else 0
+    @abstractmethod
+    def get_max_id(self, cursor) -> int:
+        """테이블의 최대 ID 조회"""
+        pass
 
+    @abstractmethod
     def get_random_id(self, cursor, max_id: int) -> int:
-        """랜덤 ID 생성
-
-        Args:
-            cursor: 데이터베이스 커서 (미사용)
-            max_id: 최대 ID 범위
-
-        Returns:
-            1과 max_id 사이의 랜덤 정수
-        """
-        return random.randint(1, max_id) if max_id > 0 else 0
+        """랜덤 ID 생성"""
+        pass
 
+    @abstractmethod
     def commit(self, connection):
-        """트랜잭션 커밋
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        connection.commit()
+        """트랜잭션 커밋"""
+        pass
 
+    @abstractmethod
     def rollback(self, connection):
-        """트랜잭션 롤백
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        try:
-            connection.rollback()
-        except:
-            pass
+        """트랜잭션 롤백"""
+        pass
 
+    @abstractmethod
     def get_ddl(self) -> str:
-        """테이블 생성 DDL 반환
-
-        Returns:
-            SQL Server용 테이블 생성 SQL 문자열
-        """
-        return """
--- SQL Server DDL
-CREATE TABLE load_test (
-    id BIGINT IDENTITY(1,1) NOT NULL, thread_id NVARCHAR(50) NOT NULL,
-    value_col NVARCHAR(200), random_data NVARCHAR(1000),
-    status NVARCHAR(20) DEFAULT 'ACTIVE',
-    created_at DATETIME2 DEFAULT GETDATE(), updated_at DATETIME2 DEFAULT GETDATE(),
-    CONSTRAINT PK_load_test PRIMARY KEY CLUSTERED (id)
-);
-"""
+        """테이블 생성 DDL 반환"""
+        pass
 
+    @abstractmethod
     def setup_schema(self, connection):
-        cursor = connection.cursor()
-        try:
-            cursor.execute(
-                "SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_NAME = 'load_test'"
-            )
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                logger.info("SQL Server schema already exists - reusing existing schema")
-                logger.info("  (DROP TABLE load_test to recreate, or use --truncate to clear data only)")
-                return
-
-            cursor.execute("""
-                CREATE TABLE load_test (
-                    id BIGINT IDENTITY(1,1) NOT NULL, thread_id NVARCHAR(50) NOT NULL,
-                    value_col NVARCHAR(200), random_data NVARCHAR(1000),
-                    status NVARCHAR(20) DEFAULT 'ACTIVE',
-                    created_at DATETIME2 DEFAULT GETDATE(), updated_at DATETIME2 DEFAULT GETDATE(),
-                    CONSTRAINT PK_load_test PRIMARY KEY CLUSTERED (id)
-                )
-            """)
-            cursor.execute("CREATE INDEX idx_load_test_thread ON load_test(thread_id, created_at)")
-            connection.commit()
-            logger.info("SQL Server schema created successfully")
-        except Exception as e:
-            logger.error(f"Failed to setup SQL Server schema: {e}")
-            raise
-        finally:
-            cursor.close()
+        """테스트 스키마 생성"""
+        pass
 
+    @abstractmethod
     def truncate_table(self, connection):
-        """테이블 데이터 삭제 및 IDENTITY 초기화
-
-        load_test 테이블의 모든 데이터를 삭제하고
-        IDENTITY를 1부터 다시 시작합니다.
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        cursor = connection.cursor()
-        try:
-            cursor.execute("TRUNCATE TABLE load_test")
-            connection.commit()
-            logger.info("Table load_test truncated and IDENTITY reset to 1")
-        except Exception as e:
-            logger.error(f"Failed to truncate SQL Server table: {e}")
-            raise
-        finally:
-            cursor.close()
+        """테이블 데이터 삭제 (TRUNCATE)"""
+        pass
 
 
 # ============================================================================
-# Tibero JDBC 어댑터
+# JDBC 어댑터 공통 베이스
 # ============================================================================
-class TiberoJDBCAdapter(DatabaseAdapter):
-    """Tibero JDBC 어댑터
+class BaseJDBCAdapter(DatabaseAdapter):
+    """JDBC 어댑터 공통 구현
 
-    Tibero 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
-    Oracle과 호환되는 시퀀스(LOAD_TEST_SEQ)와 SYSTIMESTAMP를 사용합니다.
+    DB별 어댑터는 SQL 문(SQL_SELECT_BY_ID, SQL_UPDATE, SQL_DELETE, SQL_MAX_ID)과
+    DB_TYPE/DB_LABEL만 클래스 속성으로 지정하고, DB마다 다른 INSERT/DDL/풀 생성만 구현합니다.
+    풀 관리, 단건 조회/수정/삭제, 커밋/롤백은 모두 같은 코드 경로를 공유합니다.
     """
 
+    __slots__ = ('jar_file',)
+
+    # JDBC_DRIVERS / find_jdbc_jar 키 (하위 클래스에서 지정)
+    DB_TYPE = ''
+    # 로그/오류 메시지용 표시 이름 (하위 클래스에서 지정)
+    DB_LABEL = ''
+    # 커넥션 풀 최대 크기 제한 (None이면 제한 없음, 하위 클래스에서 DB별 상수로 지정)
+    MAX_POOL_SIZE: Optional[int] = None
+
     def __init__(self, jre_dir: str = './jre'):
-        # 커넥션 풀 초기화 (None으로 시작)
+        """어댑터 초기화
+
+        Args:
+            jre_dir: JDBC 드라이버 JAR 파일이 있는 디렉터리
+
+        Raises:
+            RuntimeError: JDBC 드라이버를 찾을 수 없는 경우
+        """
+        super().__init__()
         self.pool: Optional[JDBCConnectionPool] = None
-        # Tibero JDBC 드라이버 JAR 파일 검색
-        jar_file = find_jdbc_jar('tibero', jre_dir)
+        jar_file = find_jdbc_jar(self.DB_TYPE, jre_dir)
         if not jar_file:
-            # JDBC 드라이버를 찾지 못한 경우 예외 발생
-            raise RuntimeError("Tibero JDBC driver not found")
+            raise RuntimeError(f"{self.DB_LABEL} JDBC driver not found")
         self.jar_file: str = jar_file
 
-    def create_connection_pool(self, config: 'DatabaseConfig'):
-        # Tibero JDBC 연결 URL 생성 (기본 포트: 8629)
-        jdbc_url = JDBC_DRIVERS['tibero'].url_template.format(
-            host=config.host, port=config.port or 8629, sid=config.sid or config.database
+    def _pool_size_limits(self, config: 'DatabaseConfig') -> Tuple[int, int]:
+        """DB별 최대 크기 제한을 적용한 (최소, 최대) 풀 크기 반환
+
+        요청된 풀 크기가 MAX_POOL_SIZE를 초과하면 제한값으로 줄이고 경고 로그를 출력합니다.
+
+        Args:
+            config: 데이터베이스 설정
+
+        Returns:
+            (최소 풀 크기, 최대 풀 크기)
+        """
+        cap = self.MAX_POOL_SIZE
+        if cap is None or (config.min_pool_size <= cap and config.max_pool_size <= cap):
+            return config.min_pool_size, config.max_pool_size
+        logger.warning(
+            f"[{self.DB_LABEL}] Pool size limited to {cap} "
+            f"(requested: min={config.min_pool_size}, max={config.max_pool_size}). "
+            f"See {self.DB_TYPE.upper()}_MAX_POOL_SIZE constant for details."
         )
-        # JDBC 커넥션 풀 생성 및 설정 적용
-        self.pool = JDBCConnectionPool(
-            jdbc_url=jdbc_url, driver_class=JDBC_DRIVERS['tibero'].driver_class,
+        return min(config.min_pool_size, cap), min(config.max_pool_size, cap)
+
+    def _create_pool(self, config: 'DatabaseConfig', jdbc_url: str, **extra):
+        """공통 풀 설정으로 JDBC 커넥션 풀 생성 (같은 URL의 열린 풀이 있으면 재사용)
+
+        Args:
+            config: 데이터베이스 설정
+            jdbc_url: JDBC 연결 URL
+            **extra: JDBCConnectionPool에 추가로 전달할 인자
+
+        Returns:
+            생성(또는 재사용)된 커넥션 풀
+        """
+        min_size, max_size = self._pool_size_limits(config)
+        return self._create_pool_once(jdbc_url, functools.partial(
+            JDBCConnectionPool,
+            jdbc_url=jdbc_url, driver_class=JDBC_DRIVERS[self.DB_TYPE].driver_class,
             jar_file=self.jar_file, user=config.user, password=config.password,
-            min_size=config.min_pool_size, max_size=config.max_pool_size,
+            min_size=min_size, max_size=max_size,
             max_lifetime_seconds=config.max_lifetime_seconds,
             leak_detection_threshold_seconds=config.leak_detection_threshold_seconds,
             idle_check_interval_seconds=config.idle_check_interval_seconds,
             idle_timeout_seconds=config.idle_timeout_seconds,
-            keepalive_time_seconds=config.keepalive_time_seconds
-        )
-        return self.pool
+            keepalive_time_seconds=config.keepalive_time_seconds,
+            **extra
+        ))
 
     def get_connection(self):
-        # 풀이 초기화되지 않은 경우 예외 발생
         if not self.pool:
             raise RuntimeError("Connection pool not initialized")
-        # 풀에서 커넥션 획득
-        return self.pool.acquire()
+        # 미리 바인딩한 acquire로 스레드 캐시/샤드 경로 사용
+        return self._acquire()
 
     def release_connection(self, connection, is_error: bool = False):
-        # 커넥션과 풀이 유효한 경우에만 처리
+        # 에러 시에만 롤백하며, 이미 닫혔거나 롤백에 실패한 커넥션은 풀에 반환하지 않고 폐기
         if connection and self.pool:
-            try:
-                if is_error:
-                    # 에러 발생 시 트랜잭션 롤백
-                    connection.rollback()
-                # 커넥션을 풀에 반환
-                self.pool.release(connection)
-            except:
-                # 반환 중 예외 발생 시 무시
-                pass
+            self._release_to_pool(connection, is_error)
 
     def discard_connection(self, connection):
-        # 커넥션과 풀이 유효한 경우 커넥션 폐기
+        # 캐시된 Statement 정리 후 커넥션 폐기
         if connection and self.pool:
-            self.pool.discard(connection)
+            self._evict_statements(connection)
+            self._discard(connection)
 
     def close_pool(self):
-        # 풀이 존재하는 경우 모든 커넥션 종료
         if self.pool:
             self.pool.close_all()
 
     def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        # 풀이 존재하면 통계 반환, 없으면 빈 딕셔너리 반환
         return self.pool.get_pool_stats() if self.pool else {}
 
-    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        # INSERT 쿼리 실행 (시퀀스로 ID 생성, SYSTIMESTAMP로 현재 시간 삽입)
-        cursor.execute("""
-            INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT)
-            VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP)
-        """, [thread_id, f'TEST_{thread_id}', random_data])
-        # 방금 삽입된 시퀀스의 현재 값 조회
-        cursor.execute("SELECT LOAD_TEST_SEQ.CURRVAL FROM DUAL")
-        result = cursor.fetchone()
-        # 삽입된 ID 값 반환
-        return int(result[0])
-
-    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
-        """배치 INSERT 실행
-
-        지정된 크기만큼 INSERT 문을 반복 실행하여 대량 삽입을 수행합니다.
-
-        Args:
-            cursor: 데이터베이스 커서
-            thread_id: 워커 스레드 식별자
-            batch_size: 배치 크기 (삽입할 레코드 수)
-
-        Returns:
-            삽입된 레코드 수 (batch_size)
-        """
-        # 500자 랜덤 문자열 생성 (배치 전체에서 동일하게 사용)
-        random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=500))
-        # 지정된 배치 크기만큼 반복 INSERT
-        for _ in range(batch_size):
-            cursor.execute("""
-                INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT)
-                VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP)
-            """, [thread_id, f'TEST_{thread_id}', random_data])
-        # 삽입된 레코드 수 반환
-        return batch_size
-
     def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
         """단일 레코드 조회
 
@@ -2841,10 +3060,7 @@ class TiberoJDBCAdapter(DatabaseAdapter):
         Returns:
             조회된 레코드 튜플, 없으면 None
         """
-        # 지정된 ID로 레코드 조회
-        cursor.execute("SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?", [record_id])
-        # 조회 결과 반환 (없으면 None)
-        return cursor.fetchone()
+        return self._query_record(cursor, self.SQL_SELECT_BY_ID, [record_id])
 
     def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
         """랜덤 레코드 조회
@@ -2856,15 +3072,9 @@ class TiberoJDBCAdapter(DatabaseAdapter):
         Returns:
             조회된 레코드 튜플, 없으면 None
         """
-        # 최대 ID가 0 이하인 경우 조회 불가
         if max_id <= 0:
             return None
-        # 1부터 max_id 사이의 랜덤 ID 생성
-        random_id = random.randint(1, max_id)
-        # 랜덤 ID로 레코드 조회
-        cursor.execute("SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?", [random_id])
-        # 조회 결과 반환 (없으면 None)
-        return cursor.fetchone()
+        return self._query_record(cursor, self.SQL_SELECT_BY_ID, [random_record_id(max_id)])
 
     def execute_update(self, cursor, record_id: int) -> bool:
         """레코드 UPDATE 실행
@@ -2876,11 +3086,8 @@ class TiberoJDBCAdapter(DatabaseAdapter):
         Returns:
             업데이트 성공 시 True, 실패 시 False
         """
-        # VALUE_COL과 UPDATED_AT 컬럼 업데이트
-        cursor.execute("UPDATE LOAD_TEST SET VALUE_COL = ?, UPDATED_AT = SYSTIMESTAMP WHERE ID = ?",
-                       [f'UPDATED_{record_id}', record_id])
-        # 영향받은 행이 있으면 True 반환
-        return cursor.rowcount > 0
+        return self._execute_prepared_update(cursor, self.SQL_UPDATE,
+                                             [updated_value_jstring(record_id), record_id]) > 0
 
     def execute_delete(self, cursor, record_id: int) -> bool:
         """레코드 DELETE 실행
@@ -2892,25 +3099,21 @@ class TiberoJDBCAdapter(DatabaseAdapter):
         Returns:
             삭제 성공 시 True, 실패 시 False
         """
-        # 지정된 ID의 레코드 삭제
-        cursor.execute("DELETE FROM LOAD_TEST WHERE ID = ?", [record_id])
-        # 영향받은 행이 있으면 True 반환
-        return cursor.rowcount > 0
+        return self._execute_prepared_update(cursor, self.SQL_DELETE, [record_id]) > 0
 
     def get_max_id(self, cursor) -> int:
         """테이블의 최대 ID 조회
 
+        INSERT로 갱신되는 캐시를 우선 사용하고, 비어 있거나
+        MAX_ID_CACHE_TTL_SECONDS가 지났을 때만 MAX(id)를 다시 조회합니다.
+
         Args:
             cursor: 데이터베이스 커서
 
         Returns:
             최대 ID 값, 레코드가 없으면 0
         """
-        # 테이블에서 최대 ID 조회 (없으면 0 반환)
-        cursor.execute("SELECT NVL(MAX(ID), 0) FROM LOAD_TEST")
-        result = cursor.fetchone()
-        # 결과가 있으면 정수로 변환하여 반환, 없으면 0
-        return int(result[0]) if result else 0
+        return self._cached_max_id(cursor, self.SQL_MAX_ID)
 
     def get_random_id(self, cursor, max_id: int) -> int:
         """랜덤 ID 생성
@@ -2922,63 +3125,174 @@ class TiberoJDBCAdapter(DatabaseAdapter):
         Returns:
             1과 max_id 사이의 랜덤 정수
         """
-        return random.randint(1, max_id) if max_id > 0 else 0
+        return random_record_id(max_id) if max_id > 0 else 0
 
     def commit(self, connection):
-        """트랜잭션 커밋
-
-        Args:
-            connection: 데이터베이스 커넥션
-        """
         connection.commit()
 
     def rollback(self, connection):
-        """트랜잭션 롤백
+        self._rollback_quietly(connection)
 
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        try:
-            connection.rollback()
-        except:
-            pass
 
-    def get_ddl(self) -> str:
-        """테이블 생성 DDL 반환
+# ============================================================================
+# Oracle JDBC 어댑터
+# ============================================================================
+# Oracle Thin 드라이버 네트워크/Fetch 튜닝 속성
+# - TCP_NODELAY: Nagle 알고리즘을 꺼 작은 요청/응답 패킷의 지연을 줄임 (대역폭보다 지연 우선)
+# - keepAlive: 방화벽 등에 의해 유휴 커넥션이 끊기는 것을 OS 수준에서 감지
+# - disableOob: OOB(긴급) 데이터 미지원 네트워크 장비에서의 break/reset 지연 방지
+# - defaultRowPrefetch: 조회 1회 왕복당 가져오는 행 수 (드라이버 기본 10)
+# 드라이버 버전에 따라 인식하는 속성 이름이 달라 두 가지 이름을 모두 설정
+ORACLE_CONNECTION_PROPERTIES = {
+    'oracle.jdbc.TcpNoDelay': 'true',
+    'oracle.net.TCP_NODELAY': 'true',
+    'oracle.net.keepAlive': 'true',
+    'oracle.net.KEEPALIVE': 'true',
+    'oracle.net.disableOob': 'true',
+    'oracle.net.DISABLE_OOB': 'true',
+    'defaultRowPrefetch': '50',
+    'oracle.jdbc.defaultRowPrefetch': '50',
+}
+
+
+class OracleJDBCAdapter(BaseJDBCAdapter):
+    """Oracle JDBC 어댑터
+
+    Oracle 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
+    SID 또는 Service Name 연결 방식을 모두 지원합니다.
+    """
+
+    __slots__ = ()
+
+    DB_TYPE = 'oracle'
+    DB_LABEL = 'Oracle'
+    # 행 버퍼는 Statement마다 prefetch 행 수 x 컬럼 최대 길이로 할당되므로
+    # 단건 조회 Statement는 defaultRowPrefetch(50) 대신 1행 분량만 할당
+    SINGLE_ROW_FETCH_SIZE = 1
+
+    # 실행 SQL (클래스 로드 시 한 번만 생성, PreparedStatement 캐시 키로도 사용)
+    SQL_INSERT = ("BEGIN INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT) "
+                  "VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP) RETURNING ID INTO ?; END;")
+    SQL_BATCH_INSERT = ("INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT) "
+                        "VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP)")
+    SQL_SELECT_BY_ID = "SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?"
+    SQL_UPDATE = "UPDATE LOAD_TEST SET VALUE_COL = ?, UPDATED_AT = SYSTIMESTAMP WHERE ID = ?"
+    SQL_DELETE = "DELETE FROM LOAD_TEST WHERE ID = ?"
+    SQL_MAX_ID = "SELECT NVL(MAX(ID), 0) FROM LOAD_TEST"
+
+    def create_connection_pool(self, config: 'DatabaseConfig'):
+        if config.service_name:
+            jdbc_url = (
+                f"jdbc:oracle:thin:@//{config.host}:{config.port or 1521}/{config.service_name}"
+            )
+        else:
+            sid = config.sid or config.database
+            if not sid:
+                raise RuntimeError('Oracle SID or service name is required')
+            jdbc_url = build_jdbc_url('oracle', config.host, config.port or 1521, sid=sid)
+
+        # Oracle 커넥션 속성 설정 (네트워크/Fetch 튜닝 기본값 포함)
+        connection_props = dict(ORACLE_CONNECTION_PROPERTIES)
+        if config.connection_timeout_seconds > 0:
+            timeout_ms = str(config.connection_timeout_seconds * 1000)
+            connection_props['oracle.net.CONNECT_TIMEOUT'] = timeout_ms
+            connection_props['oracle.jdbc.ReadTimeout'] = timeout_ms
+            logger.info(f"Setting Oracle connection timeouts to {config.connection_timeout_seconds}s")
+
+        self._create_pool(
+            config, jdbc_url,
+            validation_timeout=config.connection_timeout_seconds, # 유효성 검사에도 타임아웃 적용
+            connection_properties=connection_props
+        )
+        self.validation_timeout = config.connection_timeout_seconds
+        return self.pool
+
+    def get_connection(self):
+        # 풀이 비었거나 DB가 다운된 경우 빠르게 실패하도록 짧은 타임아웃 사용
+        # 시도당 최대 validation_timeout(3초) 대기, 최대 3회 시도 = 9초
+        if not self.pool:
+            raise RuntimeError("Connection pool not initialized")
+        conn = self._acquire(timeout=self.validation_timeout if self.validation_timeout > 0 else 5)
+        if conn is None:
+             logger.debug("OracleJDBCAdapter: Failed to acquire connection from pool (Timeout/Empty)")
+        return conn
+
+    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
+        """단일 INSERT 실행 및 생성된 ID 반환
+
+        RETURNING INTO로 INSERT와 ID 조회를 한 번의 왕복으로 처리합니다.
+        (INSERT 후 CURRVAL을 따로 조회하면 왕복이 2회 발생)
+
+        Args:
+            cursor: 데이터베이스 커서
+            thread_id: 워커 스레드 식별자
+            random_data: 삽입할 랜덤 데이터
 
         Returns:
-            Tibero용 테이블 생성 SQL 문자열
+            생성된 레코드 ID
         """
+        cs = self._prepare(cursor, self.SQL_INSERT, call=True)
+        thread_jstr, value_jstr = thread_jstrings(thread_id)
+        cs.setString(1, thread_jstr)
+        cs.setString(2, value_jstr)
+        cs.setString(3, random_data)
+        cs.registerOutParameter(4, JDBC_TYPE_BIGINT)
+        cs.execute()
+        return self._remember_max_id(int(cs.getLong(4)))
+
+    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
+        """배치 INSERT 실행"""
+        random_data = random_ascii(500)
+
+        return self._execute_jdbc_batch(cursor, self.SQL_BATCH_INSERT,
+                                        [*thread_jstrings(thread_id), random_data], batch_size)
+
+    def commit(self, connection):
+        if self.relaxed_commit:
+            # 로그 기록(log force)을 기다리지 않는 비동기 커밋 (장애 시 최근 커밋 유실 가능)
+            cursor = connection.cursor()
+            try:
+                cursor.execute("COMMIT WRITE BATCH NOWAIT")
+            finally:
+                cursor.close()
+            return
+        connection.commit()
+
+    def get_ddl(self) -> str:
         return """
--- Tibero DDL
+-- Oracle DDL
 CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER;
-CREATE TABLE LOAD_TEST (
-    ID NUMBER(19) NOT NULL, THREAD_ID VARCHAR2(50) NOT NULL,
-    VALUE_COL VARCHAR2(200), RANDOM_DATA VARCHAR2(1000),
-    STATUS VARCHAR2(20) DEFAULT 'ACTIVE',
-    CREATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP, UPDATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP
-) PARTITION BY HASH (ID) PARTITIONS 16 ENABLE ROW MOVEMENT;
+CREATE TABLE LOAD_TEST (
+    ID           NUMBER(19)      NOT NULL,
+    THREAD_ID    VARCHAR2(50)    NOT NULL,
+    VALUE_COL    VARCHAR2(200),
+    RANDOM_DATA  VARCHAR2(1000),
+    STATUS       VARCHAR2(20)    DEFAULT 'ACTIVE',
+    CREATED_AT   TIMESTAMP       DEFAULT SYSTIMESTAMP,
+    UPDATED_AT   TIMESTAMP       DEFAULT SYSTIMESTAMP
+)
+PARTITION BY HASH (ID) PARTITIONS 16
+TABLESPACE USERS
+ENABLE ROW MOVEMENT;
 ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID);
+CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT) LOCAL;
 """
 
     def setup_schema(self, connection):
         cursor = connection.cursor()
         try:
-            table_exists = False
-            seq_exists = False
-
-            cursor.execute("SELECT COUNT(*) FROM USER_TABLES WHERE TABLE_NAME = 'LOAD_TEST'")
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                table_exists = True
-
-            cursor.execute("SELECT COUNT(*) FROM USER_SEQUENCES WHERE SEQUENCE_NAME = 'LOAD_TEST_SEQ'")
+            # 테이블/시퀀스 존재 여부를 스칼라 서브쿼리로 한 번에 조회 (왕복 1회)
+            cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM USER_TABLES WHERE TABLE_NAME = 'LOAD_TEST'),
+                       (SELECT COUNT(*) FROM USER_SEQUENCES WHERE SEQUENCE_NAME = 'LOAD_TEST_SEQ')
+                FROM DUAL
+            """)
             result = cursor.fetchone()
-            if result and result[0] > 0:
-                seq_exists = True
+            table_exists = bool(result and result[0] > 0)
+            seq_exists = bool(result and result[1] > 0)
 
             if table_exists and seq_exists:
-                logger.info("Tibero schema already exists - reusing existing schema")
+                logger.info("Oracle schema already exists - reusing existing schema")
                 logger.info("  (DROP objects manually to recreate, or use --truncate to clear data only)")
                 return
 
@@ -3001,18 +3315,16 @@ ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID);
                     STATUS VARCHAR2(20) DEFAULT 'ACTIVE',
                     CREATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP,
                     UPDATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP
-                ) PARTITION BY HASH (ID) PARTITIONS 16 ENABLE ROW MOVEMENT
+                ) PARTITION BY HASH (ID) PARTITIONS 16 TABLESPACE USERS ENABLE ROW MOVEMENT
             """)
             cursor.execute("ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID)")
             cursor.execute("CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT) LOCAL")
             connection.commit()
-            logger.info("Tibero schema created successfully")
+            logger.info("Oracle schema created successfully")
         except Exception as e:
-            # 스키마 생성 실패 시 에러 로그 출력 및 예외 재발생
-            logger.error(f"Failed to setup Tibero schema: {e}")
+            logger.error(f"Failed to setup Oracle schema: {e}")
             raise
         finally:
-            # 커서 리소스 정리
             cursor.close()
 
     def truncate_table(self, connection):
@@ -3026,131 +3338,216 @@ ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID);
         """
         cursor = connection.cursor()
         try:
-            # 테이블의 모든 데이터 삭제 (빠른 삭제)
             cursor.execute("TRUNCATE TABLE LOAD_TEST")
-            # 기존 시퀀스 삭제
             cursor.execute("DROP SEQUENCE LOAD_TEST_SEQ")
-            # 시퀀스를 1부터 다시 생성 (캐시 1000, 순환 없음, 순서 보장)
             cursor.execute("CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER")
-            # 변경사항 커밋
             connection.commit()
+            self._reset_max_id()
             logger.info("Table LOAD_TEST truncated and sequence LOAD_TEST_SEQ reset to 1")
         except Exception as e:
-            # 테이블 초기화 실패 시 에러 로그 출력 및 예외 재발생
-            logger.error(f"Failed to truncate Tibero table: {e}")
+            logger.error(f"Failed to truncate Oracle table: {e}")
             raise
         finally:
-            # 커서 리소스 정리
             cursor.close()
 
 
 # ============================================================================
-# SingleStore JDBC 어댑터
+# PostgreSQL JDBC 어댑터
 # ============================================================================
-# SingleStore 커넥션 풀 크기 제한 상수
-# 이 제한은 SingleStore의 기본 설정과 관련됩니다.
-# 필요시 이 값을 조정할 수 있습니다.
-SINGLESTORE_MAX_POOL_SIZE = 64
+class PostgreSQLJDBCAdapter(BaseJDBCAdapter):
+    """PostgreSQL JDBC 어댑터
 
+    PostgreSQL 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
+    BIGSERIAL 컬럼과 RETURNING 절을 사용하여 자동 증가 ID를 관리합니다.
+    """
 
-class SingleStoreJDBCAdapter(DatabaseAdapter):
-    """SingleStore JDBC 어댑터
+    __slots__ = ()
 
-    SingleStore 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
-    SingleStore는 MySQL 프로토콜과 호환되므로 MySQL과 유사한 SQL을 사용합니다.
-    """
+    DB_TYPE = 'postgresql'
+    DB_LABEL = 'PostgreSQL'
 
-    def __init__(self, jre_dir: str = './jre'):
-        # 커넥션 풀 초기화 (None으로 시작)
-        self.pool: Optional[JDBCConnectionPool] = None
-        # SingleStore JDBC 드라이버 JAR 파일 검색
-        jar_file = find_jdbc_jar('singlestore', jre_dir)
-        if not jar_file:
-            # JDBC 드라이버를 찾지 못한 경우 예외 발생
-            raise RuntimeError("SingleStore JDBC driver not found")
-        self.jar_file: str = jar_file
+    # 실행 SQL (클래스 로드 시 한 번만 생성, PreparedStatement 캐시 키로도 사용)
+    SQL_INSERT = ("INSERT INTO load_test (thread_id, value_col, random_data, created_at) "
+                  "VALUES (?, ?, ?, CURRENT_TIMESTAMP) RETURNING id")
+    SQL_BATCH_INSERT_HEAD = "INSERT INTO load_test (thread_id, value_col, random_data, created_at) VALUES "
+    SQL_BATCH_INSERT_ROW = "(?, ?, ?, CURRENT_TIMESTAMP)"
+    SQL_SELECT_BY_ID = "SELECT id, thread_id, value_col FROM load_test WHERE id = ?"
+    SQL_UPDATE = "UPDATE load_test SET value_col = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+    SQL_DELETE = "DELETE FROM load_test WHERE id = ?"
+    SQL_MAX_ID = "SELECT COALESCE(MAX(id), 0) FROM load_test"
 
     def create_connection_pool(self, config: 'DatabaseConfig'):
-        # SingleStore JDBC 연결 URL 생성 (기본 포트: 3306)
-        jdbc_url = JDBC_DRIVERS['singlestore'].url_template.format(
-            host=config.host, port=config.port or 3306, database=config.database
-        )
+        jdbc_url = build_jdbc_url('postgresql', config.host, config.port or 5432, database=config.database)
+        jdbc_url = append_jdbc_url_params(jdbc_url, POSTGRESQL_URL_PARAMS)
+        return self._create_pool(config, jdbc_url)
 
-        # SingleStore 커넥션 풀 크기 제한 적용 (최대 크기 초과 방지)
-        effective_min = min(config.min_pool_size, SINGLESTORE_MAX_POOL_SIZE)
-        effective_max = min(config.max_pool_size, SINGLESTORE_MAX_POOL_SIZE)
+    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
+        ps = self._prepare(cursor, self.SQL_INSERT)
+        thread_jstr, value_jstr = thread_jstrings(thread_id)
+        ps.setString(1, thread_jstr)
+        ps.setString(2, value_jstr)
+        ps.setString(3, random_data)
+        rs = ps.executeQuery()
+        try:
+            rs.next()
+            return self._remember_max_id(int(rs.getLong(1)))
+        finally:
+            rs.close()
 
-        # 요청된 풀 크기가 제한을 초과하는 경우 경고 로그 출력
-        if config.min_pool_size > SINGLESTORE_MAX_POOL_SIZE or config.max_pool_size > SINGLESTORE_MAX_POOL_SIZE:
-            logger.warning(
-                f"[SingleStore] Pool size limited to {SINGLESTORE_MAX_POOL_SIZE} "
-                f"(requested: min={config.min_pool_size}, max={config.max_pool_size}). "
-                f"See SINGLESTORE_MAX_POOL_SIZE constant for details."
+    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
+        """배치 INSERT 실행
+
+        다중 행 VALUES(...), (...) 문장으로 지정된 크기만큼 대량 삽입을 수행합니다.
+        드라이버의 reWriteBatchedInserts 지원 여부와 무관하게 문장 1회로 처리됩니다.
+
+        Args:
+            cursor: 데이터베이스 커서
+            thread_id: 워커 스레드 식별자
+            batch_size: 배치 크기 (삽입할 레코드 수)
+
+        Returns:
+            삽입된 레코드 수 (batch_size)
+        """
+        random_data = random_ascii(500)
+        return self._execute_multi_row_insert(
+            cursor, self.SQL_BATCH_INSERT_HEAD, self.SQL_BATCH_INSERT_ROW,
+            [*thread_jstrings(thread_id), random_data], batch_size,
+            MULTI_ROW_INSERT_MAX_PARAMS['postgresql'])
+
+    def get_ddl(self) -> str:
+        return """
+-- PostgreSQL DDL
+CREATE TABLE load_test (
+    id BIGSERIAL PRIMARY KEY, thread_id VARCHAR(50) NOT NULL,
+    value_col VARCHAR(200), random_data VARCHAR(1000),
+    status VARCHAR(20) DEFAULT 'ACTIVE',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) PARTITION BY HASH (id);
+"""
+
+    def setup_schema(self, connection):
+        try:
+            if self._table_exists(connection, 'load_test'):
+                logger.info("PostgreSQL schema already exists - reusing existing schema")
+                logger.info("  (DROP TABLE load_test CASCADE to recreate, or use --truncate to clear data only)")
+                return
+
+            # 테이블, 파티션 16개, 인덱스 생성을 하나의 스크립트로 묶어 왕복 1회로 실행
+            statements = ["""
+                CREATE TABLE load_test (
+                    id BIGSERIAL PRIMARY KEY, thread_id VARCHAR(50) NOT NULL,
+                    value_col VARCHAR(200), random_data VARCHAR(1000),
+                    status VARCHAR(20) DEFAULT 'ACTIVE',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ) PARTITION BY HASH (id)
+            """]
+            statements.extend(
+                f"CREATE TABLE load_test_p{i:02d} PARTITION OF load_test "
+                f"FOR VALUES WITH (MODULUS 16, REMAINDER {i})"
+                for i in range(16)
             )
+            statements.append("CREATE INDEX idx_load_test_thread ON load_test(thread_id, created_at)")
+            self._execute_ddl_script(connection, statements)
+            connection.commit()
+            logger.info("PostgreSQL schema created successfully")
+        except Exception as e:
+            logger.error(f"Failed to setup PostgreSQL schema: {e}")
+            raise
 
-        # JDBC 커넥션 풀 생성 및 설정 적용
-        self.pool = JDBCConnectionPool(
-            jdbc_url=jdbc_url, driver_class=JDBC_DRIVERS['singlestore'].driver_class,
-            jar_file=self.jar_file, user=config.user, password=config.password,
-            min_size=effective_min, max_size=effective_max,
-            max_lifetime_seconds=config.max_lifetime_seconds,
-            leak_detection_threshold_seconds=config.leak_detection_threshold_seconds,
-            idle_check_interval_seconds=config.idle_check_interval_seconds,
-            idle_timeout_seconds=config.idle_timeout_seconds,
-            keepalive_time_seconds=config.keepalive_time_seconds
-        )
-        return self.pool
+    def truncate_table(self, connection):
+        """테이블 데이터 삭제 및 시퀀스 초기화
 
-    def get_connection(self):
-        # 풀이 초기화되지 않은 경우 예외 발생
-        if not self.pool:
-            raise RuntimeError("Connection pool not initialized")
-        # 풀에서 커넥션 획득
-        return self.pool.acquire()
+        load_test 테이블의 모든 데이터를 삭제하고
+        IDENTITY 시퀀스를 1부터 다시 시작합니다.
 
-    def release_connection(self, connection, is_error: bool = False):
-        # 커넥션과 풀이 유효한 경우에만 처리
-        if connection and self.pool:
-            try:
-                if is_error:
-                    # 에러 발생 시 트랜잭션 롤백
-                    connection.rollback()
-                # 커넥션을 풀에 반환
-                self.pool.release(connection)
-            except:
-                # 반환 중 예외 발생 시 무시
-                pass
+        Args:
+            connection: 데이터베이스 커넥션
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute("TRUNCATE TABLE load_test RESTART IDENTITY")
+            connection.commit()
+            self._reset_max_id()
+            logger.info("Table load_test truncated and sequence reset to 1")
+        except Exception as e:
+            logger.error(f"Failed to truncate PostgreSQL table: {e}")
+            raise
+        finally:
+            cursor.close()
 
-    def discard_connection(self, connection):
-        # 커넥션과 풀이 유효한 경우 커넥션 폐기
-        if connection and self.pool:
-            self.pool.discard(connection)
 
-    def close_pool(self):
-        # 풀이 존재하는 경우 모든 커넥션 종료
-        if self.pool:
-            self.pool.close_all()
+# ============================================================================
+# MySQL JDBC 어댑터
+# ============================================================================
+# MySQL 커넥션 풀 크기 제한 상수
+# 이 제한은 MySQL Connector/J의 기본 설정 및 MySQL 서버의 max_connections 설정과 관련됩니다.
+# MySQL 서버의 기본 max_connections는 151이지만, 단일 애플리케이션에서 너무 많은
+# 커넥션을 사용하면 다른 클라이언트의 연결이 거부될 수 있습니다.
+# 또한 MySQL Connector/J의 경우 많은 수의 동시 커넥션에서 성능 저하가 발생할 수 있습니다.
+# 필요시 이 값을 조정할 수 있지만, MySQL 서버의 max_connections 설정도 함께 조정해야 합니다.
+# MySQL 커넥션 풀 최대 크기 제한 상수
+MYSQL_MAX_POOL_SIZE = 32
 
-    def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        # 풀이 존재하면 통계 반환, 없으면 빈 딕셔너리 반환
-        return self.pool.get_pool_stats() if self.pool else {}
+
+class MySQLJDBCAdapter(BaseJDBCAdapter):
+    """MySQL JDBC 어댑터
+
+    Note:
+        MySQL의 커넥션 풀 크기는 MYSQL_MAX_POOL_SIZE(기본 32)로 제한됩니다.
+        이는 다음과 같은 이유로 설정되었습니다:
+        1. MySQL 서버의 기본 max_connections (151)와의 균형
+        2. MySQL Connector/J의 대규모 동시 연결 시 성능 특성
+        3. 단일 애플리케이션이 서버 리소스를 독점하는 것을 방지
+
+        더 많은 커넥션이 필요한 경우:
+        - MySQL 서버의 max_connections 설정을 증가시키세요
+        - MYSQL_MAX_POOL_SIZE 상수를 조정하세요
+    """
+
+    __slots__ = ()
+
+    DB_TYPE = 'mysql'
+    DB_LABEL = 'MySQL'
+    MAX_POOL_SIZE = MYSQL_MAX_POOL_SIZE
+
+    # 실행 SQL (클래스 로드 시 한 번만 생성, PreparedStatement 캐시 키로도 사용)
+    SQL_INSERT = ("INSERT INTO load_test (thread_id, value_col, random_data, created_at) "
+                  "VALUES (?, ?, ?, NOW())")
+    SQL_SELECT_BY_ID = "SELECT id, thread_id, value_col FROM load_test WHERE id = ?"
+    SQL_UPDATE = "UPDATE load_test SET value_col = ? WHERE id = ?"
+    SQL_DELETE = "DELETE FROM load_test WHERE id = ?"
+    SQL_MAX_ID = "SELECT IFNULL(MAX(id), 0) FROM load_test"
+
+    def create_connection_pool(self, config: 'DatabaseConfig'):
+        # MySQL JDBC 연결 URL 생성 (기본 포트: 3306)
+        jdbc_url = build_jdbc_url('mysql', config.host, config.port or 3306, database=config.database)
+        # 배치 재작성 및 PreparedStatement 캐시 옵션 추가
+        jdbc_url = append_jdbc_url_params(jdbc_url, MYSQL_URL_PARAMS)
+
+        # JDBC 커넥션 풀 생성 및 설정 적용 (같은 URL의 열린 풀이 있으면 재사용)
+        # 풀 크기는 MAX_POOL_SIZE로 제한 (초과 요청 시 경고 로그 출력)
+        return self._create_pool(config, jdbc_url)
 
     def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        # INSERT 쿼리 실행 (NOW()로 현재 시간 삽입)
-        cursor.execute("""
-            INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-            VALUES (?, ?, ?, NOW())
-        """, [thread_id, f'TEST_{thread_id}', random_data])
-        # 방금 삽입된 행의 AUTO_INCREMENT 값 조회
-        cursor.execute("SELECT LAST_INSERT_ID()")
-        result = cursor.fetchone()
-        # 삽입된 ID 값 반환
-        return int(result[0])
+        # INSERT 쿼리 실행 (NOW()로 현재 시간 삽입, 캐시된 PreparedStatement 사용)
+        # AUTO_INCREMENT 값은 INSERT 응답(OK 패킷)에 포함되므로 getGeneratedKeys()로 읽어 LAST_INSERT_ID() 조회 왕복 제거
+        ps = self._prepare(cursor, self.SQL_INSERT, generated_keys=True)
+        self._bind_params(ps, [*thread_jstrings(thread_id), random_data])
+        ps.executeUpdate()
+        rs = ps.getGeneratedKeys()
+        try:
+            rs.next()
+            # 삽입된 ID 값 반환 (최대 ID 캐시 갱신)
+            return self._remember_max_id(int(rs.getLong(1)))
+        finally:
+            rs.close()
 
     def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
         """배치 INSERT 실행
 
-        지정된 크기만큼 INSERT 문을 반복 실행하여 대량 삽입을 수행합니다.
+        JDBC addBatch/executeBatch로 지정된 크기만큼 대량 삽입을 수행합니다.
 
         Args:
             cursor: 데이터베이스 커서
@@ -3160,167 +3557,266 @@ class SingleStoreJDBCAdapter(DatabaseAdapter):
         Returns:
             삽입된 레코드 수 (batch_size)
         """
-        random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=500))
-        for _ in range(batch_size):
-            cursor.execute("""
-                INSERT INTO load_test (thread_id, value_col, random_data, created_at)
-                VALUES (?, ?, ?, NOW())
-            """, [thread_id, f'TEST_{thread_id}', random_data])
-        return batch_size
-
-    def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
-        """단일 레코드 조회
+        random_data = random_ascii(500)
+        return self._execute_jdbc_batch(cursor, self.SQL_INSERT,
+                                        [*thread_jstrings(thread_id), random_data], batch_size)
 
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 조회할 레코드 ID
+    def get_ddl(self) -> str:
+        """테이블 생성 DDL 반환
 
         Returns:
-            조회된 레코드 튜플, 없으면 None
+            MySQL용 테이블 생성 SQL 문자열
         """
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [record_id])
-        return cursor.fetchone()
+        return """
+-- MySQL DDL
+CREATE TABLE load_test (
+    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
+    value_col VARCHAR(200), random_data VARCHAR(1000),
+    status VARCHAR(20) DEFAULT 'ACTIVE',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+) ENGINE=InnoDB PARTITION BY HASH(id) PARTITIONS 16;
+"""
 
-    def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
-        """랜덤 레코드 조회
+    def setup_schema(self, connection):
+        cursor = connection.cursor()
+        try:
+            if self._table_exists(connection, 'load_test'):
+                logger.info("MySQL schema already exists - reusing existing schema")
+                logger.info("  (DROP TABLE load_test to recreate, or use --truncate to clear data only)")
+                return
+
+            # 보조 인덱스를 CREATE TABLE에 포함시켜 DDL 1문장(왕복 1회)으로 생성
+            cursor.execute("""
+                CREATE TABLE load_test (
+                    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
+                    value_col VARCHAR(200), random_data VARCHAR(1000),
+                    status VARCHAR(20) DEFAULT 'ACTIVE',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    PRIMARY KEY (id),
+                    INDEX idx_load_test_thread (thread_id, created_at)
+                ) ENGINE=InnoDB PARTITION BY HASH(id) PARTITIONS 16
+            """)
+            connection.commit()
+            logger.info("MySQL schema created successfully")
+        except Exception as e:
+            logger.error(f"Failed to setup MySQL schema: {e}")
+            raise
+        finally:
+            cursor.close()
+
+    def truncate_table(self, connection):
+        """테이블 데이터 삭제 및 AUTO_INCREMENT 초기화
+
+        load_test 테이블의 모든 데이터를 삭제하고
+        AUTO_INCREMENT를 1부터 다시 시작합니다.
 
         Args:
-            cursor: 데이터베이스 커서
-            max_id: 조회 가능한 최대 ID
+            connection: 데이터베이스 커넥션
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute("TRUNCATE TABLE load_test")
+            connection.commit()
+            self._reset_max_id()
+            logger.info("Table load_test truncated and AUTO_INCREMENT reset to 1")
+        except Exception as e:
+            logger.error(f"Failed to truncate MySQL table: {e}")
+            raise
+        finally:
+            cursor.close()
+
+
+# ============================================================================
+# SQL Server JDBC 어댑터
+# ============================================================================
+# SQL Server 커넥션 풀 크기 제한 상수
+# 세션마다 워커 스레드와 메모리를 점유하므로, 동시 커넥션이 약 100개를 넘으면
+# 처리량은 늘지 않고 스케줄러 대기(컨텍스트 스위칭)와 THREADPOOL 대기만 증가합니다.
+# 필요시 이 값을 조정할 수 있습니다.
+SQLSERVER_MAX_POOL_SIZE = 100
+
+# 이 행 수 이상의 배치 INSERT는 SQLServerBulkCopy로 한 번에 스트리밍 (미만은 JDBC 배치)
+SQLSERVER_BULK_COPY_MIN_ROWS = 500
+
+# java.sql.Types.VARCHAR 값 (Bulk Copy 컬럼 메타데이터용)
+JDBC_TYPE_VARCHAR = 12
+
+
+class SQLServerJDBCAdapter(BaseJDBCAdapter):
+    """SQL Server JDBC 어댑터
+
+    Microsoft SQL Server 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
+    IDENTITY 컬럼과 OUTPUT INSERTED.id 절을 사용하여 자동 증가 ID를 관리합니다.
+    """
 
-        Returns:
-            조회된 레코드 튜플, 없으면 None
-        """
-        if max_id <= 0:
-            return None
-        random_id = random.randint(1, max_id)
-        cursor.execute("SELECT id, thread_id, value_col FROM load_test WHERE id = ?", [random_id])
-        return cursor.fetchone()
+    __slots__ = ('_bulk_copy_classes',)
 
-    def execute_update(self, cursor, record_id: int) -> bool:
-        """레코드 UPDATE 실행
+    DB_TYPE = 'sqlserver'
+    DB_LABEL = 'SQL Server'
+    MAX_POOL_SIZE = SQLSERVER_MAX_POOL_SIZE
 
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 업데이트할 레코드 ID
+    # 실행 SQL (클래스 로드 시 한 번만 생성, PreparedStatement 캐시 키로도 사용)
+    SQL_INSERT = ("INSERT INTO load_test (thread_id, value_col, random_data, created_at) "
+                  "OUTPUT INSERTED.id VALUES (?, ?, ?, GETDATE())")
+    SQL_BATCH_INSERT = "INSERT INTO load_test (thread_id, value_col, random_data) VALUES (?, ?, ?)"
+    SQL_SELECT_BY_ID = "SELECT id, thread_id, value_col FROM load_test WHERE id = ?"
+    SQL_UPDATE = "UPDATE load_test SET value_col = ?, updated_at = GETDATE() WHERE id = ?"
+    SQL_DELETE = "DELETE FROM load_test WHERE id = ?"
+    SQL_MAX_ID = "SELECT ISNULL(MAX(id), 0) FROM load_test"
 
-        Returns:
-            업데이트 성공 시 True, 실패 시 False
-        """
-        cursor.execute("UPDATE load_test SET value_col = ? WHERE id = ?", [f'UPDATED_{record_id}', record_id])
-        return cursor.rowcount > 0
+    def __init__(self, jre_dir: str = './jre'):
+        super().__init__(jre_dir)
+        # Bulk Copy 관련 Java 클래스 (첫 사용 시 조회, 사용 불가하면 False)
+        self._bulk_copy_classes = None
 
-    def execute_delete(self, cursor, record_id: int) -> bool:
-        """레코드 DELETE 실행
+    def create_connection_pool(self, config: 'DatabaseConfig'):
+        # SQL Server JDBC 연결 URL 생성 (기본 포트: 1433)
+        jdbc_url = build_jdbc_url('sqlserver', config.host, config.port or 1433, database=config.database)
+        # JDBC 커넥션 풀 생성 및 설정 적용 (같은 URL의 열린 풀이 있으면 재사용)
+        return self._create_pool(config, jdbc_url)
 
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 삭제할 레코드 ID
+    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
+        # INSERT 쿼리 실행 (GETDATE()로 현재 시간 삽입, 캐시된 PreparedStatement 사용)
+        # OUTPUT INSERTED.id로 생성된 IDENTITY 값을 같은 응답에서 받아 SCOPE_IDENTITY() 조회 왕복 제거
+        ps = self._prepare(cursor, self.SQL_INSERT)
+        self._bind_params(ps, [*thread_jstrings(thread_id), random_data])
+        rs = ps.executeQuery()
+        try:
+            rs.next()
+            # 삽입된 ID 값 반환 (최대 ID 캐시 갱신)
+            return self._remember_max_id(int(rs.getLong(1)))
+        finally:
+            rs.close()
 
-        Returns:
-            삭제 성공 시 True, 실패 시 False
-        """
-        cursor.execute("DELETE FROM load_test WHERE id = ?", [record_id])
-        return cursor.rowcount > 0
+    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
+        """배치 INSERT 실행
 
-    def get_max_id(self, cursor) -> int:
-        """테이블의 최대 ID 조회
+        JDBC addBatch/executeBatch로 지정된 크기만큼 대량 삽입을 수행합니다.
+        드라이버의 Bulk Copy 전환(useBulkCopyForBatchInsert)은 모든 값이 파라미터인
+        INSERT에만 적용되므로 created_at은 컬럼 기본값(GETDATE())에 맡깁니다.
 
         Args:
             cursor: 데이터베이스 커서
+            thread_id: 워커 스레드 식별자
+            batch_size: 배치 크기 (삽입할 레코드 수)
 
         Returns:
-            최대 ID 값, 레코드가 없으면 0
+            삽입된 레코드 수 (batch_size)
         """
-        cursor.execute("SELECT IFNULL(MAX(id), 0) FROM load_test")
-        result = cursor.fetchone()
-        return int(result[0]) if result else 0
+        random_data = random_ascii(500)
+        if batch_size >= SQLSERVER_BULK_COPY_MIN_ROWS and self._get_bulk_copy_classes():
+            return self._execute_bulk_copy(cursor, thread_id, random_data, batch_size)
+        return self._execute_jdbc_batch(cursor, self.SQL_BATCH_INSERT,
+                                        [*thread_jstrings(thread_id), random_data], batch_size)
 
-    def get_random_id(self, cursor, max_id: int) -> int:
-        """랜덤 ID 생성
-
-        Args:
-            cursor: 데이터베이스 커서 (미사용)
-            max_id: 최대 ID 범위
+    def _get_bulk_copy_classes(self):
+        """SQLServerBulkCopy 관련 Java 클래스 조회 (최초 1회, 결과 캐시)
 
         Returns:
-            1과 max_id 사이의 랜덤 정수
+            (SQLServerBulkCopy, SQLServerBulkCSVFileRecord, ByteArrayInputStream) 튜플,
+            드라이버가 지원하지 않으면 None
         """
-        return random.randint(1, max_id) if max_id > 0 else 0
-
-    def commit(self, connection):
-        """트랜잭션 커밋
+        classes = self._bulk_copy_classes
+        if classes is None:
+            try:
+                classes = (
+                    jpype.JClass('com.microsoft.sqlserver.jdbc.SQLServerBulkCopy'),
+                    jpype.JClass('com.microsoft.sqlserver.jdbc.SQLServerBulkCSVFileRecord'),
+                    jpype.JClass('java.io.ByteArrayInputStream'),
+                )
+            except Exception as e:
+                logger.warning(f"SQLServerBulkCopy not available, using JDBC batch insert: {e}")
+                classes = False
+            self._bulk_copy_classes = classes
+        return classes or None
 
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        connection.commit()
+    def _execute_bulk_copy(self, cursor, thread_id: str, random_data: str, batch_size: int) -> int:
+        """SQLServerBulkCopy로 batch_size건을 한 번의 TDS Bulk Load로 삽입
 
-    def rollback(self, connection):
-        """트랜잭션 롤백
+        모든 행을 CSV 바이트로 만들어 메모리 스트림으로 전달하므로 행마다 Python→Java 호출이 없습니다.
+        created_at은 매핑하지 않아 컬럼 기본값(GETDATE())이 적용되며,
+        커넥션의 현재 트랜잭션에 참여하므로 커밋은 호출부에서 수행합니다.
 
         Args:
-            connection: 데이터베이스 커넥션
+            cursor: 데이터베이스 커서
+            thread_id: 워커 스레드 식별자 (쉼표 미포함)
+            random_data: 삽입할 랜덤 데이터 (영문자/숫자)
+            batch_size: 삽입할 레코드 수
+
+        Returns:
+            삽입된 레코드 수 (batch_size)
         """
+        bulk_copy_class, csv_record_class, input_stream_class = self._bulk_copy_classes
+        row = f"{thread_id},TEST_{thread_id},{random_data}\n"
+        record = csv_record_class(input_stream_class((row * batch_size).encode('ascii')),
+                                  'US-ASCII', ',', False)
+        record.addColumnMetadata(1, 'thread_id', JDBC_TYPE_VARCHAR, 50, 0)
+        record.addColumnMetadata(2, 'value_col', JDBC_TYPE_VARCHAR, 200, 0)
+        record.addColumnMetadata(3, 'random_data', JDBC_TYPE_VARCHAR, 1000, 0)
+        bulk_copy = bulk_copy_class(cursor._connection.jconn)
         try:
-            connection.rollback()
-        except:
-            pass
+            bulk_copy.setDestinationTableName('load_test')
+            bulk_copy.addColumnMapping(1, 'thread_id')
+            bulk_copy.addColumnMapping(2, 'value_col')
+            bulk_copy.addColumnMapping(3, 'random_data')
+            bulk_copy.writeToServer(record)
+        finally:
+            bulk_copy.close()
+            record.close()
+        return batch_size
 
     def get_ddl(self) -> str:
         """테이블 생성 DDL 반환
 
         Returns:
-            SingleStore용 테이블 생성 SQL 문자열
+            SQL Server용 테이블 생성 SQL 문자열
         """
         return """
--- SingleStore DDL
+-- SQL Server DDL
 CREATE TABLE load_test (
-    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
-    value_col VARCHAR(200), random_data VARCHAR(1000),
-    status VARCHAR(20) DEFAULT 'ACTIVE',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    PRIMARY KEY (id)
-) ENGINE=ColumnStore;
+    id BIGINT IDENTITY(1,1) NOT NULL, thread_id NVARCHAR(50) NOT NULL,
+    value_col NVARCHAR(200), random_data NVARCHAR(1000),
+    status NVARCHAR(20) DEFAULT 'ACTIVE',
+    created_at DATETIME2 DEFAULT GETDATE(), updated_at DATETIME2 DEFAULT GETDATE(),
+    CONSTRAINT PK_load_test PRIMARY KEY CLUSTERED (id)
+);
 """
 
     def setup_schema(self, connection):
         cursor = connection.cursor()
         try:
-            cursor.execute(
-                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = 'load_test'"
-            )
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                logger.info("SingleStore schema already exists - reusing existing schema")
+            # 현재 데이터베이스/기본 스키마 범위에서 메타데이터 API로 확인 (INFORMATION_SCHEMA 조회 불필요)
+            if self._table_exists(connection, 'load_test'):
+                logger.info("SQL Server schema already exists - reusing existing schema")
                 logger.info("  (DROP TABLE load_test to recreate, or use --truncate to clear data only)")
                 return
 
             cursor.execute("""
                 CREATE TABLE load_test (
-                    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
-                    value_col VARCHAR(200), random_data VARCHAR(1000),
-                    status VARCHAR(20) DEFAULT 'ACTIVE',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (id)
-                ) ENGINE=ColumnStore
+                    id BIGINT IDENTITY(1,1) NOT NULL, thread_id NVARCHAR(50) NOT NULL,
+                    value_col NVARCHAR(200), random_data NVARCHAR(1000),
+                    status NVARCHAR(20) DEFAULT 'ACTIVE',
+                    created_at DATETIME2 DEFAULT GETDATE(), updated_at DATETIME2 DEFAULT GETDATE(),
+                    CONSTRAINT PK_load_test PRIMARY KEY CLUSTERED (id)
+                )
             """)
             cursor.execute("CREATE INDEX idx_load_test_thread ON load_test(thread_id, created_at)")
             connection.commit()
-            logger.info("SingleStore schema created successfully")
+            logger.info("SQL Server schema created successfully")
         except Exception as e:
-            logger.error(f"Failed to setup SingleStore schema: {e}")
+            logger.error(f"Failed to setup SQL Server schema: {e}")
             raise
         finally:
             cursor.close()
 
     def truncate_table(self, connection):
-        """테이블 데이터 삭제 및 AUTO_INCREMENT 초기화
+        """테이블 데이터 삭제 및 IDENTITY 초기화
 
         load_test 테이블의 모든 데이터를 삭제하고
-        AUTO_INCREMENT를 1부터 다시 시작합니다.
+        IDENTITY를 1부터 다시 시작합니다.
 
         Args:
             connection: 데이터베이스 커넥션
@@ -3329,92 +3825,69 @@ CREATE TABLE load_test (
         try:
             cursor.execute("TRUNCATE TABLE load_test")
             connection.commit()
-            logger.info("Table load_test truncated and AUTO_INCREMENT reset to 1")
+            self._reset_max_id()
+            logger.info("Table load_test truncated and IDENTITY reset to 1")
         except Exception as e:
-            logger.error(f"Failed to truncate SingleStore table: {e}")
+            logger.error(f"Failed to truncate SQL Server table: {e}")
             raise
         finally:
             cursor.close()
 
 
 # ============================================================================
-# DB2 JDBC 어댑터
+# Tibero JDBC 어댑터
 # ============================================================================
-class DB2JDBCAdapter(DatabaseAdapter):
-    """IBM DB2 JDBC 어댑터
+# Tibero 커넥션 풀 크기 제한 상수
+# Tibero는 세션을 고정된 수의 워킹 스레드(WTHR_PER_PROC x 프로세스 수)로 처리하므로
+# 워킹 스레드보다 많은 커넥션은 서버 측 대기 큐에서 기다리기만 합니다.
+# 필요시 이 값을 조정할 수 있지만, 서버의 워킹 스레드 설정도 함께 조정해야 합니다.
+TIBERO_MAX_POOL_SIZE = 32
 
-    IBM DB2 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
-    """
-
-    def __init__(self, jre_dir: str = './jre'):
-        # 커넥션 풀 초기화 (None으로 시작)
-        self.pool: Optional[JDBCConnectionPool] = None
-        # DB2 JDBC 드라이버 JAR 파일 검색
-        jar_file = find_jdbc_jar('db2', jre_dir)
-        if not jar_file:
-            # JDBC 드라이버를 찾지 못한 경우 예외 발생
-            raise RuntimeError("DB2 JDBC driver not found")
-        self.jar_file: str = jar_file
 
-    def create_connection_pool(self, config: 'DatabaseConfig'):
-        # DB2 JDBC 연결 URL 생성 (기본 포트: 50000)
-        jdbc_url = JDBC_DRIVERS['db2'].url_template.format(
-            host=config.host, port=config.port or 50000, database=config.database
-        )
-        # JDBC 커넥션 풀 생성 및 설정 적용
-        self.pool = JDBCConnectionPool(
-            jdbc_url=jdbc_url, driver_class=JDBC_DRIVERS['db2'].driver_class,
-            jar_file=self.jar_file, user=config.user, password=config.password,
-            min_size=config.min_pool_size, max_size=config.max_pool_size,
-            max_lifetime_seconds=config.max_lifetime_seconds,
-            leak_detection_threshold_seconds=config.leak_detection_threshold_seconds,
-            idle_check_interval_seconds=config.idle_check_interval_seconds,
-            idle_timeout_seconds=config.idle_timeout_seconds,
-            keepalive_time_seconds=config.keepalive_time_seconds
-        )
-        return self.pool
+class TiberoJDBCAdapter(BaseJDBCAdapter):
+    """Tibero JDBC 어댑터
 
-    def get_connection(self):
-        # 풀이 초기화되지 않은 경우 예외 발생
-        if not self.pool:
-            raise RuntimeError("Connection pool not initialized")
-        # 풀에서 커넥션 획득
-        return self.pool.acquire()
+    Tibero 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
+    Oracle과 호환되는 시퀀스(LOAD_TEST_SEQ)와 SYSTIMESTAMP를 사용합니다.
+    """
 
-    def release_connection(self, connection, is_error: bool = False):
-        if connection and self.pool:
-            try:
-                if is_error:
-                    connection.rollback()
-                self.pool.release(connection)
-            except:
-                pass
+    __slots__ = ()
 
-    def discard_connection(self, connection):
-        if connection and self.pool:
-            self.pool.discard(connection)
+    DB_TYPE = 'tibero'
+    DB_LABEL = 'Tibero'
+    MAX_POOL_SIZE = TIBERO_MAX_POOL_SIZE
 
-    def close_pool(self):
-        if self.pool:
-            self.pool.close_all()
+    # 실행 SQL (클래스 로드 시 한 번만 생성, PreparedStatement 캐시 키로도 사용)
+    SQL_INSERT = ("BEGIN INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT) "
+                  "VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP) RETURNING ID INTO ?; END;")
+    SQL_BATCH_INSERT = ("INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT) "
+                        "VALUES (LOAD_TEST_SEQ.NEXTVAL, ?, ?, ?, SYSTIMESTAMP)")
+    SQL_SELECT_BY_ID = "SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?"
+    SQL_UPDATE = "UPDATE LOAD_TEST SET VALUE_COL = ?, UPDATED_AT = SYSTIMESTAMP WHERE ID = ?"
+    SQL_DELETE = "DELETE FROM LOAD_TEST WHERE ID = ?"
+    SQL_MAX_ID = "SELECT NVL(MAX(ID), 0) FROM LOAD_TEST"
 
-    def get_pool_stats(self) -> Dict[str, Union[int, str]]:
-        return self.pool.get_pool_stats() if self.pool else {}
+    def create_connection_pool(self, config: 'DatabaseConfig'):
+        # Tibero JDBC 연결 URL 생성 (기본 포트: 8629)
+        jdbc_url = build_jdbc_url('tibero', config.host, config.port or 8629, sid=config.sid or config.database)
+        # JDBC 커넥션 풀 생성 및 설정 적용 (같은 URL의 열린 풀이 있으면 재사용)
+        return self._create_pool(config, jdbc_url)
 
     def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
-        cursor.execute("""
-            INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT)
-            VALUES (NEXT VALUE FOR LOAD_TEST_SEQ, ?, ?, ?, CURRENT TIMESTAMP)
-        """, [thread_id, f'TEST_{thread_id}', random_data])
-
-        cursor.execute("SELECT PREVIOUS VALUE FOR LOAD_TEST_SEQ FROM SYSIBM.SYSDUMMY1")
-        result = cursor.fetchone()
-        return int(result[0]) if result else -1
+        # INSERT 쿼리 실행 (시퀀스로 ID 생성, SYSTIMESTAMP로 현재 시간 삽입, 캐시된 CallableStatement 사용)
+        # RETURNING INTO OUT 파라미터로 생성된 ID를 받아 CURRVAL 조회 왕복 제거
+        cs = self._prepare(cursor, self.SQL_INSERT, call=True)
+        self._bind_params(cs, [*thread_jstrings(thread_id), random_data])
+        cs.registerOutParameter(4, JDBC_TYPE_BIGINT)
+        cs.execute()
+        # 삽입된 ID 값 반환 (최대 ID 캐시 갱신)
+        return self._remember_max_id(int(cs.getLong(4)))
 
     def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
         """배치 INSERT 실행
 
-        지정된 크기만큼 INSERT 문을 반복 실행하여 대량 삽입을 수행합니다.
+        JDBC addBatch/executeBatch로 지정된 크기만큼 대량 삽입을 수행합니다.
+        ID는 행마다 시퀀스 NEXTVAL로 생성됩니다.
 
         Args:
             cursor: 데이터베이스 커서
@@ -3424,123 +3897,269 @@ class DB2JDBCAdapter(DatabaseAdapter):
         Returns:
             삽입된 레코드 수 (batch_size)
         """
-        random_data = ''.join(random.choices(string.ascii_letters + string.digits, k=500))
-        for _ in range(batch_size):
+        # 500자 랜덤 문자열 생성 (배치 전체에서 동일하게 사용)
+        random_data = random_ascii(500)
+        # 동일한 파라미터로 batch_size건을 JDBC 배치로 전송
+        return self._execute_jdbc_batch(cursor, self.SQL_BATCH_INSERT,
+                                        [*thread_jstrings(thread_id), random_data], batch_size)
+
+    def get_ddl(self) -> str:
+        """테이블 생성 DDL 반환
+
+        Returns:
+            Tibero용 테이블 생성 SQL 문자열
+        """
+        return """
+-- Tibero DDL
+CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER;
+CREATE TABLE LOAD_TEST (
+    ID NUMBER(19) NOT NULL, THREAD_ID VARCHAR2(50) NOT NULL,
+    VALUE_COL VARCHAR2(200), RANDOM_DATA VARCHAR2(1000),
+    STATUS VARCHAR2(20) DEFAULT 'ACTIVE',
+    CREATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP, UPDATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP
+) PARTITION BY HASH (ID) PARTITIONS 16 ENABLE ROW MOVEMENT;
+ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID);
+"""
+
+    def setup_schema(self, connection):
+        cursor = connection.cursor()
+        try:
+            # 테이블/시퀀스 존재 여부를 스칼라 서브쿼리로 한 번에 조회 (왕복 1회)
             cursor.execute("""
-                INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT)
-                VALUES (NEXT VALUE FOR LOAD_TEST_SEQ, ?, ?, ?, CURRENT TIMESTAMP)
-            """, [thread_id, f'TEST_{thread_id}', random_data])
-        return batch_size
+                SELECT (SELECT COUNT(*) FROM USER_TABLES WHERE TABLE_NAME = 'LOAD_TEST'),
+                       (SELECT COUNT(*) FROM USER_SEQUENCES WHERE SEQUENCE_NAME = 'LOAD_TEST_SEQ')
+                FROM DUAL
+            """)
+            result = cursor.fetchone()
+            table_exists = bool(result and result[0] > 0)
+            seq_exists = bool(result and result[1] > 0)
 
-    def execute_select(self, cursor, record_id: int) -> Optional[tuple]:
-        """단일 레코드 조회
+            if table_exists and seq_exists:
+                logger.info("Tibero schema already exists - reusing existing schema")
+                logger.info("  (DROP objects manually to recreate, or use --truncate to clear data only)")
+                return
 
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 조회할 레코드 ID
+            if seq_exists:
+                try:
+                    cursor.execute("DROP SEQUENCE LOAD_TEST_SEQ")
+                except:
+                    pass
+            if table_exists:
+                try:
+                    cursor.execute("DROP TABLE LOAD_TEST PURGE")
+                except:
+                    pass
 
-        Returns:
-            조회된 레코드 튜플, 없으면 None
+            cursor.execute("CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER")
+            cursor.execute("""
+                CREATE TABLE LOAD_TEST (
+                    ID NUMBER(19) NOT NULL, THREAD_ID VARCHAR2(50) NOT NULL,
+                    VALUE_COL VARCHAR2(200), RANDOM_DATA VARCHAR2(1000),
+                    STATUS VARCHAR2(20) DEFAULT 'ACTIVE',
+                    CREATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP,
+                    UPDATED_AT TIMESTAMP DEFAULT SYSTIMESTAMP
+                ) PARTITION BY HASH (ID) PARTITIONS 16 ENABLE ROW MOVEMENT
+            """)
+            cursor.execute("ALTER TABLE LOAD_TEST ADD CONSTRAINT PK_LOAD_TEST PRIMARY KEY (ID)")
+            cursor.execute("CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT) LOCAL")
+            connection.commit()
+            logger.info("Tibero schema created successfully")
+        except Exception as e:
+            # 스키마 생성 실패 시 에러 로그 출력 및 예외 재발생
+            logger.error(f"Failed to setup Tibero schema: {e}")
+            raise
+        finally:
+            # 커서 리소스 정리
+            cursor.close()
+
+    def truncate_table(self, connection):
+        """테이블 데이터 삭제 및 시퀀스 초기화
+
+        LOAD_TEST 테이블의 모든 데이터를 삭제하고
+        LOAD_TEST_SEQ 시퀀스를 1부터 다시 시작합니다.
+
+        Args:
+            connection: 데이터베이스 커넥션
         """
-        cursor.execute("SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?", [record_id])
-        return cursor.fetchone()
+        cursor = connection.cursor()
+        try:
+            # 테이블의 모든 데이터 삭제 (빠른 삭제)
+            cursor.execute("TRUNCATE TABLE LOAD_TEST")
+            # 기존 시퀀스 삭제
+            cursor.execute("DROP SEQUENCE LOAD_TEST_SEQ")
+            # 시퀀스를 1부터 다시 생성 (캐시 1000, 순환 없음, 순서 보장)
+            cursor.execute("CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NOCYCLE ORDER")
+            # 변경사항 커밋
+            connection.commit()
+            # 최대 ID 캐시 초기화
+            self._reset_max_id()
+            logger.info("Table LOAD_TEST truncated and sequence LOAD_TEST_SEQ reset to 1")
+        except Exception as e:
+            # 테이블 초기화 실패 시 에러 로그 출력 및 예외 재발생
+            logger.error(f"Failed to truncate Tibero table: {e}")
+            raise
+        finally:
+            # 커서 리소스 정리
+            cursor.close()
+
+
+# ============================================================================
+# SingleStore JDBC 어댑터
+# ============================================================================
+# SingleStore 커넥션 풀 크기 제한 상수
+# 이 제한은 SingleStore의 기본 설정과 관련됩니다.
+# 필요시 이 값을 조정할 수 있습니다.
+SINGLESTORE_MAX_POOL_SIZE = 64
+
+# 다중 행 VALUES INSERT로 전환하는 최소 배치 크기
+# ColumnStore 테이블은 큰 단위로 적재할수록 작은 세그먼트 생성과 백그라운드 병합이 줄어듦
+SINGLESTORE_MULTI_ROW_MIN_ROWS = 1000
 
-    def execute_random_select(self, cursor, max_id: int) -> Optional[tuple]:
-        """랜덤 레코드 조회
 
-        Args:
-            cursor: 데이터베이스 커서
-            max_id: 조회 가능한 최대 ID
+class SingleStoreJDBCAdapter(BaseJDBCAdapter):
+    """SingleStore JDBC 어댑터
 
-        Returns:
-            조회된 레코드 튜플, 없으면 None
-        """
-        if max_id <= 0:
-            return None
-        random_id = random.randint(1, max_id)
-        cursor.execute("SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?", [random_id])
-        return cursor.fetchone()
+    SingleStore 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
+    SingleStore는 MySQL 프로토콜과 호환되므로 MySQL과 유사한 SQL을 사용합니다.
+    """
 
-    def execute_update(self, cursor, record_id: int) -> bool:
-        """레코드 UPDATE 실행
+    __slots__ = ()
 
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 업데이트할 레코드 ID
+    DB_TYPE = 'singlestore'
+    DB_LABEL = 'SingleStore'
+    MAX_POOL_SIZE = SINGLESTORE_MAX_POOL_SIZE
 
-        Returns:
-            업데이트 성공 시 True, 실패 시 False
-        """
-        cursor.execute(
-            "UPDATE LOAD_TEST SET VALUE_COL = ?, UPDATED_AT = CURRENT TIMESTAMP WHERE ID = ?",
-            [f'UPDATED_{record_id}', record_id]
-        )
-        return cursor.rowcount > 0
+    # 실행 SQL (클래스 로드 시 한 번만 생성, PreparedStatement 캐시 키로도 사용)
+    SQL_INSERT = ("INSERT INTO load_test (thread_id, value_col, random_data, created_at) "
+                  "VALUES (?, ?, ?, NOW())")
+    SQL_BATCH_INSERT_HEAD = "INSERT INTO load_test (thread_id, value_col, random_data, created_at) VALUES "
+    SQL_BATCH_INSERT_ROW = "(?, ?, ?, NOW())"
+    SQL_SELECT_BY_ID = "SELECT id, thread_id, value_col FROM load_test WHERE id = ?"
+    SQL_UPDATE = "UPDATE load_test SET value_col = ? WHERE id = ?"
+    SQL_DELETE = "DELETE FROM load_test WHERE id = ?"
+    SQL_MAX_ID = "SELECT IFNULL(MAX(id), 0) FROM load_test"
 
-    def execute_delete(self, cursor, record_id: int) -> bool:
-        """레코드 DELETE 실행
+    def create_connection_pool(self, config: 'DatabaseConfig'):
+        # SingleStore JDBC 연결 URL 생성 (기본 포트: 3306)
+        jdbc_url = build_jdbc_url('singlestore', config.host, config.port or 3306, database=config.database)
+        # 배치 재작성 옵션 추가
+        jdbc_url = append_jdbc_url_params(jdbc_url, SINGLESTORE_URL_PARAMS)
 
-        Args:
-            cursor: 데이터베이스 커서
-            record_id: 삭제할 레코드 ID
+        # JDBC 커넥션 풀 생성 및 설정 적용 (같은 URL의 열린 풀이 있으면 재사용)
+        # 풀 크기는 MAX_POOL_SIZE로 제한 (초과 요청 시 경고 로그 출력)
+        return self._create_pool(config, jdbc_url)
 
-        Returns:
-            삭제 성공 시 True, 실패 시 False
-        """
-        cursor.execute("DELETE FROM LOAD_TEST WHERE ID = ?", [record_id])
-        return cursor.rowcount > 0
+    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
+        # INSERT 쿼리 실행 (NOW()로 현재 시간 삽입, 캐시된 PreparedStatement 사용)
+        # AUTO_INCREMENT 값은 INSERT 응답(OK 패킷)에 포함되므로 getGeneratedKeys()로 읽어 LAST_INSERT_ID() 조회 왕복 제거
+        ps = self._prepare(cursor, self.SQL_INSERT, generated_keys=True)
+        self._bind_params(ps, [*thread_jstrings(thread_id), random_data])
+        ps.executeUpdate()
+        rs = ps.getGeneratedKeys()
+        try:
+            rs.next()
+            # 삽입된 ID 값 반환 (최대 ID 캐시 갱신)
+            return self._remember_max_id(int(rs.getLong(1)))
+        finally:
+            rs.close()
 
-    def get_max_id(self, cursor) -> int:
-        """테이블의 최대 ID 조회
+    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
+        """배치 INSERT 실행
+
+        JDBC addBatch/executeBatch로 지정된 크기만큼 대량 삽입을 수행합니다.
+        (rewriteBatchedStatements로 드라이버가 multi-row INSERT로 재작성)
+        SINGLESTORE_MULTI_ROW_MIN_ROWS건 이상이면 드라이버 재작성에 의존하지 않고
+        최대 2000행 단위의 다중 행 VALUES 문장으로 직접 삽입합니다.
 
         Args:
             cursor: 데이터베이스 커서
+            thread_id: 워커 스레드 식별자
+            batch_size: 배치 크기 (삽입할 레코드 수)
 
         Returns:
-            최대 ID 값, 레코드가 없으면 0
+            삽입된 레코드 수 (batch_size)
         """
-        cursor.execute("SELECT COALESCE(MAX(ID), 0) FROM LOAD_TEST")
-        result = cursor.fetchone()
-        return int(result[0]) if result else 0
-
-    def get_random_id(self, cursor, max_id: int) -> int:
-        """랜덤 ID 생성
+        random_data = random_ascii(500)
+        params = [*thread_jstrings(thread_id), random_data]
+        if batch_size >= SINGLESTORE_MULTI_ROW_MIN_ROWS:
+            return self._execute_multi_row_insert(
+                cursor, self.SQL_BATCH_INSERT_HEAD, self.SQL_BATCH_INSERT_ROW, params, batch_size,
+                MULTI_ROW_INSERT_MAX_PARAMS['singlestore'])
+        return self._execute_jdbc_batch(cursor, self.SQL_INSERT, params, batch_size)
 
-        Args:
-            cursor: 데이터베이스 커서 (미사용)
-            max_id: 최대 ID 범위
+    def get_ddl(self) -> str:
+        """테이블 생성 DDL 반환
 
         Returns:
-            1과 max_id 사이의 랜덤 정수
+            SingleStore용 테이블 생성 SQL 문자열
         """
-        return random.randint(1, max_id) if max_id > 0 else 0
+        return """
+-- SingleStore DDL
+CREATE TABLE load_test (
+    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
+    value_col VARCHAR(200), random_data VARCHAR(1000),
+    status VARCHAR(20) DEFAULT 'ACTIVE',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+) ENGINE=ColumnStore;
+"""
 
-    def commit(self, connection):
-        """트랜잭션 커밋
+    def setup_schema(self, connection):
+        cursor = connection.cursor()
+        try:
+            # 현재 데이터베이스 범위에서 메타데이터 API로 확인 (information_schema 조회 불필요)
+            if self._table_exists(connection, 'load_test'):
+                logger.info("SingleStore schema already exists - reusing existing schema")
+                logger.info("  (DROP TABLE load_test to recreate, or use --truncate to clear data only)")
+                return
 
-        Args:
-            connection: 데이터베이스 커넥션
-        """
-        connection.commit()
+            cursor.execute("""
+                CREATE TABLE load_test (
+                    id BIGINT NOT NULL AUTO_INCREMENT, thread_id VARCHAR(50) NOT NULL,
+                    value_col VARCHAR(200), random_data VARCHAR(1000),
+                    status VARCHAR(20) DEFAULT 'ACTIVE',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (id)
+                ) ENGINE=ColumnStore
+            """)
+            cursor.execute("CREATE INDEX idx_load_test_thread ON load_test(thread_id, created_at)")
+            connection.commit()
+            logger.info("SingleStore schema created successfully")
+        except Exception as e:
+            logger.error(f"Failed to setup SingleStore schema: {e}")
+            raise
+        finally:
+            cursor.close()
 
-    def rollback(self, connection):
-        """트랜잭션 롤백
+    def truncate_table(self, connection):
+        """테이블 데이터 삭제 및 AUTO_INCREMENT 초기화
+
+        load_test 테이블의 모든 데이터를 삭제하고
+        AUTO_INCREMENT를 1부터 다시 시작합니다.
 
         Args:
             connection: 데이터베이스 커넥션
         """
+        cursor = connection.cursor()
         try:
-            connection.rollback()
-        except:
-            pass
+            cursor.execute("TRUNCATE TABLE load_test")
+            connection.commit()
+            self._reset_max_id()
+            logger.info("Table load_test truncated and AUTO_INCREMENT reset to 1")
+        except Exception as e:
+            logger.error(f"Failed to truncate SingleStore table: {e}")
+            raise
+        finally:
+            cursor.close()
 
-    def get_ddl(self) -> str:
-        """테이블 생성 DDL 반환
 
-        Returns:
-            DB2용 테이블 생성 SQL 문자열
-        """
-        return """
+# ============================================================================
+# DB2 JDBC 어댑터
+# ============================================================================
+# DB2 스키마 DDL (get_ddl 출력과 setup_schema 실행이 같은 정의를 사용)
+DB2_DDL = """
 -- IBM DB2 DDL
 CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NO CYCLE ORDER;
 
@@ -3558,21 +4177,93 @@ CREATE TABLE LOAD_TEST (
 CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT);
 """
 
+# DB2_DDL을 모듈 로드 시 한 번만 문장 단위로 분리 (주석 줄 제외, 끝의 세미콜론 없이)
+# DB2 JDBC 드라이버는 다중 문장 실행을 지원하지 않으므로 문장별로 실행
+DB2_DDL_STATEMENTS = tuple(
+    statement for statement in (
+        '\n'.join(line for line in chunk.splitlines() if not line.lstrip().startswith('--')).strip()
+        for chunk in DB2_DDL.split(';')
+    ) if statement
+)
+
+
+class DB2JDBCAdapter(BaseJDBCAdapter):
+    """IBM DB2 JDBC 어댑터
+
+    IBM DB2 데이터베이스에 JDBC를 통해 연결하고 SQL을 실행합니다.
+    """
+
+    __slots__ = ()
+
+    DB_TYPE = 'db2'
+    DB_LABEL = 'DB2'
+
+    # 단건 조회는 1행만 받도록 지정 (캐시된 PreparedStatement 조회 경로에서 적용)
+    SINGLE_ROW_FETCH_SIZE = 1
+
+    # 실행 SQL (클래스 로드 시 한 번만 생성, PreparedStatement 캐시 키로도 사용)
+    SQL_INSERT = ("SELECT ID FROM FINAL TABLE ("
+                  "INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT) "
+                  "VALUES (NEXT VALUE FOR LOAD_TEST_SEQ, ?, ?, ?, CURRENT TIMESTAMP))")
+    SQL_BATCH_INSERT_HEAD = "INSERT INTO LOAD_TEST (ID, THREAD_ID, VALUE_COL, RANDOM_DATA, CREATED_AT) VALUES "
+    SQL_BATCH_INSERT_ROW = "(NEXT VALUE FOR LOAD_TEST_SEQ, ?, ?, ?, CURRENT TIMESTAMP)"
+    SQL_SELECT_BY_ID = "SELECT ID, THREAD_ID, VALUE_COL FROM LOAD_TEST WHERE ID = ?"
+    SQL_UPDATE = "UPDATE LOAD_TEST SET VALUE_COL = ?, UPDATED_AT = CURRENT TIMESTAMP WHERE ID = ?"
+    SQL_DELETE = "DELETE FROM LOAD_TEST WHERE ID = ?"
+    SQL_MAX_ID = "SELECT COALESCE(MAX(ID), 0) FROM LOAD_TEST"
+
+    def create_connection_pool(self, config: 'DatabaseConfig'):
+        # DB2 JDBC 연결 URL 생성 (기본 포트: 50000, 같은 접속 정보는 캐시된 URL 재사용)
+        jdbc_url = build_jdbc_url('db2', config.host, config.port or 50000, database=config.database)
+        # JDBC 커넥션 풀 생성 및 설정 적용 (같은 URL의 열린 풀이 있으면 재사용)
+        return self._create_pool(config, jdbc_url)
+
+    def execute_insert(self, cursor, thread_id: str, random_data: str) -> int:
+        # SELECT ... FROM FINAL TABLE (INSERT ...)로 INSERT와 생성된 ID 조회를 한 번의 왕복으로 처리
+        # (INSERT 후 PREVIOUS VALUE FOR를 따로 조회하면 왕복이 2회 발생)
+        new_id = self._query_scalar_long(cursor, self.SQL_INSERT, [*thread_jstrings(thread_id), random_data])
+        return self._remember_max_id(new_id) if new_id else -1
+
+    def execute_batch_insert(self, cursor, thread_id: str, batch_size: int) -> int:
+        """배치 INSERT 실행
+
+        행마다 왕복하는 대신 다중 행 VALUES (...), (...) INSERT 한 문장에 여러 행을 담아
+        전송합니다. (DB2 드라이버는 JDBC 배치를 다중 행 INSERT로 재작성하지 않음)
+
+        Args:
+            cursor: 데이터베이스 커서
+            thread_id: 워커 스레드 식별자
+            batch_size: 배치 크기 (삽입할 레코드 수)
+
+        Returns:
+            삽입된 레코드 수
+        """
+        random_data = random_ascii(500)
+        return self._execute_multi_row_insert(
+            cursor, self.SQL_BATCH_INSERT_HEAD, self.SQL_BATCH_INSERT_ROW,
+            [*thread_jstrings(thread_id), random_data], batch_size,
+            MULTI_ROW_INSERT_MAX_PARAMS['db2'])
+
+    def get_ddl(self) -> str:
+        """테이블 생성 DDL 반환
+
+        Returns:
+            DB2용 테이블 생성 SQL 문자열
+        """
+        return DB2_DDL
+
     def setup_schema(self, connection):
         cursor = connection.cursor()
         try:
-            table_exists = False
-            seq_exists = False
-
-            cursor.execute("SELECT COUNT(*) FROM SYSCAT.TABLES WHERE TABNAME = 'LOAD_TEST'")
-            result = cursor.fetchone()
-            if result and result[0] > 0:
-                table_exists = True
-
-            cursor.execute("SELECT COUNT(*) FROM SYSCAT.SEQUENCES WHERE SEQNAME = 'LOAD_TEST_SEQ'")
+            # 테이블/시퀀스 존재 여부를 스칼라 서브쿼리로 한 번에 조회 (왕복 1회)
+            cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM SYSCAT.TABLES WHERE TABNAME = 'LOAD_TEST'),
+                       (SELECT COUNT(*) FROM SYSCAT.SEQUENCES WHERE SEQNAME = 'LOAD_TEST_SEQ')
+                FROM SYSIBM.SYSDUMMY1
+            """)
             result = cursor.fetchone()
-            if result and result[0] > 0:
-                seq_exists = True
+            table_exists = bool(result and result[0] > 0)
+            seq_exists = bool(result and result[1] > 0)
 
             if table_exists and seq_exists:
                 logger.info("DB2 schema already exists - reusing existing schema")
@@ -3590,20 +4281,8 @@ CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT);
                 except:
                     pass
 
-            cursor.execute("CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NO CYCLE ORDER")
-            cursor.execute("""
-                CREATE TABLE LOAD_TEST (
-                    ID BIGINT NOT NULL,
-                    THREAD_ID VARCHAR(50) NOT NULL,
-                    VALUE_COL VARCHAR(200),
-                    RANDOM_DATA VARCHAR(1000),
-                    STATUS VARCHAR(20) DEFAULT 'ACTIVE',
-                    CREATED_AT TIMESTAMP DEFAULT CURRENT TIMESTAMP,
-                    UPDATED_AT TIMESTAMP DEFAULT CURRENT TIMESTAMP,
-                    PRIMARY KEY (ID)
-                )
-            """)
-            cursor.execute("CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT)")
+            for statement in DB2_DDL_STATEMENTS:
+                cursor.execute(statement)
             connection.commit()
             logger.info("DB2 schema created successfully")
         except Exception as e:
@@ -3625,9 +4304,10 @@ CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT);
         cursor = connection.cursor()
         try:
             cursor.execute("TRUNCATE TABLE LOAD_TEST IMMEDIATE")
-            cursor.execute("DROP SEQUENCE LOAD_TEST_SEQ")
-            cursor.execute("CREATE SEQUENCE LOAD_TEST_SEQ START WITH 1 INCREMENT BY 1 CACHE 1000 NO CYCLE ORDER")
+            # 시퀀스를 DROP/CREATE하지 않고 RESTART로 초기화 (카탈로그 변경 없이 DDL 1문장)
+            cursor.execute("ALTER SEQUENCE LOAD_TEST_SEQ RESTART WITH 1")
             connection.commit()
+            self._reset_max_id()
             logger.info("Table LOAD_TEST truncated and sequence LOAD_TEST_SEQ reset to 1")
         except Exception as e:
             logger.error(f"Failed to truncate DB2 table: {e}")
@@ -3638,7 +4318,7 @@ CREATE INDEX IDX_LOAD_TEST_THREAD ON LOAD_TEST(THREAD_ID, CREATED_AT);
 
 # 설정 클래스
 # ============================================================================
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """데이터베이스 연결 설정
 
@@ -3656,6 +4336,8 @@ class DatabaseConfig:
         max_lifetime_seconds: 커넥션 최대 수명 (초, 기본 30분)
         leak_detection_threshold_seconds: Leak 감지 임계값 (초, 기본 60초)
         idle_check_interval_seconds: 유휴 커넥션 Health Check 주기 (초, 기본 30초)
+
+    실행 중 변경되지 않는 값이므로 frozen으로 고정하고, 슬롯으로 인스턴스 __dict__를 제거합니다.
     """
     db_type: str
     host: str
@@ -3691,14 +4373,28 @@ class LoadTestWorker:
         ERROR_LOG_INTERVAL_MS: 에러 로그 출력 간격 (밀리초)
         MAX_CONNECTION_RETRIES: 커넥션 획득 최대 재시도 횟수
         MAX_BACKOFF_MS: 최대 백오프 시간 (밀리초)
+        BACKOFF_STEPS_MS: 지수 백오프 단계별 대기 시간 (밀리초)
+        VALIDATE_EVERY_N_OPS: 보유 커넥션 유효성 검사 주기 (트랜잭션 수)
+        MIXED_CDF: MIXED 모드 작업 비율의 누적 분포 경계
     """
     ERROR_LOG_INTERVAL_MS = 10000
     MAX_CONNECTION_RETRIES = 3
     MAX_BACKOFF_MS = 5000
+    # 지수 백오프 대기 시간 테이블 (100ms에서 2배씩 증가, MAX_BACKOFF_MS에서 고정)
+    # 실패 시 인덱스만 한 칸 전진하므로 에러 경로에서 곱셈/min/나눗셈을 반복하지 않음
+    BACKOFF_STEPS_MS = (100, 200, 400, 800, 1600, 3200, MAX_BACKOFF_MS)
+    _BACKOFF_STEPS_SEC = tuple(ms / 1000.0 for ms in BACKOFF_STEPS_MS)
+    # isValid()는 드라이버에 따라 서버 왕복(ping)을 유발하므로 매 작업마다 호출하지 않음
+    # 작업 실패 시에는 주기와 관계없이 즉시 검사하고, 연속 실패 시 커넥션을 폐기함
+    VALIDATE_EVERY_N_OPS = 50
+    # MIXED 모드 작업 선택용 누적 분포 경계 (INSERT 60%, SELECT 20%, UPDATE 15%, DELETE 5%)
+    # bisect_right(MIXED_CDF, r)가 _mix_ops의 인덱스(0: INSERT ~ 3: DELETE)가 됨
+    MIXED_CDF = (0.60, 0.80, 0.95)
 
     def __init__(self, worker_id: int, db_adapter: DatabaseAdapter, end_time: datetime,
                  mode: str = WorkMode.FULL, max_id_cache: int = 0, batch_size: int = 1,
-                 rate_limiter: Optional[RateLimiter] = None, ramp_up_end_time: Optional[datetime] = None):
+                 rate_limiter: Optional[RateLimiter] = None, ramp_up_end_time: Optional[datetime] = None,
+                 commit_every: int = 0):
         """LoadTestWorker 초기화
 
         Args:
@@ -3710,6 +4406,7 @@ class LoadTestWorker:
             batch_size: 배치 INSERT 크기
             rate_limiter: 속도 제한기 (옵션)
             ramp_up_end_time: Ramp-up 종료 시간 (옵션)
+            commit_every: 배치 INSERT 커밋 단위 행 수 (0이면 배치당 1회 커밋)
         """
         self.worker_id = worker_id
         self.db_adapter = db_adapter
@@ -3717,13 +4414,36 @@ class LoadTestWorker:
         self.mode = mode
         self.max_id_cache = max_id_cache
         self.batch_size = batch_size
+        self.commit_every = commit_every
         self.rate_limiter = rate_limiter
         self.ramp_up_end_time = ramp_up_end_time
         self.thread_name = f"Worker-{worker_id:04d}"
         self.transaction_count = 0
         self.last_error_log_time = 0
         self.suppressed_error_count = 0
-        self.current_backoff_ms = 100
+        self._backoff_step = 0  # BACKOFF_STEPS_MS 인덱스
+        # 커넥션 → jconn.isValid 바운드 메서드 캐시 (JPype 속성 탐색을 커넥션당 1회로 제한)
+        # isValid를 지원하지 않는 드라이버는 None으로 기록되며, 폐기된 커넥션은 GC 시 자동 제거됨
+        self._is_valid_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # 커넥션 → 재사용 커서 캐시 (작업마다 cursor()/close()를 반복하지 않음)
+        self._cursor_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # 모드별 작업 메서드를 초기화 시 1회 결정하여 run() 루프의 모드 비교를 제거
+        # 모든 작업 메서드는 (connection, max_id) 시그니처를 가지며, 미지정 모드는 FULL로 처리
+        self._op: Callable[[Any, int], bool] = {
+            WorkMode.INSERT_ONLY: self.execute_insert,
+            WorkMode.SELECT_ONLY: self.execute_select,
+            WorkMode.UPDATE_ONLY: self.execute_update,
+            WorkMode.DELETE_ONLY: self.execute_delete,
+            WorkMode.MIXED: self.execute_mixed,
+        }.get(mode, self.execute_full)
+        # MIXED 모드 작업 메서드 (MIXED_CDF 구간 순서와 동일)
+        self._mix_ops: Tuple[Callable[[Any, int], bool], ...] = (
+            self.execute_insert, self.execute_select, self.execute_update, self.execute_delete)
+        # 워커 전용 난수 생성기 (전역 random 인스턴스를 스레드 간에 공유하지 않음)
+        self._random: Callable[[], float] = random.Random().random
+        # SELECT/UPDATE/DELETE/MIXED 모드: 기존 데이터 필요
+        self._needs_data = mode in (WorkMode.SELECT_ONLY, WorkMode.UPDATE_ONLY,
+                                    WorkMode.DELETE_ONLY, WorkMode.MIXED)
 
     def generate_random_data(self, length: int = 500) -> str:
         """테스트용 랜덤 문자열 생성
@@ -3734,7 +4454,7 @@ class LoadTestWorker:
         Returns:
             영문자와 숫자로 구성된 랜덤 문자열
         """
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return random_ascii(length)
 
     def is_during_ramp_up(self) -> bool:
         """Ramp-up 기간 여부 확인
@@ -3755,20 +4475,61 @@ class LoadTestWorker:
         Returns:
             유효하면 True, 그렇지 않으면 False
         """
+        if connection is None:
+            return False
         try:
-            if connection is None:
-                return False
-            jconn = connection.jconn
-            if hasattr(jconn, 'isValid'):
-                is_valid = jconn.isValid(self.db_adapter.validation_timeout)
-                if not is_valid:
-                    logger.debug(f"[{self.thread_name}] Connection validation failed (isValid=False)")
-                return is_valid
-            return True
+            try:
+                is_valid_method = self._is_valid_cache[connection]
+            except KeyError:
+                is_valid_method = getattr(connection.jconn, 'isValid', None)
+                self._is_valid_cache[connection] = is_valid_method
+            if is_valid_method is None:
+                return True
+            is_valid = is_valid_method(self.db_adapter.validation_timeout)
+            if not is_valid:
+                logger.debug("[%s] Connection validation failed (isValid=False)", self.thread_name)
+            return is_valid
         except Exception as e:
-            logger.debug(f"[{self.thread_name}] Connection validation error: {e}")
+            logger.debug("[%s] Connection validation error: %s", self.thread_name, e)
             return False
 
+    def _get_cursor(self, connection):
+        """커넥션에 캐시된 커서 반환 (없으면 생성하여 캐시)
+
+        커넥션은 워커 하나가 독점하므로 커서도 작업 간에 재사용할 수 있습니다.
+
+        Args:
+            connection: 데이터베이스 커넥션
+
+        Returns:
+            재사용 가능한 커서 객체
+
+        Raises:
+            RuntimeError: 커넥션이 None인 경우 (호출한 작업 메서드의 에러 처리 경로로 전달)
+        """
+        if connection is None:
+            raise RuntimeError("No database connection")
+        cursor = self._cursor_cache.get(connection)
+        if cursor is None:
+            cursor = self._cursor_cache[connection] = connection.cursor()
+        return cursor
+
+    def _drop_cursor(self, connection):
+        """캐시된 커서를 닫고 캐시에서 제거 (작업 에러, 커넥션 폐기/반납 시 호출)
+
+        Args:
+            connection: 데이터베이스 커넥션 (None이면 아무 작업도 하지 않음)
+        """
+        if connection is None:
+            return
+        cursor = self._cursor_cache.pop(connection, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                # 커서 닫기 실패 시 무시
+                pass
+
     def _get_valid_connection(self):
         """유효한 커넥션 획득 (재시도 로직 포함)
 
@@ -3782,7 +4543,7 @@ class LoadTestWorker:
             try:
                 conn = self.db_adapter.get_connection()
                 if conn and self._is_connection_valid(conn):
-                    self.current_backoff_ms = 100
+                    self.reset_backoff()
                     return conn
                 if conn:
                     self.db_adapter.discard_connection(conn)
@@ -3792,24 +4553,37 @@ class LoadTestWorker:
                 pass
 
             if retry < self.MAX_CONNECTION_RETRIES - 1:
-                time.sleep(self.current_backoff_ms / 1000.0)
-                self.current_backoff_ms = min(self.current_backoff_ms * 2, self.MAX_BACKOFF_MS)
+                self.sleep_backoff()
 
         return self.db_adapter.get_connection()
 
+    @property
+    def current_backoff_ms(self) -> int:
+        """다음 백오프 대기 시간 (밀리초, 로그 출력용)"""
+        return self.BACKOFF_STEPS_MS[self._backoff_step]
+
     def reset_backoff(self):
         """백오프 시간 초기화 (성공 시 호출)"""
-        self.current_backoff_ms = 100
+        self._backoff_step = 0
+
+    def sleep_backoff(self):
+        """현재 단계의 백오프 시간만큼 대기 후 다음 단계로 전진 (마지막 단계에서 고정)"""
+        step = self._backoff_step
+        time.sleep(self._BACKOFF_STEPS_SEC[step])
+        if step < len(self.BACKOFF_STEPS_MS) - 1:
+            self._backoff_step = step + 1
 
-    def log_error(self, operation: str, message: str):
+    def log_error(self, operation: str, message: Any):
         """에러 로그 기록 (중복 억제)
 
         동일한 에러가 반복될 때 로그 폭주를 방지하기 위해
         일정 간격으로만 경고 로그를 출력하고, 그 외에는 디버그 레벨로 기록합니다.
+        DB 장애 중 억제되는 에러가 대량으로 쌓여도 문자열 변환이 일어나지 않도록
+        메시지는 로거에 인자로 넘겨 실제 출력될 때만 포맷합니다.
 
         Args:
             operation: 수행 중이던 작업 이름
-            message: 에러 메시지
+            message: 에러 메시지 또는 예외 객체 (출력 시에만 문자열로 변환)
         """
         # if message and (
         #     'Connection is closed' in message or
@@ -3822,35 +4596,37 @@ class LoadTestWorker:
         #     logger.debug(f"[{self.thread_name}] {operation} (suppressed): {message}")
         #     return
 
-        now_ms = int(time.time() * 1000)
+        # 로그 간격 계산용 단조 시계 (ms, 시스템 시간 변경의 영향 없음)
+        now_ms = time.monotonic_ns() // NS_PER_MS
         if now_ms - self.last_error_log_time > self.ERROR_LOG_INTERVAL_MS:
             if self.suppressed_error_count > 0:
                 logger.warning(
-                    f"[{self.thread_name}] {operation} error (suppressed {self.suppressed_error_count} similar errors): {message}"
+                    "[%s] %s error (suppressed %d similar errors): %s",
+                    self.thread_name, operation, self.suppressed_error_count, message
                 )
             else:
-                logger.warning(f"[{self.thread_name}] {operation} error: {message}")
+                logger.warning("[%s] %s error: %s", self.thread_name, operation, message)
             self.last_error_log_time = now_ms
             self.suppressed_error_count = 0
         else:
             self.suppressed_error_count += 1
-            logger.debug(f"[{self.thread_name}] {operation} error: {message}")
+            logger.debug("[%s] %s error: %s", self.thread_name, operation, message)
 
-    def execute_insert(self, connection) -> bool:
+    def execute_insert(self, connection, max_id: int = 0) -> bool:
         """INSERT 작업 실행
 
         Args:
             connection: 데이터베이스 커넥션
+            max_id: 사용하지 않음 (모드별 작업 메서드 시그니처 통일용)
 
         Returns:
             성공 시 True, 실패 시 False
         """
-        cursor = None
-        # 작업 시작 시간 기록 (레이턴시 측정용)
-        start_time = time.time()
+        # 작업 시작 시간 기록 (레이턴시 측정용, 단조 증가 정수 ns 시계)
+        start_ns = time.perf_counter_ns()
         try:
-            # 커서 생성
-            cursor = connection.cursor()
+            # 커넥션별 캐시 커서 재사용 (커넥션당 최초 1회만 생성)
+            cursor = self._get_cursor(connection)
             # 워커 스레드 이름을 thread_id로 사용
             thread_id = self.thread_name
             # 테스트용 랜덤 데이터 생성 (500자)
@@ -3858,46 +4634,38 @@ class LoadTestWorker:
 
             # 배치 모드 여부에 따른 분기 처리
             if self.batch_size > 1:
-                # 배치 INSERT: 지정된 개수만큼 한 번에 삽입
-                count = self.db_adapter.execute_batch_insert(cursor, thread_id, self.batch_size)
-                # 배치 개수만큼 INSERT 카운터 증가
-                if perf_counter:
-                    perf_counter.increment_insert(count)
+                # 배치 INSERT: 지정된 개수만큼 삽입, commit_every건마다 커밋
+                count = self.db_adapter.execute_batch_insert_committed(
+                    cursor, connection, thread_id, self.batch_size, self.commit_every)
             else:
                 # 단일 INSERT: 1건 삽입
                 self.db_adapter.execute_insert(cursor, thread_id, random_data)
-                # INSERT 카운터 1 증가
-                if perf_counter:
-                    perf_counter.increment_insert()
-
-            # 트랜잭션 커밋 (데이터 영구 저장)
-            self.db_adapter.commit(connection)
+                # 트랜잭션 커밋 (데이터 영구 저장)
+                self.db_adapter.commit(connection)
+                count = 1
 
             # 레이턴시 계산 (밀리초 단위)
-            latency_ms = (time.time() - start_time) * 1000
-            # 트랜잭션 완료 기록 (TPS 및 레이턴시 통계용)
+            latency_ms = (time.perf_counter_ns() - start_ns) / NS_PER_MS
+            # 트랜잭션 완료 및 INSERT 건수 기록 (TPS 및 레이턴시 통계용, 락 1회)
             if perf_counter:
-                perf_counter.record_transaction(latency_ms)
+                perf_counter.record_transaction(latency_ms, inserts=count)
             # 워커별 트랜잭션 카운트 증가
             self.transaction_count += 1
             return True
         except Exception as e:
             # 에러 발생 시 로그 기록
-            self.log_error("Insert", str(e))
+            self.log_error("Insert", e)
             # 에러 카운터 증가
             if perf_counter:
+                # commit_every 단위로 이미 커밋된 행은 롤백되지 않으므로 INSERT 건수에 반영
+                if isinstance(e, BatchInsertError):
+                    perf_counter.increment_insert(e.committed)
                 perf_counter.increment_error()
             # 트랜잭션 롤백 (변경사항 취소)
             self.db_adapter.rollback(connection)
+            # 드라이버가 에러 후 커서를 무효화했을 수 있으므로 캐시 커서 폐기 (다음 작업에서 재생성)
+            self._drop_cursor(connection)
             return False
-        finally:
-            # 커서 정리 (리소스 해제)
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    # 커서 닫기 실패 시 무시
-                    pass
 
     def execute_select(self, connection, max_id: int) -> bool:
         """SELECT 작업 실행
@@ -3909,42 +4677,32 @@ class LoadTestWorker:
         Returns:
             성공 시 True, 실패 시 False
         """
-        cursor = None
-        # 작업 시작 시간 기록 (레이턴시 측정용)
-        start_time = time.time()
+        # 작업 시작 시간 기록 (레이턴시 측정용, 단조 증가 정수 ns 시계)
+        start_ns = time.perf_counter_ns()
         try:
-            # 커서 생성
-            cursor = connection.cursor()
+            # 커넥션별 캐시 커서 재사용 (커넥션당 최초 1회만 생성)
+            cursor = self._get_cursor(connection)
             # 1~max_id 범위에서 랜덤 ID로 조회 수행
             self.db_adapter.execute_random_select(cursor, max_id)
-            # SELECT 카운터 증가
-            if perf_counter:
-                perf_counter.increment_select()
 
             # 레이턴시 계산 (밀리초 단위)
-            latency_ms = (time.time() - start_time) * 1000
-            # 트랜잭션 완료 기록 (TPS 및 레이턴시 통계용)
+            latency_ms = (time.perf_counter_ns() - start_ns) / NS_PER_MS
+            # 트랜잭션 완료 및 SELECT 건수 기록 (TPS 및 레이턴시 통계용, 락 1회)
             if perf_counter:
-                perf_counter.record_transaction(latency_ms)
+                perf_counter.record_transaction(latency_ms, selects=1)
             # 워커별 트랜잭션 카운트 증가
             self.transaction_count += 1
             return True
         except Exception as e:
             # 에러 발생 시 로그 기록
-            self.log_error("Select", str(e))
+            self.log_error("Select", e)
             # 에러 카운터 증가
             if perf_counter:
                 perf_counter.increment_error()
             # SELECT는 읽기 전용이므로 롤백 불필요
+            # 드라이버가 에러 후 커서를 무효화했을 수 있으므로 캐시 커서 폐기 (다음 작업에서 재생성)
+            self._drop_cursor(connection)
             return False
-        finally:
-            # 커서 정리 (리소스 해제)
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    # 커서 닫기 실패 시 무시
-                    pass
 
     def execute_update(self, connection, max_id: int) -> bool:
         """UPDATE 작업 실행
@@ -3956,12 +4714,11 @@ class LoadTestWorker:
         Returns:
             성공 시 True, 실패 시 False
         """
-        cursor = None
-        # 작업 시작 시간 기록 (레이턴시 측정용)
-        start_time = time.time()
+        # 작업 시작 시간 기록 (레이턴시 측정용, 단조 증가 정수 ns 시계)
+        start_ns = time.perf_counter_ns()
         try:
-            # 커서 생성
-            cursor = connection.cursor()
+            # 커넥션별 캐시 커서 재사용 (커넥션당 최초 1회만 생성)
+            cursor = self._get_cursor(connection)
             # 1~max_id 범위에서 랜덤 ID 선택
             record_id = self.db_adapter.get_random_id(cursor, max_id)
             # 유효한 ID가 없으면 성공으로 처리 (데이터 없음)
@@ -3971,35 +4728,26 @@ class LoadTestWorker:
             self.db_adapter.execute_update(cursor, record_id)
             # 트랜잭션 커밋 (변경사항 영구 저장)
             self.db_adapter.commit(connection)
-            # UPDATE 카운터 증가
-            if perf_counter:
-                perf_counter.increment_update()
 
             # 레이턴시 계산 (밀리초 단위)
-            latency_ms = (time.time() - start_time) * 1000
-            # 트랜잭션 완료 기록 (TPS 및 레이턴시 통계용)
+            latency_ms = (time.perf_counter_ns() - start_ns) / NS_PER_MS
+            # 트랜잭션 완료 및 UPDATE 건수 기록 (TPS 및 레이턴시 통계용, 락 1회)
             if perf_counter:
-                perf_counter.record_transaction(latency_ms)
+                perf_counter.record_transaction(latency_ms, updates=1)
             # 워커별 트랜잭션 카운트 증가
             self.transaction_count += 1
             return True
         except Exception as e:
             # 에러 발생 시 로그 기록
-            self.log_error("Update", str(e))
+            self.log_error("Update", e)
             # 에러 카운터 증가
             if perf_counter:
                 perf_counter.increment_error()
             # 트랜잭션 롤백 (변경사항 취소)
             self.db_adapter.rollback(connection)
+            # 드라이버가 에러 후 커서를 무효화했을 수 있으므로 캐시 커서 폐기 (다음 작업에서 재생성)
+            self._drop_cursor(connection)
             return False
-        finally:
-            # 커서 정리 (리소스 해제)
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    # 커서 닫기 실패 시 무시
-                    pass
 
     def execute_delete(self, connection, max_id: int) -> bool:
         """DELETE 작업 실행
@@ -4011,12 +4759,11 @@ class LoadTestWorker:
         Returns:
             성공 시 True, 실패 시 False
         """
-        cursor = None
-        # 작업 시작 시간 기록 (레이턴시 측정용)
-        start_time = time.time()
+        # 작업 시작 시간 기록 (레이턴시 측정용, 단조 증가 정수 ns 시계)
+        start_ns = time.perf_counter_ns()
         try:
-            # 커서 생성
-            cursor = connection.cursor()
+            # 커넥션별 캐시 커서 재사용 (커넥션당 최초 1회만 생성)
+            cursor = self._get_cursor(connection)
             # 1~max_id 범위에서 랜덤 ID 선택
             record_id = self.db_adapter.get_random_id(cursor, max_id)
             # 유효한 ID가 없으면 성공으로 처리 (데이터 없음)
@@ -4026,35 +4773,26 @@ class LoadTestWorker:
             self.db_adapter.execute_delete(cursor, record_id)
             # 트랜잭션 커밋 (삭제 영구 반영)
             self.db_adapter.commit(connection)
-            # DELETE 카운터 증가
-            if perf_counter:
-                perf_counter.increment_delete()
 
             # 레이턴시 계산 (밀리초 단위)
-            latency_ms = (time.time() - start_time) * 1000
-            # 트랜잭션 완료 기록 (TPS 및 레이턴시 통계용)
+            latency_ms = (time.perf_counter_ns() - start_ns) / NS_PER_MS
+            # 트랜잭션 완료 및 DELETE 건수 기록 (TPS 및 레이턴시 통계용, 락 1회)
             if perf_counter:
-                perf_counter.record_transaction(latency_ms)
+                perf_counter.record_transaction(latency_ms, deletes=1)
             # 워커별 트랜잭션 카운트 증가
             self.transaction_count += 1
             return True
         except Exception as e:
             # 에러 발생 시 로그 기록
-            self.log_error("Delete", str(e))
+            self.log_error("Delete", e)
             # 에러 카운터 증가
             if perf_counter:
                 perf_counter.increment_error()
             # 트랜잭션 롤백 (삭제 취소)
             self.db_adapter.rollback(connection)
+            # 드라이버가 에러 후 커서를 무효화했을 수 있으므로 캐시 커서 폐기 (다음 작업에서 재생성)
+            self._drop_cursor(connection)
             return False
-        finally:
-            # 커서 정리 (리소스 해제)
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    # 커서 닫기 실패 시 무시
-                    pass
 
     def execute_mixed(self, connection, max_id: int) -> bool:
         """혼합 모드 작업 실행
@@ -4069,22 +4807,11 @@ class LoadTestWorker:
         Returns:
             성공 시 True, 실패 시 False
         """
-        # 0.0 ~ 1.0 사이의 랜덤 값 생성
-        rand = random.random()
-        # 60% 확률: INSERT 실행
-        if rand < 0.60:
-            return self.execute_insert(connection)
-        # 20% 확률: SELECT 실행 (누적 80%)
-        elif rand < 0.80:
-            return self.execute_select(connection, max_id)
-        # 15% 확률: UPDATE 실행 (누적 95%)
-        elif rand < 0.95:
-            return self.execute_update(connection, max_id)
-        # 5% 확률: DELETE 실행 (나머지)
-        else:
-            return self.execute_delete(connection, max_id)
+        # 0.0 ~ 1.0 사이의 랜덤 값이 속한 누적 분포 구간으로 작업 선택 (C 수준 이진 탐색 1회)
+        op = self._mix_ops[bisect.bisect_right(self.MIXED_CDF, self._random())]
+        return op(connection, max_id)
 
-    def execute_full(self, connection) -> bool:
+    def execute_full(self, connection, max_id: int = 0) -> bool:
         """전체 트랜잭션 실행
 
         INSERT -> COMMIT -> SELECT -> VERIFY -> UPDATE -> DELETE
@@ -4092,16 +4819,16 @@ class LoadTestWorker:
 
         Args:
             connection: 데이터베이스 커넥션
+            max_id: 사용하지 않음 (모드별 작업 메서드 시그니처 통일용)
 
         Returns:
             성공 시 True, 실패 시 False
         """
-        cursor = None
-        # 작업 시작 시간 기록 (전체 CRUD 사이클 레이턴시 측정용)
-        start_time = time.time()
+        # 작업 시작 시간 기록 (전체 CRUD 사이클 레이턴시 측정용, 단조 증가 정수 ns 시계)
+        start_ns = time.perf_counter_ns()
         try:
-            # 커서 생성
-            cursor = connection.cursor()
+            # 커넥션별 캐시 커서 재사용 (커넥션당 최초 1회만 생성)
+            cursor = self._get_cursor(connection)
             # 워커 스레드 이름을 thread_id로 사용
             thread_id = self.thread_name
             # 테스트용 랜덤 데이터 생성 (500자)
@@ -4145,7 +4872,7 @@ class LoadTestWorker:
             self.db_adapter.commit(connection)
 
             # 전체 CRUD 사이클 레이턴시 계산 (밀리초 단위)
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_ns) / NS_PER_MS
             # 트랜잭션 완료 기록 (TPS 및 레이턴시 통계용)
             if perf_counter:
                 perf_counter.record_transaction(latency_ms)
@@ -4154,21 +4881,15 @@ class LoadTestWorker:
             return True
         except Exception as e:
             # 에러 발생 시 로그 기록
-            self.log_error("Transaction", str(e))
+            self.log_error("Transaction", e)
             # 에러 카운터 증가
             if perf_counter:
                 perf_counter.increment_error()
             # 트랜잭션 롤백 (미완료 변경사항 취소)
             self.db_adapter.rollback(connection)
+            # 드라이버가 에러 후 커서를 무효화했을 수 있으므로 캐시 커서 폐기 (다음 작업에서 재생성)
+            self._drop_cursor(connection)
             return False
-        finally:
-            # 커서 정리 (리소스 해제)
-            if cursor:
-                try:
-                    cursor.close()
-                except:
-                    # 커서 닫기 실패 시 무시
-                    pass
 
     def run(self) -> int:
         """
@@ -4176,7 +4897,7 @@ class LoadTestWorker:
 
         개선사항:
         1. DB 재기동 시 자동 재연결 로직 강화
-        2. Exponential Backoff 적용 (100ms → 200ms → 400ms → 800ms → 5000ms)
+        2. Exponential Backoff 적용 (BACKOFF_STEPS_MS: 100ms → 200ms → ... → 3200ms → 5000ms)
         3. 연속 실패 시 백오프 적용으로 DB 과부하 방지
         4. 커넥션 유효성 검사로 손상된 커넥션 자동 교체
         5. 상세 로깅으로 문제 추적 용이
@@ -4189,29 +4910,55 @@ class LoadTestWorker:
         connection = None
         consecutive_errors = 0  # 연속 에러 카운트 (백오프 트리거용)
         max_id = self.max_id_cache
-
-        while datetime.now() < self.end_time:
+        # 루프에서 반복 참조하는 전역 객체/함수를 지역 변수로 고정 (LOAD_GLOBAL 감소)
+        # perf_counter/shutdown_handler는 워커 시작 전에 main()에서 설정됨
+        now_func = datetime.now
+        sleep = time.sleep
+        counter = perf_counter
+        shutdown = shutdown_handler
+        # 루프 내 반복 조회하는 인스턴스 속성/바운드 메서드도 지역 변수로 고정 (LOAD_ATTR 감소)
+        # 루프 중 값이 바뀌는 백오프 단계, transaction_count 등은 self를 통해 접근
+        adapter = self.db_adapter
+        discard_connection = adapter.discard_connection
+        release_connection = adapter.release_connection
+        get_max_id = adapter.get_max_id
+        peek_max_id = adapter.peek_max_id
+        get_pool_stats = adapter.get_pool_stats
+        rate_limiter = self.rate_limiter
+        end_time = self.end_time
+        thread_name = self.thread_name
+        op = self._op
+        needs_data = self._needs_data
+        is_connection_valid = self._is_connection_valid
+        get_valid_connection = self._get_valid_connection
+        get_cursor = self._get_cursor
+        drop_cursor = self._drop_cursor
+        validate_every = self.VALIDATE_EVERY_N_OPS
+        sleep_backoff = self.sleep_backoff
+
+        while now_func() < end_time:
             # 우아한 종료 요청 확인
-            if shutdown_handler and shutdown_handler.is_shutdown_requested():
+            if shutdown and shutdown.is_shutdown_requested():
                 break
 
             # TPS 속도 제한 (Rate Limiting)
-            if self.rate_limiter and not self.rate_limiter.acquire(timeout=0.5):
+            if rate_limiter and not rate_limiter.acquire(timeout=0.5):
                 continue
 
             try:
                 # 커넥션 없는 경우: 새 커넥션 획득 시도
                 if connection is None:
-                    now = time.time()
-                    if now - self.last_error_log_time > 5: # 5초마다 로그
+                    # last_error_log_time은 log_error와 같은 단조 시계 ms 단위
+                    now = time.monotonic_ns() // NS_PER_MS
+                    if now - self.last_error_log_time > 5000: # 5초마다 로그
                          logger.warning(
-                             f"[{self.thread_name}] Waiting for connection... "
-                             f"(Pool: {self.db_adapter.get_pool_stats().get('pool_total', '?')})"
+                             "[%s] Waiting for connection... (Pool: %s)",
+                             thread_name, get_pool_stats().get('pool_total', '?')
                          )
                          self.last_error_log_time = now
 
                     # 유효한 커넥션 획득 시도 (내부 재시도 로직 포함)
-                    connection = self._get_valid_connection()
+                    connection = get_valid_connection()
 
                     if connection is not None:
                         # 커넥션 획득 성공: 에러 카운터 및 백오프 리셋
@@ -4224,85 +4971,77 @@ class LoadTestWorker:
                             # 연속 2회 이상 실패 시 백오프 적용
                             # DB 재기동 등 일시적 연결 불가 시 과부하 방지
                             logger.warning(
-                                f"[{self.thread_name}] {consecutive_errors} consecutive failures. "
-                                f"Retrying after {self.current_backoff_ms}ms backoff..."
+                                "[%s] %d consecutive failures. Retrying after %dms backoff...",
+                                thread_name, consecutive_errors, self.current_backoff_ms
                             )
-                            time.sleep(self.current_backoff_ms / 1000.0)
-                            self.current_backoff_ms = min(self.current_backoff_ms * 2, self.MAX_BACKOFF_MS)
+                            sleep_backoff()
                         else:
                             # 첫 실패는 1초 대기 후 재시도
-                            time.sleep(1)
+                            sleep(1)
                         continue
-                else:
-                    # 커넥션이 있는 경우: 유효성 검사
-                    if not self._is_connection_valid(connection):
-                        # 손상된 커넥션: 폐기 및 새 커넥션 획득
-                        self.db_adapter.discard_connection(connection)
-                        connection = self._get_valid_connection()
-                        if perf_counter:
-                            perf_counter.increment_connection_recreate()
+                elif (consecutive_errors or self.transaction_count % validate_every == 0):
+                    # 커넥션이 있는 경우: 직전 작업 실패 시 또는 N 트랜잭션마다 유효성 검사
+                    if not is_connection_valid(connection):
+                        # 손상된 커넥션: 캐시 커서 정리 후 폐기 및 새 커넥션 획득
+                        drop_cursor(connection)
+                        discard_connection(connection)
+                        connection = get_valid_connection()
+                        if counter:
+                            counter.increment_connection_recreate()
+                        if connection is None:
+                            # 재획득 실패: 다음 반복의 커넥션 대기/백오프 경로에서 다시 시도
+                            continue
 
                 # SELECT/UPDATE/DELETE/MIXED 모드: 기존 데이터 필요
-                needs_data = self.mode in [WorkMode.SELECT_ONLY, WorkMode.UPDATE_ONLY,
-                                           WorkMode.DELETE_ONLY, WorkMode.MIXED]
-                if needs_data and (max_id == 0 or self.transaction_count % 100 == 0):
-                    if connection:
-                        cursor = connection.cursor()
-                        max_id = self.db_adapter.get_max_id(cursor)
-                        cursor.close()
+                if needs_data:
+                    # 어댑터 공유 캐시가 유효하면(MAX_ID_CACHE_TTL_SECONDS 이내) 커서 생성/조회 없이 사용
+                    # 비어 있거나 만료되었으면 get_max_id로 다시 조회 (동시에 한 워커만 DB에 조회)
+                    max_id = peek_max_id()
+                    if max_id == 0 and connection:
+                        max_id = get_max_id(get_cursor(connection))
                     if max_id == 0:
-                        time.sleep(1)
+                        sleep(1)
                         continue
 
-                # 모드별 DB 작업 실행
-                if self.mode == WorkMode.INSERT_ONLY:
-                    success = self.execute_insert(connection)
-                elif self.mode == WorkMode.SELECT_ONLY:
-                    success = self.execute_select(connection, max_id)
-                elif self.mode == WorkMode.UPDATE_ONLY:
-                    success = self.execute_update(connection, max_id)
-                elif self.mode == WorkMode.DELETE_ONLY:
-                    success = self.execute_delete(connection, max_id)
-                elif self.mode == WorkMode.MIXED:
-                    success = self.execute_mixed(connection, max_id)
-                else:
-                    success = self.execute_full(connection)
+                # 모드별 DB 작업 실행 (__init__에서 결정된 작업 메서드)
+                success = op(connection, max_id)
 
                 # 작업 실패 처리
                 if not success:
                     consecutive_errors += 1
                     if consecutive_errors >= 2:
                         # 연속 2회 이상 실패 시 커넥션 폐기 및 재시도
-                        self.db_adapter.discard_connection(connection)
+                        drop_cursor(connection)
+                        discard_connection(connection)
                         connection = None
-                        if perf_counter:
-                            perf_counter.increment_connection_recreate()
+                        if counter:
+                            counter.increment_connection_recreate()
                         logger.warning(
-                            f"[{self.thread_name}] Operation failed. "
-                            f"Retrying after {self.current_backoff_ms}ms backoff..."
+                            "[%s] Operation failed. Retrying after %dms backoff...",
+                            thread_name, self.current_backoff_ms
                         )
-                        time.sleep(self.current_backoff_ms / 1000.0)
-                        self.current_backoff_ms = min(self.current_backoff_ms * 2, self.MAX_BACKOFF_MS)
+                        sleep_backoff()
                 else:
                     consecutive_errors = 0
                     self.reset_backoff()
 
             except Exception as e:
-                self.log_error("Connection", str(e))
-                if perf_counter:
-                    perf_counter.increment_error()
+                self.log_error("Connection", e)
+                if counter:
+                    counter.increment_error()
                 if connection:
-                    self.db_adapter.discard_connection(connection)
+                    drop_cursor(connection)
+                    discard_connection(connection)
                     connection = None
-                    if perf_counter:
-                        perf_counter.increment_connection_recreate()
-                time.sleep(self.current_backoff_ms / 1000.0)
-                self.current_backoff_ms = min(self.current_backoff_ms * 2, self.MAX_BACKOFF_MS)
+                    if counter:
+                        counter.increment_connection_recreate()
+                sleep_backoff()
 
         if connection:
-            self.db_adapter.release_connection(connection)
+            drop_cursor(connection)
+            release_connection(connection)
 
-        logger.info(f"[{self.thread_name}] Completed. Transactions: {self.transaction_count}")
+        logger.info(f"[{thread_name}] Completed. Transactions: {self.transaction_count}")
         return self.transaction_count
 
 
@@ -4459,7 +5198,8 @@ class MultiDBLoadTester:
                       monitor_interval: float = 1.0, sub_second_interval_ms: int = 100,
                       warmup_seconds: int = 30, ramp_up_seconds: int = 0,
                       target_tps: int = 0, batch_size: int = 1,
-                      output_format: Optional[str] = None, output_file: Optional[str] = None):
+                      output_format: Optional[str] = None, output_file: Optional[str] = None,
+                      commit_every: int = 0, relaxed_commit: bool = False):
         """부하 테스트 실행"""
         global perf_counter, shutdown_handler
 
@@ -4471,6 +5211,9 @@ class MultiDBLoadTester:
         # 성능 카운터 초기화
         perf_counter = PerformanceCounter(sub_second_window_ms=sub_second_interval_ms)
 
+        # 커밋 방식 설정
+        self.db_adapter.relaxed_commit = relaxed_commit
+
         # 커넥션 풀 생성
         self.db_adapter.create_connection_pool(self.config)
 
@@ -4569,7 +5312,8 @@ class MultiDBLoadTester:
                     max_id_cache=max_id_cache,
                     batch_size=batch_size,
                     rate_limiter=rate_limiter,
-                    ramp_up_end_time=ramp_up_end_time
+                    ramp_up_end_time=ramp_up_end_time,
+                    commit_every=commit_every
                 )
                 future = executor.submit(worker.run)
                 futures.append(future)
@@ -4784,6 +5528,10 @@ Work Modes:
     parser.add_argument('--ramp-up', type=int, default=0, help='Ramp-up period in seconds')
     parser.add_argument('--target-tps', type=int, default=0, help='Target TPS (0 = unlimited)')
     parser.add_argument('--batch-size', type=int, default=1, help='Batch INSERT size')
+    parser.add_argument('--commit-every', type=int, default=0,
+                        help='Commit every N rows within a batch INSERT (0 = once per batch)')
+    parser.add_argument('--relaxed-commit', action='store_true',
+                        help='Use asynchronous commit where supported (Oracle: COMMIT WRITE BATCH NOWAIT)')
 
     # 모니터링
     parser.add_argument('--monitor-interval', type=float, default=1.0)
@@ -4857,6 +5605,16 @@ def main():
         tester.print_ddl()
         return
 
+    # 효과가 없는 옵션 조합은 경고 후 비활성화 (설정 출력에 잘못 표시되지 않도록)
+    # --relaxed-commit은 Oracle 어댑터만 지원 (COMMIT WRITE BATCH NOWAIT)
+    if args.relaxed_commit and args.db_type != 'oracle':
+        logger.warning(f"--relaxed-commit is only supported for Oracle; ignored for {args.db_type}")
+        args.relaxed_commit = False
+    # --commit-every는 배치 INSERT(--batch-size > 1) 내에서만 적용
+    if args.commit_every > 0 and args.batch_size <= 1:
+        logger.warning("--commit-every has no effect without --batch-size > 1; ignored")
+        args.commit_every = 0
+
     # 설정 출력
     logger.info("=" * 80)
     logger.info(f"MULTI-DATABASE LOAD TESTER v{VERSION} (JDBC)")
@@ -4869,6 +5627,10 @@ def main():
         logger.info(f"Target TPS: {args.target_tps}")
     if args.batch_size > 1:
         logger.info(f"Batch Size: {args.batch_size}")
+    if args.commit_every > 0:
+        logger.info(f"Commit Every: {args.commit_every} rows")
+    if args.relaxed_commit:
+        logger.info("Relaxed Commit: enabled")
     logger.info("=" * 80)
 
     try:
@@ -4885,7 +5647,9 @@ def main():
             target_tps=args.target_tps,
             batch_size=args.batch_size,
             output_format=args.output_format,
-            output_file=args.output_file
+            output_file=args.output_file,
+            commit_every=args.commit_every,
+            relaxed_commit=args.relaxed_commit
         )
     except KeyboardInterrupt:
         logger.info("Test interrupted by user")